@@ -15,18 +15,24 @@ __version__ = "0.1.0"
 __author__ = "TLSQL Team"
 
 
-def convert(tlsql: str):
+def convert(tlsql: str, cache=None, **options):
     """Convert TLSQL statement to standard SQL.
 
     This is the main entry point for TLSQL conversion.
 
     Args:
         tlsql: TLSQL statement string.
+        cache: Optional :class:`ConversionCache` shared across processes.
+        **options: Keyword arguments passed to :class:`SQLGenerator`,
+            e.g. ``schema`` and ``page_size`` for keyset pagination.
 
     Returns:
         ConversionResult: Unified result containing statement type and all metadata.
 
     """
+    if cache is not None:
+        return cache.get_or_convert(tlsql, **options)
+
     from tlsql.tlsql.parser import Parser
     from tlsql.tlsql.sql_generator import SQLGenerator
 
@@ -35,7 +41,7 @@ def convert(tlsql: str):
     ast = parser.parse()
 
     # Generate SQL with metadata
-    generator = SQLGenerator()
+    generator = SQLGenerator(**options)
     return generator.build(ast)
 
 
@@ -49,8 +55,12 @@ from tlsql.tlsql.sql_generator import (
     SQLGenerator,
     GeneratedSQL,
     ConversionResult,
+    KeysetPagination,
 )
 
+# Conversion cache
+from tlsql.tlsql.cache import ConversionCache
+
 # AST nodes (all AST components)
 from tlsql.tlsql.ast_nodes import (
     ASTNode,
@@ -61,6 +71,8 @@ from tlsql.tlsql.ast_nodes import (
     ValueClause,
     FromClause,
     WhereClause,
+    SampleClause,
+    LimitClause,
     ColumnSelector,
     WithClause,
     TablesClause,
@@ -94,6 +106,8 @@ __all__ = [
     "SQLGenerator",
     "GeneratedSQL",
     "ConversionResult",
+    "KeysetPagination",
+    "ConversionCache",
     # AST nodes
     "ASTNode",
     "Statement",
@@ -103,6 +117,8 @@ __all__ = [
     "ValueClause",
     "FromClause",
     "WhereClause",
+    "SampleClause",
+    "LimitClause",
     "ColumnSelector",
     "WithClause",
     "TablesClause",
@@ -1,8 +1,12 @@
 """Data Loading Utilities for TLSQL Statements"""
 
+import asyncio
+import functools
+
 import torch
 import tlsql
 from tlsql.examples.bridge.data_preparer import prepare_bridge_data
+from tlsql.examples.executor.async_executor import AsyncDatabaseExecutor
 from tlsql.examples.executor.db_executor import DatabaseExecutor, DatabaseConfig
 
 
@@ -11,10 +15,9 @@ def _load_data(executor, sqls):
     if not sqls or not sqls.sql_list:
         return {}
     data_dict = {}
-    for gen_sql in sqls.sql_list:
-        result = executor.execute(gen_sql.sql)
+    for table, result in executor.execute_conversion(sqls).items():
         if result.success:
-            data_dict[gen_sql.table] = result.data
+            data_dict[table] = result.data
     return data_dict
 
 
@@ -31,11 +34,11 @@ def prepare_data_from_tlsql(train_tlsql, validate_tlsql, predict_tlsql, db_confi
     Returns:
         tuple: (target_table, non_table_embeddings, adj, emb_size)
     """
-    predict_sqls = tlsql.convert(predict_tlsql)
-    train_sqls = tlsql.convert(train_tlsql)
-    validate_sqls = tlsql.convert(validate_tlsql)
-
     executor = DatabaseExecutor(DatabaseConfig(**db_config))
+    predict_sqls = tlsql.convert(predict_tlsql, dialect=executor.dialect)
+    train_sqls = tlsql.convert(train_tlsql, dialect=executor.dialect)
+    validate_sqls = tlsql.convert(validate_tlsql, dialect=executor.dialect)
+
     with executor:
         train_data = _load_data(executor, train_sqls)
         validate_data = _load_data(executor, validate_sqls)
@@ -46,4 +49,42 @@ def prepare_data_from_tlsql(train_tlsql, validate_tlsql, predict_tlsql, db_confi
         train_data, validate_data, test_df, predict_sqls.target_column, device
     )
 
-    return target_table, non_table_embeddings, adj, non_table_embeddings.size(1) 
+    return target_table, non_table_embeddings, adj, non_table_embeddings.size(1)
+
+
+async def _load_data_async(executor, sqls):
+    """Load data using SQL from convert result on an async executor."""
+    if not sqls or not sqls.sql_list:
+        return {}
+    results = await executor.execute_conversion(sqls)
+    return {table: result.data for table, result in results.items() if result.success}
+
+
+async def prepare_data_from_tlsql_async(train_tlsql, validate_tlsql, predict_tlsql, db_config, device):
+    """Async variant of :func:`prepare_data_from_tlsql`.
+
+    TRAIN, VALIDATE and PREDICT data are loaded concurrently on one event
+    loop; the CPU-bound graph preparation runs in the default thread pool so
+    the loop stays responsive.
+
+    Returns:
+        tuple: (target_table, non_table_embeddings, adj, emb_size)
+    """
+    async with AsyncDatabaseExecutor(DatabaseConfig(**db_config)) as executor:
+        predict_sqls = tlsql.convert(predict_tlsql, dialect=executor.dialect)
+        train_sqls = tlsql.convert(train_tlsql, dialect=executor.dialect)
+        validate_sqls = tlsql.convert(validate_tlsql, dialect=executor.dialect)
+
+        train_data, validate_data, test_data = await asyncio.gather(
+            _load_data_async(executor, train_sqls),
+            _load_data_async(executor, validate_sqls),
+            _load_data_async(executor, predict_sqls)
+        )
+
+    test_df = list(test_data.values())[0] if test_data else None
+    loop = asyncio.get_running_loop()
+    target_table, non_table_embeddings, adj = await loop.run_in_executor(None, functools.partial(
+        prepare_bridge_data, train_data, validate_data, test_df, predict_sqls.target_column, device
+    ))
+
+    return target_table, non_table_embeddings, adj, non_table_embeddings.size(1)
@@ -6,6 +6,7 @@ import torch
 import pandas as pd
 
 from tlsql.examples.bridge.model import build_homo_graph
+from tlsql.examples.bridge.remap import remap_relation, stack_splits
 from rllm.transforms.graph_transforms import GCNTransform
 from rllm.transforms.table_transforms import TabTransformerTransform
 from rllm.data import TableData
@@ -30,8 +31,7 @@ def prepare_bridge_data(
     test_df = test_data if test_data is not None else None
 
     all_dfs = [df for df in [train_df, validate_df, test_df] if df is not None]
-    common_cols = set.intersection(*[set(df.columns) for df in all_dfs])
-    target_df = pd.concat([df[list(common_cols)] for df in all_dfs], ignore_index=True).set_index(target_pkey)
+    target_df = stack_splits(all_dfs).set_index(target_pkey)
 
     col_types = {col: ColType.CATEGORICAL for col in target_df.columns}
     target_table = TableData(df=target_df, col_types=col_types, target_col=col_name, pkey=target_pkey)
@@ -61,17 +61,10 @@ def prepare_bridge_data(
     src_col = 'userID' if 'userID' in relation_df.columns else [col for col in relation_df.columns if 'user' in col.lower()][0]
     tgt_col = 'movieID' if 'movieID' in relation_df.columns else [col for col in relation_df.columns if 'movie' in col.lower()][0]
 
-    user_id_map = {uid: i + 1 for i, uid in enumerate(target_table.df.index.tolist())}
-    unique_movies = sorted(relation_df[tgt_col].unique())
-    movie_id_map = {mid: i + 1 for i, mid in enumerate(unique_movies)}
+    relation_df, n_movies = remap_relation(relation_df, target_table.df.index, src_col, tgt_col)
 
-    relation_df = relation_df.copy()
-    relation_df['UserID'] = relation_df[src_col].map(user_id_map)
-    relation_df['MovieID'] = relation_df[tgt_col].map(movie_id_map)
-    relation_df = relation_df[relation_df['UserID'].notna() & relation_df['MovieID'].notna()][['UserID', 'MovieID']]
-
-    movie_embeddings = torch.randn(len(unique_movies), emb_size)
-    graph = build_homo_graph(relation_df, n_all=len(target_table) + len(unique_movies))
+    movie_embeddings = torch.randn(n_movies, emb_size)
+    graph = build_homo_graph(relation_df, n_all=len(target_table) + n_movies)
 
     adj = GCNTransform()(graph).adj.to_sparse_coo()
     target_table = TabTransformerTransform(out_dim=emb_size, metadata=target_table.metadata)(data=target_table)
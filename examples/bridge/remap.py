@@ -0,0 +1,81 @@
+"""Vectorized ID remapping of relation tables and split stacking for the BRIDGE graph
+
+Kept free of torch and rllm so it can be used and tested on its own.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _key_array(values) -> np.ndarray:
+    """Key column or index as a NumPy array, numeric keys with nulls as float NaN"""
+    series = values if isinstance(values, pd.Series) else pd.Series(values, copy=False)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(series.cat.categories.dtype)
+    if pd.api.types.is_numeric_dtype(series.dtype) and series.hasnans:
+        return series.to_numpy(dtype='float64', na_value=np.nan)
+    return series.to_numpy()
+
+
+def map_positions(keys, values) -> np.ndarray:
+    """1-based position of each value in ``keys``, 0 where it is absent
+
+    Equivalent to mapping through ``{key: i + 1 for i, key in enumerate(keys)}``
+    (the last occurrence of a duplicate key wins), but done with one stable
+    argsort of the keys and a binary search per value.
+    """
+    keys = _key_array(keys)
+    values = _key_array(values)
+    if not len(keys):
+        return np.zeros(len(values), dtype=np.int64)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    # side='right' lands after the last of equal keys, which keeps their original order
+    positions = np.searchsorted(sorted_keys, values, side='right') - 1
+    clipped = positions.clip(0)
+    found = (positions >= 0) & (sorted_keys[clipped] == values)
+    return np.where(found, order[clipped] + 1, 0)
+
+
+def remap_relation(relation_df: pd.DataFrame, user_ids, src_col: str, tgt_col: str) -> Tuple[pd.DataFrame, int]:
+    """Map a user-movie relation onto 1-based user and movie node ids
+
+    Users are numbered by their position in ``user_ids``, movies by their rank
+    among the sorted distinct movie ids of the relation. Rows whose user or
+    movie has no id are dropped.
+
+    Returns:
+        (DataFrame of int64 UserID and MovieID columns, number of distinct movies)
+    """
+    user_index = map_positions(user_ids, relation_df[src_col])
+    movie_codes, movies = pd.factorize(relation_df[tgt_col], sort=True)
+    mask = (user_index > 0) & (movie_codes >= 0)
+    edges = pd.DataFrame({
+        'UserID': user_index[mask].astype(np.int64, copy=False),
+        'MovieID': movie_codes[mask].astype(np.int64) + 1,
+    })
+    return edges, len(movies)
+
+
+def stack_splits(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Stack the train/validate/test frames of a table on their common columns
+
+    Typed fetches decode strings into per-result categoricals; their
+    categories are unioned first, since ``pd.concat`` falls back to object
+    for categoricals whose categories differ.
+    """
+    columns = frames[0].columns
+    for df in frames[1:]:
+        columns = columns.intersection(df.columns, sort=False)
+    frames = [df if df.columns.equals(columns) else df[columns] for df in frames]
+    if len(frames) == 1:
+        return frames[0]
+
+    for column in columns:
+        if not all(isinstance(df[column].dtype, pd.CategoricalDtype) for df in frames):
+            continue
+        categories = pd.Index(np.concatenate([df[column].cat.categories for df in frames])).unique()
+        frames = [df.assign(**{column: df[column].cat.set_categories(categories)}) for df in frames]
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,91 @@
+"""Benchmark of the relation ID remapping in prepare_bridge_data.
+
+Compares the former dict-based remapping (Python dicts built over ``tolist()``
+and applied with ``Series.map``) with the vectorized ``remap_relation`` on a
+synthetic ratings table, and checks that both produce the same edges.
+
+Usage:
+    python -m tlsql.examples.bridge_remap_benchmark --ratings 10000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from tlsql.examples.bridge.remap import remap_relation
+
+
+def make_data(n_ratings, n_users, n_movies, seed=0):
+    """Generate a ratings table and the user ids of the target table
+
+    About 5% of the ratings reference users outside the target table, which
+    the remapping drops.
+
+    Returns:
+        tuple: (ratings DataFrame, user id Index)
+    """
+    rng = np.random.default_rng(seed)
+    ratings = pd.DataFrame({
+        'userID': rng.integers(1, int(n_users * 1.05) + 1, n_ratings, dtype=np.int64),
+        'movieID': rng.integers(1, n_movies + 1, n_ratings, dtype=np.int64),
+        'rating': rng.integers(1, 6, n_ratings, dtype=np.int8),
+    })
+    user_ids = pd.Index(rng.permutation(np.arange(1, n_users + 1, dtype=np.int64)), name='UserID')
+    return ratings, user_ids
+
+
+def remap_with_dicts(relation_df, user_ids, src_col, tgt_col):
+    """Former remapping of prepare_bridge_data"""
+    user_id_map = {uid: i + 1 for i, uid in enumerate(user_ids.tolist())}
+    unique_movies = sorted(relation_df[tgt_col].unique())
+    movie_id_map = {mid: i + 1 for i, mid in enumerate(unique_movies)}
+
+    relation_df = relation_df.copy()
+    relation_df['UserID'] = relation_df[src_col].map(user_id_map)
+    relation_df['MovieID'] = relation_df[tgt_col].map(movie_id_map)
+    relation_df = relation_df[relation_df['UserID'].notna() & relation_df['MovieID'].notna()][['UserID', 'MovieID']]
+    return relation_df, len(unique_movies)
+
+
+def timed(fn, *args, repeat=3):
+    """Return the result of the last call and the best wall time in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main():
+    """Run the benchmark"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ratings', type=int, default=10_000_000, help='Rows of the ratings table')
+    parser.add_argument('--users', type=int, default=1_000_000, help='Users in the target table')
+    parser.add_argument('--movies', type=int, default=50_000, help='Distinct movies')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per implementation, best is reported')
+    args = parser.parse_args()
+
+    ratings, user_ids = make_data(args.ratings, args.users, args.movies)
+    print(f"{len(ratings):,} ratings, {len(user_ids):,} users, {ratings['movieID'].nunique():,} movies")
+
+    (dict_edges, dict_movies), dict_time = timed(
+        remap_with_dicts, ratings, user_ids, 'userID', 'movieID', repeat=args.repeat
+    )
+    (edges, n_movies), vector_time = timed(
+        remap_relation, ratings, user_ids, 'userID', 'movieID', repeat=args.repeat
+    )
+
+    assert n_movies == dict_movies
+    assert np.array_equal(edges['UserID'].to_numpy(), dict_edges['UserID'].to_numpy())
+    assert np.array_equal(edges['MovieID'].to_numpy(), dict_edges['MovieID'].to_numpy())
+
+    print(f"dict + Series.map: {dict_time:.3f}s")
+    print(f"remap_relation:    {vector_time:.3f}s ({dict_time / vector_time:.1f}x)")
+    print(f"edges: {len(edges):,}, dtypes: {dict(edges.dtypes.astype(str))}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""Columnar fetch helpers building Arrow tables straight from DB-API rows"""
+
+import warnings
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# pymysql FIELD_TYPE codes grouped by the Arrow type they decode to
+_MYSQL_INT_TYPES = {1, 2, 3, 8, 9, 13}  # TINY, SHORT, LONG, LONGLONG, INT24, YEAR
+_MYSQL_FLOAT_TYPES = {4, 5}  # FLOAT, DOUBLE
+_MYSQL_STRING_TYPES = {15, 253, 254}  # VARCHAR, VAR_STRING, STRING
+
+
+def arrow_types_from_description(description: Optional[Sequence]) -> List:
+    """Map DB-API cursor description type codes to Arrow types
+
+    Drivers that do not report integer type codes (e.g. sqlite3) get None
+    entries, which fall back to Arrow type inference.
+
+    Args:
+        description: ``cursor.description`` of the executed query
+
+    Returns:
+        Arrow type or None per column
+    """
+    types = []
+    for column in description or []:
+        type_code = column[1]
+        if type_code in _MYSQL_INT_TYPES:
+            types.append(pa.int64())
+        elif type_code in _MYSQL_FLOAT_TYPES:
+            types.append(pa.float64())
+        elif type_code in _MYSQL_STRING_TYPES:
+            types.append(pa.string())
+        else:
+            types.append(None)
+    return types
+
+
+def rows_to_record_batch(rows: Sequence[Sequence], columns: List[str], types: Optional[List] = None):
+    """Transpose a block of rows into an Arrow RecordBatch
+
+    Args:
+        rows: Rows as returned by ``fetchmany``
+        columns: Column names
+        types: Arrow type per column, None entries are inferred
+
+    Returns:
+        pyarrow RecordBatch
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is not installed.")
+
+    types = types or [None] * len(columns)
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+    arrays = [pa.array(col_values, type=col_type) for col_values, col_type in zip(values, types)]
+    return pa.RecordBatch.from_arrays(arrays, names=columns)
+
+
+def concat_batches(batches: Iterable, columns: Optional[List[str]] = None):
+    """Concatenate record batches into a Table without copying their buffers
+
+    Batches whose inferred types differ (e.g. an all-NULL first batch) are
+    promoted to a common schema.
+
+    Args:
+        batches: pyarrow RecordBatches
+        columns: Column names for the empty table when there are no batches
+    """
+    tables = [pa.Table.from_batches([batch]) for batch in batches]
+    if not tables:
+        return pa.table({name: pa.array([], type=pa.null()) for name in columns or []})
+    return concat_tables(tables)
+
+
+def concat_tables(tables: List):
+    """Concatenate tables chunk-wise without copying, promoting differing types"""
+    try:
+        return pa.concat_tables(tables, promote_options='default')
+    except TypeError:
+        # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def arrow_to_pandas(table) -> pd.DataFrame:
+    """Convert an Arrow table to pandas with Arrow-backed dtypes"""
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def column_to_numpy(table, column: str) -> np.ndarray:
+    """Expose one Arrow column as a NumPy array, zero-copy when possible
+
+    Numeric columns without nulls in a single chunk share the Arrow buffer.
+    String and dictionary columns are returned as integer category codes.
+
+    Args:
+        table: pyarrow Table
+        column: Column name
+
+    Returns:
+        NumPy array (read-only when zero-copy)
+    """
+    chunked = table.column(column)
+    column_type = chunked.type
+    if pa.types.is_dictionary(column_type):
+        # Chunks may carry different dictionaries, decode before re-encoding once
+        chunked = chunked.cast(column_type.value_type)
+        column_type = chunked.type
+    if pa.types.is_string(column_type) or pa.types.is_large_string(column_type):
+        return chunked.combine_chunks().dictionary_encode().indices.to_numpy(zero_copy_only=False)
+
+    is_numeric = pa.types.is_integer(column_type) or pa.types.is_floating(column_type)
+    if is_numeric and chunked.num_chunks == 1 and chunked.null_count == 0:
+        return chunked.chunk(0).to_numpy(zero_copy_only=True)
+    return chunked.to_numpy()
+
+
+def column_to_tensor(table, column: str):
+    """Expose one Arrow column as a torch tensor sharing the NumPy buffer
+
+    Zero-copy arrays are read-only, so the returned tensor must not be
+    modified in place.
+    """
+    import torch
+
+    array = column_to_numpy(table, column)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        return torch.from_numpy(array)
@@ -0,0 +1,265 @@
+"""Asyncio database executor on SQLAlchemy's async engine"""
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+import pandas as pd
+
+from tlsql.examples.executor.backends import Backend, get_backend
+from tlsql.examples.executor.db_executor import (
+    INITIAL_STREAM_ROWS,
+    DatabaseConfig,
+    ExecutionResult,
+    QueryTimings,
+)
+from tlsql.examples.executor.typed_fetch import approx_memory_bytes
+
+try:
+    from sqlalchemy import event, text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    SQLALCHEMY_ASYNC_AVAILABLE = True
+except ImportError:
+    SQLALCHEMY_ASYNC_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabaseExecutor:
+    """Database executor for asyncio applications
+
+    Queries run on an async engine (``aiomysql`` for MySQL, ``aiosqlite`` for
+    SQLite), so awaiting a query yields the event loop instead of blocking a
+    thread. Concurrent queries are bounded by ``DatabaseConfig.max_concurrency``
+    and results use the same ExecutionResult type as DatabaseExecutor.
+
+    Example:
+        async with AsyncDatabaseExecutor(config) as executor:
+            users, ratings = await asyncio.gather(
+                executor.execute("SELECT * FROM users"),
+                executor.execute("SELECT * FROM ratings")
+            )
+    """
+
+    def __init__(self, config: DatabaseConfig):
+        """Initialize executor
+
+        Args:
+            config: DatabaseConfig object
+
+        Raises:
+            ImportError: Missing driver
+            NotImplementedError: Database type without an asyncio driver
+        """
+        if not SQLALCHEMY_ASYNC_AVAILABLE:
+            raise ImportError("SQLAlchemy asyncio support is not installed.")
+        self.config = config
+        self.backend: Backend = get_backend(config)
+        self.backend.validate_async_dependencies()
+        self.engine = None
+        self._semaphore = None
+        logger.info(f"AsyncDatabaseExecutor initialized for {config.db_type}")
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """Async context manager exit"""
+        await self.disconnect()
+        return False
+
+    @property
+    def dialect(self) -> str:
+        """SQL dialect to pass to ``tlsql.convert`` for this database"""
+        return self.backend.dialect
+
+    async def connect(self) -> None:
+        """Create the async engine and its connection pool"""
+        if self.engine is not None:
+            return
+        engine_kwargs = self.backend.engine_kwargs()
+        engine_kwargs.pop('warmup', None)
+        self.engine = create_async_engine(self.backend.async_url(), **engine_kwargs)
+        event.listen(self.engine.sync_engine, 'connect', self.backend.on_connect)
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        logger.info(f"Connected to {self.config.db_type} database: {self.config.database}")
+
+    async def disconnect(self) -> None:
+        """Close all pooled connections"""
+        if self.engine is not None:
+            await self.engine.dispose()
+            self.engine = None
+            logger.info("Database connection closed")
+
+    def _statement(self, sql, params: Optional[dict], timeout: Optional[float]):
+        """Build the executable statement, embedding server-side limits
+
+        Without parameters the colons of a string are escaped, so ':word'
+        inside a string literal is not taken for a bind parameter.
+        """
+        if timeout is not None:
+            sql = self.backend.limit_sql(sql, timeout)
+        if not isinstance(sql, str):
+            return sql
+        return text(sql) if params else text(sql.replace(':', '\\:'))
+
+    async def _fetch(self, sql, params: Optional[dict], timeout: Optional[float], timings: QueryTimings):
+        """Run a query and read all rows, recording phase timings"""
+        async with self._semaphore:
+            wait_start = time.perf_counter_ns()
+            async with self.engine.connect() as conn:
+                query_start = time.perf_counter_ns()
+                timings.pool_wait_ns = query_start - wait_start
+                driver_conn = (await conn.get_raw_connection()).driver_connection
+                query = asyncio.ensure_future(self._read(conn, sql, params, timeout, timings, query_start))
+                try:
+                    return await asyncio.shield(query)
+                except asyncio.CancelledError:
+                    # Deadline or fail_fast cancellation; the connection is only
+                    # released once the statement has stopped
+                    await self.backend.cancel_async(driver_conn, query)
+                    await asyncio.gather(query, return_exceptions=True)
+                    raise
+
+    async def _read(self, conn, sql, params: Optional[dict], timeout: Optional[float],
+                    timings: QueryTimings, query_start: int):
+        """Execute a statement on a connection and read all rows"""
+        result = await conn.execute(self._statement(sql, params, timeout), params or {})
+        if not result.returns_rows:
+            timings.first_row_ns = time.perf_counter_ns() - query_start
+            return [], []
+        columns = list(result.keys())
+        fetch_start = time.perf_counter_ns()
+        timings.first_row_ns = fetch_start - query_start
+        rows = result.fetchall()
+        timings.fetch_ns = time.perf_counter_ns() - fetch_start
+        return columns, rows
+
+    async def execute(self, sql, params: Optional[dict] = None,
+                      timeout: Optional[float] = None) -> ExecutionResult:
+        """Execute a single SQL query and return DataFrame
+
+        Args:
+            sql: SQL string or SQLAlchemy text clause
+            params: Dict bound to ``:name`` placeholders
+            timeout: Deadline in seconds, defaults to ``DatabaseConfig.query_timeout``;
+                on expiry the query task is cancelled and the statement stopped
+                (see :meth:`Backend.cancel_async`)
+        """
+        await self.connect()
+        timeout = self.config.query_timeout if timeout is None else timeout
+        start_ns = time.perf_counter_ns()
+        timings = QueryTimings()
+
+        try:
+            logger.info(f"Executing SQL: {str(sql)[:100]}...")
+            fetch = self._fetch(sql, params, timeout, timings)
+            if timeout is not None:
+                columns, rows = await asyncio.wait_for(fetch, timeout)
+            else:
+                columns, rows = await fetch
+
+            decode_start = time.perf_counter_ns()
+            df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+            end_ns = time.perf_counter_ns()
+            timings.decode_ns = end_ns - decode_start
+            timings.total_ns = end_ns - start_ns
+            logger.info(f"Query executed successfully. Rows: {len(df)}, Time: {timings.total_ns / 1e9:.3f}s")
+
+            return ExecutionResult(
+                success=True,
+                data=df,
+                row_count=len(df),
+                execution_time=timings.total_ns / 1e9,
+                sql=str(sql),
+                memory_bytes=approx_memory_bytes(df),
+                timings=timings
+            )
+
+        except Exception as e:
+            timings.total_ns = time.perf_counter_ns() - start_ns
+            timed_out = isinstance(e, asyncio.TimeoutError) or self.backend.is_timeout(e)
+            error_msg = f"Query exceeded its {timeout:.3f}s deadline" if timed_out else str(e)
+            logger.error(f"Query failed: {error_msg}")
+
+            return ExecutionResult(
+                success=False,
+                error=error_msg,
+                execution_time=timings.total_ns / 1e9,
+                sql=str(sql),
+                timings=timings,
+                timed_out=timed_out
+            )
+
+    async def execute_stream(self, sql, params: Optional[dict] = None,
+                             chunk_rows: int = INITIAL_STREAM_ROWS) -> AsyncIterator[pd.DataFrame]:
+        """Execute a query and yield the result in DataFrame chunks from a server-side cursor
+
+        Args:
+            sql: SQL string or SQLAlchemy text clause
+            params: Dict bound to ``:name`` placeholders
+            chunk_rows: Rows per chunk
+
+        Yields:
+            DataFrame chunks
+        """
+        await self.connect()
+        logger.info(f"Streaming SQL: {str(sql)[:100]}...")
+        async with self._semaphore:
+            async with self.engine.connect() as conn:
+                result = await conn.stream(self._statement(sql, params, None), params or {})
+                columns = list(result.keys())
+                async for rows in result.partitions(chunk_rows):
+                    yield pd.DataFrame.from_records(rows, columns=columns)
+
+    async def execute_batch(self, sql_list: List, error_policy: str = 'collect',
+                            timeout: Optional[float] = None) -> List[ExecutionResult]:
+        """Execute multiple SQL statements concurrently on the event loop
+
+        Args:
+            sql_list: SQL strings or GeneratedSQL objects
+            error_policy: 'collect' runs every query and returns all errors;
+                'fail_fast' cancels outstanding queries after the first failure
+            timeout: Deadline per query in seconds
+
+        Returns:
+            ExecutionResult list in input order
+        """
+        if error_policy not in ('collect', 'fail_fast'):
+            raise ValueError(f"Unknown error policy: {error_policy}")
+        sqls = [getattr(item, 'sql', item) for item in sql_list]
+        if error_policy == 'collect':
+            return list(await asyncio.gather(*(self.execute(sql, timeout=timeout) for sql in sqls)))
+
+        tasks = [asyncio.ensure_future(self.execute(sql, timeout=timeout)) for sql in sqls]
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(not task.result().success for task in done):
+                logger.warning("Batch query failed, cancelling outstanding queries")
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                break
+
+        return [
+            ExecutionResult(success=False, error="Cancelled", sql=str(sql), cancelled=True)
+            if task.cancelled() else task.result()
+            for sql, task in zip(sqls, tasks)
+        ]
+
+    async def execute_conversion(self, conversion) -> Dict[str, ExecutionResult]:
+        """Execute the per-table queries of a ConversionResult concurrently
+
+        Args:
+            conversion: ConversionResult from ``tlsql.convert``
+
+        Returns:
+            Dict mapping table name to ExecutionResult
+        """
+        results = await self.execute_batch(conversion.sql_list)
+        return {gen_sql.table: result for gen_sql, result in zip(conversion.sql_list, results)}
@@ -0,0 +1,749 @@
+"""Database backends holding the dialect-specific parts of DatabaseExecutor"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from tlsql.examples.executor.result_cache import file_fingerprint
+
+try:
+    import pymysql  # noqa: F401
+    MYSQL_AVAILABLE = True
+except ImportError:
+    MYSQL_AVAILABLE = False
+
+try:
+    import aiomysql  # noqa: F401
+    AIOMYSQL_AVAILABLE = True
+except ImportError:
+    AIOMYSQL_AVAILABLE = False
+
+try:
+    import aiosqlite  # noqa: F401
+    AIOSQLITE_AVAILABLE = True
+except ImportError:
+    AIOSQLITE_AVAILABLE = False
+
+try:
+    import duckdb  # noqa: F401
+    import duckdb_engine  # noqa: F401
+    DUCKDB_AVAILABLE = True
+except ImportError:
+    DUCKDB_AVAILABLE = False
+
+try:
+    from sqlalchemy import bindparam, text
+    SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    SQLALCHEMY_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+# Statements that accept a MySQL optimizer hint right after SELECT
+_SELECT_PATTERN = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
+
+
+def _error_code(exc: Exception):
+    """Return the driver error code of an exception, unwrapping SQLAlchemy errors"""
+    args = getattr(getattr(exc, 'orig', exc), 'args', ())
+    return args[0] if args else None
+
+
+def _crc32(value) -> Optional[int]:
+    """CRC32 of a value's text, as MySQL computes it; SQLite hashes sampling keys with it"""
+    if value is None:
+        return None
+    data = value if isinstance(value, bytes) else str(value).encode('utf-8')
+    return zlib.crc32(data)
+
+
+# Estimate tuple: (estimated rows, estimated bytes, full scan, index hint)
+Estimate = Tuple[Optional[int], Optional[int], Optional[bool], Optional[str]]
+
+
+def empty_schema() -> Dict:
+    """Schema entry of a table without metadata"""
+    return {'columns': [], 'types': {}, 'primary_keys': [], 'foreign_keys': {}}
+
+
+def _metadata(result, kind: str) -> pd.DataFrame:
+    """Return the frame of a metadata query, raising on failure"""
+    if not result.success:
+        raise Exception(f"Failed to get {kind}: {result.error}")
+    return result.data
+
+
+def _assemble_schema(tables: List[str], columns: pd.DataFrame, primary_keys: pd.DataFrame,
+                     foreign_keys: pd.DataFrame) -> Dict[str, Dict]:
+    """Group bulk metadata frames into one schema entry per table
+
+    Args:
+        tables: Requested tables; tables without metadata get empty entries
+        columns: table_name, column_name, data_type rows in column order
+        primary_keys: table_name, column_name rows in key order
+        foreign_keys: table_name, column_name, referenced_table, referenced_column rows
+    """
+    schema = {table: empty_schema() for table in tables}
+    for table, group in columns.groupby('table_name', sort=False):
+        if table in schema:
+            schema[table]['columns'] = group['column_name'].tolist()
+            schema[table]['types'] = dict(zip(group['column_name'], group['data_type'].str.lower()))
+    for table, group in primary_keys.groupby('table_name', sort=False):
+        if table in schema:
+            schema[table]['primary_keys'] = group['column_name'].tolist()
+    for table, group in foreign_keys.groupby('table_name', sort=False):
+        if table in schema:
+            schema[table]['foreign_keys'] = dict(zip(
+                group['column_name'], zip(group['referenced_table'], group['referenced_column'])
+            ))
+    return schema
+
+
+class Backend:
+    """Dialect-specific SQL and connection handling for one database type
+
+    Subclasses provide the connection URL, metadata queries, EXPLAIN parsing
+    and query cancellation. Metadata methods run their queries through the
+    executor, so every backend returns the same ExecutionResult contract.
+    """
+
+    name = None  # DatabaseConfig.db_type
+    dialect = None  # tlsql SQLGenerator dialect
+
+    def __init__(self, config):
+        self.config = config
+
+    def validate_dependencies(self) -> None:
+        """Raise ImportError when a required driver is missing"""
+        if not SQLALCHEMY_AVAILABLE:
+            raise ImportError("SQLAlchemy is not installed.")
+
+    def url(self) -> str:
+        """Return the SQLAlchemy connection URL"""
+        raise NotImplementedError
+
+    def async_url(self) -> str:
+        """Return the SQLAlchemy connection URL of the asyncio driver"""
+        raise NotImplementedError(f"No asyncio driver is supported for {self.name}")
+
+    def validate_async_dependencies(self) -> None:
+        """Raise ImportError when the asyncio driver is missing"""
+        raise NotImplementedError(f"No asyncio driver is supported for {self.name}")
+
+    def engine_kwargs(self) -> dict:
+        """Return pool arguments for ``EngineRegistry.get_engine``"""
+        if self.config.database in ('', ':memory:'):
+            # In-memory databases use a per-thread pool without size settings
+            return {'pool_pre_ping': self.config.pool_pre_ping, 'warmup': self.config.pool_warmup}
+        return {
+            'pool_size': self.config.pool_size,
+            'max_overflow': self.config.max_overflow,
+            'pool_pre_ping': self.config.pool_pre_ping,
+            'pool_recycle': self.config.pool_recycle,
+            'pool_timeout': self.config.pool_timeout,
+            'warmup': self.config.pool_warmup,
+        }
+
+    def on_connect(self, dbapi_conn, connection_record) -> None:
+        """Prepare each new DB-API connection, e.g. register external files"""
+        pass
+
+    def table_info_sql(self, table_name: str) -> str:
+        """Return SQL describing the columns of a table"""
+        raise NotImplementedError
+
+    def list_tables_sql(self) -> str:
+        """Return SQL listing all tables"""
+        raise NotImplementedError
+
+    def schema(self, executor, tables: List[str]) -> Dict[str, Dict]:
+        """Read columns, types, primary and foreign keys of several tables
+
+        Each metadata kind is fetched with one parameterized query covering
+        every requested table.
+
+        Returns:
+            Table name -> {'columns', 'types', 'primary_keys', 'foreign_keys'}
+        """
+        raise NotImplementedError
+
+    def estimate(self, executor, sql_list: List) -> List[Estimate]:
+        """Return approximate EXPLAIN-based estimates for GeneratedSQL objects"""
+        return [(None, None, None, None) for _ in sql_list]
+
+    def table_fingerprints(self, executor, tables: List[str]) -> Dict[str, str]:
+        """Return a value per table that changes whenever the table's data changes
+
+        Used to key the result cache; a table missing from the returned dict
+        makes results reading it uncacheable.
+        """
+        return {}
+
+    def replica_lag(self, executor) -> Optional[float]:
+        """Seconds a replica is behind its source, None when the database does not replicate"""
+        return None
+
+    def limit_sql(self, sql, timeout: float):
+        """Return the statement with a server-side execution limit embedded, if supported"""
+        return sql
+
+    def multi_statement_connect_args(self) -> Optional[dict]:
+        """DB-API connect arguments enabling multi-statement requests, None if unsupported
+
+        Embedded databases have no network round trip to save, so their
+        statements simply run one after another on one connection.
+        """
+        return None
+
+    @contextmanager
+    def server_timeout(self, dbapi_conn, timeout: float):
+        """Limit statements on a DB-API connection to ``timeout`` seconds while active"""
+        yield
+
+    def is_timeout(self, exc: Exception) -> bool:
+        """Whether an error was raised by a server-side execution limit"""
+        return False
+
+    def is_transient(self, exc: Exception) -> bool:
+        """Whether an error is a connection failure worth retrying"""
+        return bool(getattr(exc, 'connection_invalidated', False))
+
+    def cancel(self, executor, dbapi_conn) -> None:
+        """Cancel the query running on a DB-API connection"""
+        raise NotImplementedError(f"Query cancellation is not supported for {self.name}")
+
+    async def cancel_async(self, driver_conn, query) -> None:
+        """Stop the statement task ``query`` running on an asyncio driver connection
+
+        By default the task is cancelled, which closes its connection; the
+        server-side limit from :meth:`limit_sql` ends the statement.
+        """
+        query.cancel()
+
+
+class MySQLBackend(Backend):
+    """MySQL through pymysql"""
+
+    name = 'mysql'
+    dialect = 'mysql'
+
+    # Seconds two readings of the server start time may differ by (Uptime has second resolution)
+    SERVER_START_TOLERANCE = 2.0
+
+    def __init__(self, config):
+        super().__init__(config)
+        self._checksums: Dict[str, Tuple[float, str]] = {}  # Table -> (server start time, fingerprint)
+
+    def validate_dependencies(self) -> None:
+        if not MYSQL_AVAILABLE:
+            raise ImportError("pymysql is not installed.")
+        super().validate_dependencies()
+
+    def url(self) -> str:
+        return (
+            f"mysql+pymysql://{self.config.username}:{self.config.password}"
+            f"@{self.config.host}:{self.config.port or 3306}/{self.config.database}"
+            f"?charset={self.config.charset}"
+        )
+
+    def async_url(self) -> str:
+        return self.url().replace('mysql+pymysql://', 'mysql+aiomysql://', 1)
+
+    def validate_async_dependencies(self) -> None:
+        if not AIOMYSQL_AVAILABLE:
+            raise ImportError("aiomysql is not installed.")
+        super().validate_dependencies()
+
+    def table_info_sql(self, table_name: str) -> str:
+        return f"DESCRIBE {table_name}"
+
+    def list_tables_sql(self) -> str:
+        return "SHOW TABLES"
+
+    def schema(self, executor, tables: List[str]) -> Dict[str, Dict]:
+        params = {'database': self.config.database, 'tables': list(tables)}
+        columns = executor.execute(text(
+            "SELECT table_name AS table_name, column_name AS column_name, data_type AS data_type "
+            "FROM information_schema.columns "
+            "WHERE table_schema = :database AND table_name IN :tables "
+            "ORDER BY table_name, ordinal_position"
+        ).bindparams(bindparam('tables', expanding=True)), params=params, use_cache=False)
+        keys = executor.execute(text(
+            "SELECT table_name AS table_name, column_name AS column_name, "
+            "constraint_name AS constraint_name, referenced_table_name AS referenced_table, "
+            "referenced_column_name AS referenced_column "
+            "FROM information_schema.key_column_usage "
+            "WHERE table_schema = :database AND table_name IN :tables "
+            "ORDER BY table_name, ordinal_position"
+        ).bindparams(bindparam('tables', expanding=True)), params=params, use_cache=False)
+
+        key_df = _metadata(keys, "table keys")
+        return _assemble_schema(
+            tables,
+            _metadata(columns, "table columns"),
+            key_df[key_df['constraint_name'] == 'PRIMARY'],
+            key_df[key_df['referenced_table'].notna()]
+        )
+
+    def estimate(self, executor, sql_list: List) -> List[Estimate]:
+        tables = sorted({gen_sql.table for gen_sql in sql_list})
+        row_lengths = {}
+        if tables:
+            sql = text(
+                "SELECT table_name AS table_name, avg_row_length AS avg_row_length "
+                "FROM information_schema.tables "
+                "WHERE table_schema = :database AND table_name IN :tables"
+            ).bindparams(bindparam('tables', expanding=True))
+            result = executor.execute(sql, params={'database': self.config.database, 'tables': tables})
+            if result.success:
+                row_lengths = dict(zip(result.data['table_name'], result.data['avg_row_length']))
+
+        estimates = []
+        for gen_sql in sql_list:
+            result = executor.execute(f"EXPLAIN {gen_sql.sql}")
+            if not result.success:
+                logger.warning(f"Failed to estimate {gen_sql.table}: {result.error}")
+                estimates.append((None, None, None, None))
+                continue
+
+            plan = result.data
+            rows = int((plan['rows'].fillna(0) * plan['filtered'].fillna(100) / 100).max())
+            full_scan = bool((plan['type'] == 'ALL').any())
+            possible_keys = plan['possible_keys'].dropna().tolist()
+            if possible_keys:
+                hint = f"possible keys {', '.join(possible_keys)} were not used"
+            else:
+                hint = "consider an index on the filtered columns"
+            estimates.append((rows, int(rows * (row_lengths.get(gen_sql.table) or 0)), full_scan, hint))
+        return estimates
+
+    def table_fingerprints(self, executor, tables: List[str]) -> Dict[str, str]:
+        """``update_time`` per table, with CHECKSUM TABLE where update_time is unset
+
+        InnoDB keeps ``update_time`` in memory only, so it is NULL after a
+        restart until the table is next written. Those tables fall back to a
+        checksum, computed once per server start, or get no fingerprint (and
+        are not cached) when ``DatabaseConfig.checksum_fingerprints`` is off.
+        MySQL 8 serves ``information_schema.tables`` from a statistics cache
+        that can be a day old, so the cache is turned off while reading and
+        the pooled connection's setting is restored afterwards.
+        """
+        if not tables:
+            return {}
+        sql = text(
+            "SELECT table_name AS table_name, update_time AS update_time "
+            "FROM information_schema.tables "
+            "WHERE table_schema = :database AND table_name IN :tables"
+        ).bindparams(bindparam('tables', expanding=True))
+        try:
+            with executor._connection() as conn:
+                expiry = None
+                try:
+                    expiry = conn.exec_driver_sql("SELECT @@SESSION.information_schema_stats_expiry").scalar()
+                    conn.exec_driver_sql("SET SESSION information_schema_stats_expiry = 0")
+                except Exception as e:
+                    # Before MySQL 8 the statistics are always read live
+                    logger.debug(f"information_schema_stats_expiry not set: {e}")
+                try:
+                    rows = conn.execute(sql, {'database': self.config.database, 'tables': tables}).fetchall()
+                    uptime = conn.exec_driver_sql("SHOW GLOBAL STATUS LIKE 'Uptime'").fetchone()
+                finally:
+                    if expiry is not None:
+                        try:
+                            conn.exec_driver_sql(f"SET SESSION information_schema_stats_expiry = {int(expiry)}")
+                        except Exception:
+                            # Don't return a connection with a changed session to the pool
+                            conn.invalidate()
+                            raise
+        except Exception as e:
+            logger.warning(f"Failed to fingerprint tables: {e}")
+            return {}
+
+        fingerprints = {}
+        unstamped = []
+        for table_name, update_time in rows:
+            if update_time is None:
+                unstamped.append(table_name)
+            else:
+                fingerprints[table_name] = str(update_time)
+        if not unstamped or not self.config.checksum_fingerprints:
+            return fingerprints
+
+        # A table without update_time is unchanged since the server started
+        started = time.time() - float(uptime[1]) if uptime else None
+        for table_name in unstamped:
+            cached = self._checksums.get(table_name)
+            if started is not None and cached and abs(cached[0] - started) <= self.SERVER_START_TOLERANCE:
+                fingerprints[table_name] = cached[1]
+        unstamped = [table_name for table_name in unstamped if table_name not in fingerprints]
+
+        if unstamped:
+            checksums = executor.execute(f"CHECKSUM TABLE {', '.join(unstamped)}")
+            if checksums.success:
+                for table_name, checksum in zip(checksums.data.iloc[:, 0], checksums.data.iloc[:, 1]):
+                    if not pd.isna(checksum):
+                        table_name = table_name.split('.')[-1]
+                        fingerprints[table_name] = f"checksum:{checksum}"
+                        if started is not None:
+                            self._checksums[table_name] = (started, fingerprints[table_name])
+        return fingerprints
+
+    def replica_lag(self, executor) -> Optional[float]:
+        """``Seconds_Behind_Source`` from SHOW REPLICA STATUS, infinite while replication is stopped"""
+        for statement, column in (('SHOW REPLICA STATUS', 'Seconds_Behind_Source'),
+                                  ('SHOW SLAVE STATUS', 'Seconds_Behind_Master')):
+            result = executor.execute(statement, use_cache=False)
+            if result.success:
+                break
+        status = _metadata(result, 'replica status')
+        if status.empty:
+            return None
+        lag = status[column].iloc[0]
+        return float('inf') if pd.isna(lag) else float(lag)
+
+    # Server errors: statement time exceeded
+    TIMEOUT_ERRORS = {3024}
+
+    # Client and server errors: can't connect, server gone, lost connection, lock wait, deadlock
+    TRANSIENT_ERRORS = {2003, 2006, 2013, 1205, 1213}
+
+    def limit_sql(self, sql, timeout: float):
+        """Add a ``MAX_EXECUTION_TIME`` optimizer hint to SELECT strings"""
+        if not isinstance(sql, str) or not _SELECT_PATTERN.match(sql):
+            return sql
+        milliseconds = max(1, int(timeout * 1000))
+        return _SELECT_PATTERN.sub(f"SELECT /*+ MAX_EXECUTION_TIME({milliseconds}) */", sql, count=1)
+
+    def multi_statement_connect_args(self) -> Optional[dict]:
+        from pymysql.constants import CLIENT
+        return {'client_flag': CLIENT.MULTI_STATEMENTS}
+
+    def is_timeout(self, exc: Exception) -> bool:
+        return _error_code(exc) in self.TIMEOUT_ERRORS
+
+    def is_transient(self, exc: Exception) -> bool:
+        return super().is_transient(exc) or _error_code(exc) in self.TRANSIENT_ERRORS
+
+    def cancel(self, executor, dbapi_conn) -> None:
+        with executor._connection() as conn:
+            conn.exec_driver_sql(f"KILL QUERY {int(dbapi_conn.thread_id())}")
+
+
+class SQLiteBackend(Backend):
+    """Embedded SQLite database file"""
+
+    name = 'sqlite'
+    dialect = 'sqlite'
+
+    # Bytes assumed per column value when sizing estimates
+    VALUE_BYTES = 8
+
+    # Fraction of a table's rows assumed to be read through an index SEARCH
+    SEARCH_SELECTIVITY = 0.1
+
+    # Fraction of a scanned table's rows assumed to pass the WHERE condition
+    FILTER_SELECTIVITY = 0.25
+
+    # Virtual machine instructions between deadline checks
+    PROGRESS_INTERVAL = 10000
+
+    # Seconds between interrupts of a cancelled asyncio statement
+    INTERRUPT_INTERVAL = 0.01
+
+    # Loop of an EXPLAIN QUERY PLAN: kind, table and the index used, if any
+    PLAN_STEP = re.compile(r'^(SCAN|SEARCH) (\w+)(?: AS \w+)?(?: USING (.*))?$')
+
+    def __init__(self, config):
+        super().__init__(config)
+        self._row_counts: Dict[str, Tuple[Optional[str], int]] = {}  # Table -> (file fingerprint, rows)
+
+    def url(self) -> str:
+        return f"sqlite:///{self.config.database}"
+
+    def async_url(self) -> str:
+        return f"sqlite+aiosqlite:///{self.config.database}"
+
+    def validate_async_dependencies(self) -> None:
+        if not AIOSQLITE_AVAILABLE:
+            raise ImportError("aiosqlite is not installed.")
+        super().validate_dependencies()
+
+    def on_connect(self, dbapi_conn, connection_record) -> None:
+        # Generated SAMPLE conditions hash non-integer keys with CRC32
+        dbapi_conn.create_function('CRC32', 1, _crc32, deterministic=True)
+
+    def table_info_sql(self, table_name: str) -> str:
+        return f'PRAGMA table_info("{table_name}")'
+
+    def list_tables_sql(self) -> str:
+        return "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+
+    def schema(self, executor, tables: List[str]) -> Dict[str, Dict]:
+        params = {'tables': list(tables)}
+        columns = executor.execute(text(
+            "SELECT m.name AS table_name, p.name AS column_name, p.type AS data_type, p.pk AS pk "
+            "FROM sqlite_master m JOIN pragma_table_info(m.name) p "
+            "WHERE m.type IN ('table', 'view') AND m.name IN :tables "
+            "ORDER BY m.name, p.cid"
+        ).bindparams(bindparam('tables', expanding=True)), params=params, use_cache=False)
+        foreign_keys = executor.execute(text(
+            'SELECT m.name AS table_name, f."from" AS column_name, '
+            'f."table" AS referenced_table, f."to" AS referenced_column '
+            "FROM sqlite_master m JOIN pragma_foreign_key_list(m.name) f "
+            "WHERE m.type = 'table' AND m.name IN :tables "
+            "ORDER BY m.name, f.id, f.seq"
+        ).bindparams(bindparam('tables', expanding=True)), params=params, use_cache=False)
+
+        column_df = _metadata(columns, "table columns")
+        primary_keys = column_df[column_df['pk'] > 0].sort_values(['table_name', 'pk'], kind='stable')
+        return _assemble_schema(tables, column_df, primary_keys, _metadata(foreign_keys, "foreign keys"))
+
+    def estimate(self, executor, sql_list: List) -> List[Estimate]:
+        """Approximate row counts from table sizes and the shape of the query plan
+
+        SQLite's plan carries no row estimates and running the statement would
+        cost as much as fetching it. Table sizes come from ``sqlite_stat1``
+        after ANALYZE, else from a count cached until the database file
+        changes; the nested loops of EXPLAIN QUERY PLAN scale them by fixed
+        selectivity guesses, so estimates are only good for ranking queries.
+        """
+        plans = []
+        for gen_sql in sql_list:
+            plan = executor.execute(f"EXPLAIN QUERY PLAN {gen_sql.sql}", use_cache=False)
+            if not plan.success:
+                logger.warning(f"Failed to estimate {gen_sql.table}: {plan.error}")
+            plans.append(plan.data if plan.success else None)
+
+        steps = {}
+        for gen_sql, plan in zip(sql_list, plans):
+            if plan is not None:
+                # Loops of subqueries hang below the top level
+                top_level = plan[plan['parent'] == 0] if (plan['parent'] == 0).any() else plan
+                matches = (self.PLAN_STEP.match(detail) for detail in top_level['detail'])
+                steps[id(gen_sql)] = [match.groups() for match in matches if match]
+        table_rows = self._table_rows(executor, sorted({
+            table for loops in steps.values() for _, table, _ in loops
+        }))
+
+        estimates = []
+        for gen_sql, plan in zip(sql_list, plans):
+            if plan is None:
+                estimates.append((None, None, None, None))
+                continue
+
+            details = plan['detail'].tolist()
+            full_scan = any(detail.startswith('SCAN') and 'USING' not in detail for detail in details)
+            rows = self._plan_rows(steps[id(gen_sql)], table_rows, bool(gen_sql.condition))
+            limit = re.search(r'\bLIMIT (\d+)\s*$', gen_sql.sql)
+            if rows is not None and limit:
+                rows = min(rows, int(limit.group(1)))
+            if gen_sql.columns and '*' not in gen_sql.columns:
+                width = len(gen_sql.columns)
+            else:
+                width = len(executor.get_table_schema([gen_sql.table])[gen_sql.table]['columns'])
+            size = rows * width * self.VALUE_BYTES if rows is not None else None
+            estimates.append((rows, size, full_scan, "consider an index on the filtered columns"))
+        return estimates
+
+    def _plan_rows(self, steps: List[tuple], table_rows: Dict[str, int], filtered: bool) -> Optional[int]:
+        """Rows produced by the nested loops of a plan, outermost loop first"""
+        rows = None
+        previous = None
+        for kind, table, using in steps:
+            if table not in table_rows:
+                continue
+            if rows is None:
+                selectivity = self.SEARCH_SELECTIVITY if kind == 'SEARCH' else 1.0
+                if kind == 'SCAN' and filtered:
+                    selectivity = self.FILTER_SELECTIVITY
+                rows = table_rows[table] * selectivity
+            elif 'PRIMARY KEY' in (using or ''):
+                pass  # One row looked up per outer row
+            elif kind == 'SEARCH':
+                # Joined through a key: each inner row is assumed to match one outer row
+                rows *= max(1.0, table_rows[table] / max(table_rows[previous], 1))
+            else:
+                rows *= table_rows[table]
+            previous = table
+        return int(rows) if rows is not None else None
+
+    def _table_rows(self, executor, tables: List[str]) -> Dict[str, int]:
+        """Row counts from sqlite_stat1, else counted once per version of the database file"""
+        fingerprints = self.table_fingerprints(executor, tables)
+        missing = [
+            table for table in tables
+            if table not in self._row_counts or fingerprints.get(table) is None
+            or self._row_counts[table][0] != fingerprints[table]
+        ]
+        if missing:
+            counts = {}
+            analyzed = executor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'", use_cache=False
+            )
+            if analyzed.success and len(analyzed.data):
+                stats = executor.execute(text(
+                    "SELECT tbl, stat FROM sqlite_stat1 WHERE tbl IN :tables"
+                ).bindparams(bindparam('tables', expanding=True)), params={'tables': missing}, use_cache=False)
+                if stats.success:
+                    for table, stat in zip(stats.data['tbl'], stats.data['stat']):
+                        # Every index row starts with the table's row count
+                        if stat:
+                            counts[table] = int(str(stat).split()[0])
+            for table in missing:
+                if table not in counts:
+                    count = executor.execute(f'SELECT COUNT(*) FROM "{table}"', use_cache=False)
+                    if not count.success:
+                        continue
+                    counts[table] = int(count.data.iloc[0, 0])
+                self._row_counts[table] = (fingerprints.get(table), counts[table])
+        return {table: self._row_counts[table][1] for table in tables if table in self._row_counts}
+
+    def table_fingerprints(self, executor, tables: List[str]) -> Dict[str, str]:
+        """Modification time and size of the database file and its WAL"""
+        if self.config.database in ('', ':memory:'):
+            return {}
+        parts = [file_fingerprint(self.config.database)]
+        wal_path = f"{self.config.database}-wal"
+        if os.path.exists(wal_path):
+            parts.append(file_fingerprint(wal_path))
+        fingerprint = '/'.join(parts)
+        return {table_name: fingerprint for table_name in tables}
+
+    @contextmanager
+    def server_timeout(self, dbapi_conn, timeout: float):
+        """Abort statements from a progress handler once the deadline has passed
+
+        The abort and a cancellation both raise "interrupted", so timeouts are
+        told apart by the executor's deadline rather than by :meth:`is_timeout`.
+        """
+        deadline = time.monotonic() + timeout
+        dbapi_conn.set_progress_handler(lambda: int(time.monotonic() > deadline), self.PROGRESS_INTERVAL)
+        try:
+            yield
+        finally:
+            dbapi_conn.set_progress_handler(None, 0)
+
+    def is_transient(self, exc: Exception) -> bool:
+        return super().is_transient(exc) or 'database is locked' in str(exc)
+
+    def cancel(self, executor, dbapi_conn) -> None:
+        dbapi_conn.interrupt()
+
+    async def cancel_async(self, driver_conn, query) -> None:
+        # aiosqlite runs statements on its own thread, which task cancellation
+        # cannot stop; interrupt() reaches the database directly. It only stops a
+        # statement already running, so repeat until the task has finished
+        while not query.done():
+            await driver_conn.interrupt()
+            await asyncio.wait({query}, timeout=self.INTERRUPT_INTERVAL)
+
+
+class DuckDBBackend(Backend):
+    """Embedded DuckDB database, optionally querying Parquet/CSV files in place
+
+    ``DatabaseConfig.files`` maps table names to Parquet or CSV paths; each
+    file is exposed as a temporary view on every new connection, so no data
+    is imported.
+    """
+
+    name = 'duckdb'
+    dialect = 'duckdb'
+
+    def validate_dependencies(self) -> None:
+        if not DUCKDB_AVAILABLE:
+            raise ImportError("duckdb and duckdb_engine are not installed.")
+        super().validate_dependencies()
+
+    def url(self) -> str:
+        return f"duckdb:///{self.config.database or ':memory:'}"
+
+    def on_connect(self, dbapi_conn, connection_record) -> None:
+        for table_name, path in (self.config.files or {}).items():
+            extension = os.path.splitext(path)[1].lower()
+            reader = 'read_parquet' if extension == '.parquet' else 'read_csv_auto'
+            escaped = path.replace("'", "''")
+            dbapi_conn.execute(
+                f'CREATE OR REPLACE TEMPORARY VIEW "{table_name}" AS SELECT * FROM {reader}(\'{escaped}\')'
+            )
+
+    def table_info_sql(self, table_name: str) -> str:
+        return f'DESCRIBE "{table_name}"'
+
+    def list_tables_sql(self) -> str:
+        return "SELECT table_name FROM information_schema.tables ORDER BY table_name"
+
+    def schema(self, executor, tables: List[str]) -> Dict[str, Dict]:
+        params = {'tables': list(tables)}
+        columns = executor.execute(text(
+            "SELECT table_name, column_name, data_type "
+            "FROM information_schema.columns "
+            "WHERE table_name IN :tables "
+            "ORDER BY table_name, ordinal_position"
+        ).bindparams(bindparam('tables', expanding=True)), params=params, use_cache=False)
+        primary_keys = executor.execute(text(
+            "SELECT table_name, unnest(constraint_column_names) AS column_name "
+            "FROM duckdb_constraints() "
+            "WHERE constraint_type = 'PRIMARY KEY' AND table_name IN :tables"
+        ).bindparams(bindparam('tables', expanding=True)), params=params, use_cache=False)
+        foreign_keys = executor.execute(text(
+            "SELECT kcu.table_name AS table_name, kcu.column_name AS column_name, "
+            "ccu.table_name AS referenced_table, ccu.column_name AS referenced_column "
+            "FROM information_schema.referential_constraints rc "
+            "JOIN information_schema.key_column_usage kcu "
+            "  ON rc.constraint_name = kcu.constraint_name "
+            "JOIN information_schema.key_column_usage ccu "
+            "  ON rc.unique_constraint_name = ccu.constraint_name "
+            " AND kcu.ordinal_position = ccu.ordinal_position "
+            "WHERE kcu.table_name IN :tables"
+        ).bindparams(bindparam('tables', expanding=True)), params=params, use_cache=False)
+
+        return _assemble_schema(
+            tables,
+            _metadata(columns, "table columns"),
+            _metadata(primary_keys, "primary keys"),
+            _metadata(foreign_keys, "foreign keys")
+        )
+
+    def table_fingerprints(self, executor, tables: List[str]) -> Dict[str, str]:
+        """File stats for file-backed tables, database file stats for stored tables"""
+        files = self.config.files or {}
+        database_fingerprint = None
+        if self.config.database not in ('', ':memory:'):
+            parts = [file_fingerprint(self.config.database)]
+            wal_path = f"{self.config.database}.wal"
+            if os.path.exists(wal_path):
+                parts.append(file_fingerprint(wal_path))
+            database_fingerprint = '/'.join(parts)
+
+        fingerprints = {}
+        for table_name in tables:
+            if table_name in files:
+                fingerprints[table_name] = file_fingerprint(files[table_name])
+            elif database_fingerprint is not None:
+                fingerprints[table_name] = database_fingerprint
+        return fingerprints
+
+    def cancel(self, executor, dbapi_conn) -> None:
+        dbapi_conn.interrupt()
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (MySQLBackend, SQLiteBackend, DuckDBBackend)
+}
+
+
+def get_backend(config) -> Backend:
+    """Return the backend instance for a DatabaseConfig"""
+    try:
+        return BACKENDS[config.db_type](config)
+    except KeyError:
+        raise ValueError(f"Unsupported database type: {config.db_type}")
@@ -1,43 +1,119 @@
 """Database executor that runs SQL statements and returns data"""
 
+import dataclasses
+import datetime
+import json
 import logging
-from typing import List, Dict, Optional
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Dict, Optional, Union
 from dataclasses import dataclass
 import pandas as pd
 
+from tlsql.examples.executor.arrow_fetch import (
+    arrow_to_pandas,
+    arrow_types_from_description,
+    concat_batches,
+    concat_tables,
+    rows_to_record_batch,
+)
+from tlsql.examples.executor.backends import BACKENDS, Backend, empty_schema, get_backend
+from tlsql.examples.executor.engine_pool import PoolStats, registry
+from tlsql.examples.executor.memory_cache import shared_cache
+from tlsql.examples.executor.result_cache import ResultCache, normalize_sql, referenced_tables
+from tlsql.examples.executor.spill import SpillFile, unify_schema
+from tlsql.examples.executor.typed_fetch import (
+    apply_dtypes,
+    approx_memory_bytes,
+    concat_chunks,
+    dtypes_from_schema,
+    memory_bytes,
+)
 
-try:
-    import pymysql  # noqa: F401
-    MYSQL_AVAILABLE = True
-except ImportError:
-    MYSQL_AVAILABLE = False
 
 try:
-    from sqlalchemy import create_engine
+    from sqlalchemy import bindparam, text
     SQLALCHEMY_AVAILABLE = True
 except ImportError:
     SQLALCHEMY_AVAILABLE = False
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 # Configure logging
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
 
+# Rows per chunk of streams with a fixed chunk size
+INITIAL_STREAM_ROWS = 10000
+
+# DataFrame bytes assumed per value to size the first streamed chunk, before
+# a chunk has been measured; numbers take 8, short strings several times more
+STREAM_VALUE_BYTES = 32
+
+# Re-measure row width every this many streamed chunks
+STREAM_RETUNE_INTERVAL = 10
+
+# Rows per fetchmany() call when a result is read in full
+FETCH_BLOCK_ROWS = 10000
+
+# Key-set pushdown: up to IN_LIST_MAX_KEYS keys are sent as IN lists of
+# IN_CHUNK_KEYS each, up to TEMP_TABLE_MAX_KEYS through a temporary table,
+# larger key sets filter the streamed table on the client
+IN_CHUNK_KEYS = 1000
+IN_LIST_MAX_KEYS = 20000
+TEMP_TABLE_MAX_KEYS = 2000000
+
+# Arrow schema metadata key holding the watermark of an incremental snapshot
+WATERMARK_METADATA_KEY = b'tlsql.watermark'
+
 
 @dataclass
 class DatabaseConfig:
     """Database configuration"""
-    db_type: str  # Database type
+    db_type: str  # Database type: 'mysql', 'sqlite' or 'duckdb'
     database: str  # Database name/path
     host: Optional[str] = None  # Host
     port: Optional[int] = None  # Port
     username: Optional[str] = None  # Username
     password: Optional[str] = None  # Password
     charset: str = 'utf8'  # Charset
+    pool_size: int = 5  # Persistent pooled connections
+    max_overflow: int = 10  # Extra connections under load
+    pool_pre_ping: bool = True  # Test connections before use
+    pool_recycle: int = 3600  # Seconds before a connection is replaced
+    pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    pool_warmup: int = 0  # Connections opened when the pool is created
+    max_concurrency: int = 4  # Concurrent queries per database
+    files: Optional[Dict[str, str]] = None  # DuckDB: table name -> Parquet/CSV path
+    result_cache_dir: Optional[str] = None  # Directory of the on-disk result cache, None disables it
+    result_cache_bytes: int = 10 * 1024 ** 3  # Size bound of the result cache
+    result_cache_compression: str = 'uncompressed'  # 'uncompressed' maps cached files zero-copy, or 'lz4'/'zstd'
+    checksum_fingerprints: bool = True  # MySQL: checksum tables without update_time, else never cache their results
+    memory_cache_bytes: int = 0  # Size bound of the in-process result cache, 0 disables it
+    memory_cache_ttl: float = 60.0  # Seconds an in-process cached result stays valid
+    schema_ttl: float = 300.0  # Seconds a cached table schema stays valid
+    typed_fetch: bool = False  # Decode table queries into schema-derived int32/float32/category columns
+    dtypes: Optional[Dict[str, str]] = None  # Typed fetch overrides: column or 'table.column' -> dtype
+    query_timeout: Optional[float] = None  # Default per-query deadline in seconds, None waits forever
+    max_retries: int = 2  # Retries of a query after a transient connection error
+    retry_backoff: float = 0.2  # Base seconds of the jittered exponential retry backoff
+    multi_statement: bool = False  # Send the per-table queries of a conversion in one request
+    memory_budget: Optional[int] = None  # Bytes a columnar result may hold in RAM before spilling to disk
+    spill_dir: Optional[str] = None  # Directory for spilled results, defaults to the system temp dir
 
     def __post_init__(self):
         """Validate configuration"""
-        valid_types = ['mysql']
+        valid_types = list(BACKENDS)
         if self.db_type not in valid_types:
             raise ValueError(
                 f"Unsupported database type: {self.db_type}. "
@@ -45,6 +121,17 @@ class DatabaseConfig:
             )
 
 
+@dataclass
+class QueryTimings:
+    """Monotonic phase durations of one query in nanoseconds"""
+
+    pool_wait_ns: int = 0  # Waiting for a pooled connection
+    first_row_ns: int = 0  # From sending the query until the first rows arrive
+    fetch_ns: int = 0  # Transferring the remaining rows
+    decode_ns: int = 0  # Building the DataFrame or Arrow table
+    total_ns: int = 0  # Whole call, including the phases above
+
+
 @dataclass
 class ExecutionResult:
     """Execution result wrapper
@@ -58,6 +145,110 @@ class ExecutionResult:
     execution_time: float = 0.0  # Execution time
     error: Optional[str] = None  # Error message
     sql: Optional[str] = None  # SQL string
+    cancelled: bool = False  # Cancelled before or while running
+    arrow_table: Optional[object] = None  # pyarrow Table from the columnar fetch path or result cache
+    cache_hit: bool = False  # Served from the on-disk result cache
+    memory_bytes: Optional[int] = None  # Approximate DataFrame memory
+    memory_saved: Optional[int] = None  # Bytes saved by typed fetch over inferred dtypes
+    timings: Optional[QueryTimings] = None  # Phase breakdown of execution_time
+    timed_out: bool = False  # Stopped by its deadline
+    attempts: int = 1  # Executions including retries after transient errors
+    spilled: bool = False  # Result exceeded the memory budget and is memory-mapped from disk
+    delta_rows: Optional[int] = None  # Rows fetched by an incremental refresh, None after a full load
+
+    @property
+    def rows_per_sec(self) -> float:
+        """Rows delivered per second of execution time"""
+        return self.row_count / self.execution_time if self.execution_time else 0.0
+
+    @property
+    def bytes_per_sec(self) -> float:
+        """Result memory delivered per second of execution time"""
+        return (self.memory_bytes or 0) / self.execution_time if self.execution_time else 0.0
+
+
+def _private_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """Copy of a cached DataFrame that the caller may modify without changing the cache
+
+    Under Copy-on-Write (always on from pandas 3.0) a shallow copy is enough;
+    otherwise the buffers are copied.
+    """
+    copy_on_write = int(pd.__version__.split('.')[0]) >= 3 or pd.options.mode.copy_on_write is True
+    return df.copy(deep=not copy_on_write)
+
+
+class QueryTimeout(Exception):
+    """Raised when a query runs past its deadline"""
+
+
+class _QueryDeadline:
+    """Client-side timer that cancels a query still running at its deadline
+
+    The timer and the end of the query synchronize on a lock, so a late timer
+    never cancels a statement that has already finished and whose connection
+    may be running someone else's query.
+    """
+
+    def __init__(self, timeout: float, cancel_fn, dbapi_conn):
+        self._expires_at = time.monotonic() + timeout
+        self._fired = False
+        self._done = False
+        self._lock = threading.Lock()
+        self._timer = threading.Timer(timeout, self._expire, args=(cancel_fn, dbapi_conn))
+        self._timer.daemon = True
+
+    def _expire(self, cancel_fn, dbapi_conn) -> None:
+        with self._lock:
+            if self._done:
+                return
+            self._fired = True
+            try:
+                cancel_fn(dbapi_conn)
+            except Exception as e:
+                logger.warning(f"Failed to cancel query past its deadline: {e}")
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed, also when a server-side limit stopped the query first"""
+        return self._fired or time.monotonic() >= self._expires_at
+
+    def __enter__(self):
+        self._timer.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        with self._lock:
+            self._done = True
+        self._timer.cancel()
+        return False
+
+
+class _CancelScope:
+    """Tracks DB-API connections of a batch so in-flight queries can be cancelled"""
+
+    def __init__(self):
+        self.cancelled = False
+        self._connections = set()
+        self._lock = threading.Lock()
+
+    def register(self, dbapi_conn) -> None:
+        with self._lock:
+            self._connections.add(dbapi_conn)
+
+    def unregister(self, dbapi_conn) -> None:
+        with self._lock:
+            self._connections.discard(dbapi_conn)
+
+    def cancel(self, cancel_fn) -> None:
+        """Mark scope cancelled and call ``cancel_fn`` on each running connection"""
+        with self._lock:
+            self.cancelled = True
+            connections = list(self._connections)
+        for dbapi_conn in connections:
+            try:
+                cancel_fn(dbapi_conn)
+            except Exception as e:
+                logger.warning(f"Failed to cancel running query: {e}")
 
 
 class DatabaseExecutor:
@@ -74,8 +265,30 @@ class DatabaseExecutor:
             ImportError: Missing driver
         """
         self.config = config
-        self.engine = None  # SQLAlchemy engine
-        self._validate_dependencies()
+        self.engine = None  # SQLAlchemy engine, borrowed from the shared registry
+        self._local = threading.local()  # Per-thread cancel scope of a running batch
+        self.backend: Backend = get_backend(config)
+        self.backend.validate_dependencies()
+        # Connection identity: executors differing only in query options share one pool
+        self._pool_key = json.dumps(
+            {'url': self.backend.url(), 'files': config.files, **self.backend.engine_kwargs()},
+            sort_keys=True, default=str
+        )
+        self._hooks: List[Callable[[ExecutionResult], None]] = []
+        self._schema_cache: Dict[str, tuple] = {}  # Table -> (fetched at, schema entry)
+        self._schema_lock = threading.Lock()
+        self.memory_cache = None
+        if config.memory_cache_bytes:
+            # Typed results also depend on the configured dtype overrides
+            cache_key = f"{self._pool_key}|{json.dumps(config.dtypes, sort_keys=True)}"
+            self.memory_cache = shared_cache(cache_key, config.memory_cache_bytes, config.memory_cache_ttl)
+        self.result_cache = None
+        if config.result_cache_dir:
+            self.result_cache = ResultCache(
+                config.result_cache_dir,
+                max_bytes=config.result_cache_bytes,
+                compression=config.result_cache_compression
+            )
         logger.info(f"DatabaseExecutor initialized for {config.db_type}")
 
     def __enter__(self):
@@ -88,95 +301,1155 @@ class DatabaseExecutor:
         self.disconnect()
         return False
 
-    def _validate_dependencies(self):
-        """Validate required drivers"""
-        if self.config.db_type == 'mysql':
-            if not MYSQL_AVAILABLE:
-                raise ImportError("pymysql is not installed.")
-            if not SQLALCHEMY_AVAILABLE:
-                raise ImportError("SQLAlchemy is not installed.")
+    @property
+    def dialect(self) -> str:
+        """SQL dialect to pass to ``tlsql.convert`` for this database"""
+        return self.backend.dialect
 
     def connect(self) -> None:
-        """Establish database connection"""
+        """Borrow the pooled engine for this configuration from the shared registry"""
         try:
-            if self.config.db_type == 'mysql':
-                connection_string = (
-                    f"mysql+pymysql://{self.config.username}:{self.config.password}"
-                    f"@{self.config.host}:{self.config.port or 3306}/{self.config.database}"
-                    f"?charset={self.config.charset}"
-                )
-                self.engine = create_engine(connection_string)
-                logger.info(f"Connected to MySQL database: {self.config.database}")
-            else:
-                raise ValueError(f"Unsupported database type: {self.config.db_type}")
+            self.engine = registry.get_engine(
+                self._pool_key,
+                self.backend.url(),
+                on_connect=self.backend.on_connect,
+                **self.backend.engine_kwargs()
+            )
+            logger.info(f"Connected to {self.config.db_type} database: {self.config.database}")
 
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
 
     def disconnect(self) -> None:
-        """Disconnect from database"""
+        """Release the pooled engine; the pool stays open for other executors"""
         if self.engine is not None:
-            self.engine.dispose()
             self.engine = None
-            logger.info("Database connection closed")
+            logger.info("Database connection released")
 
     def is_connected(self) -> bool:
         """Check if engine is connected"""
         return self.engine is not None
 
-    def execute(self, sql: str, params: Optional[tuple] = None) -> ExecutionResult:
-        """Execute a single SQL query and return DataFrame"""
-        import time
+    @contextmanager
+    def _connection(self) -> Iterator:
+        """Borrow a pooled connection, connecting first if needed
+
+        Inside a batch the DB-API connection is registered with the batch's
+        cancel scope while it is in use.
+        """
+        if not self.is_connected():
+            self.connect()
+        scope = getattr(self._local, 'scope', None)
+        wait_start = time.perf_counter_ns()
+        with registry.connect(self._pool_key) as conn:
+            self._local.pool_wait_ns = time.perf_counter_ns() - wait_start
+            if scope is None:
+                yield conn
+                return
+            dbapi_conn = conn.connection.dbapi_connection
+            scope.register(dbapi_conn)
+            try:
+                yield conn
+            finally:
+                scope.unregister(dbapi_conn)
+
+    @contextmanager
+    def _deadline(self, conn, timeout: Optional[float]) -> Iterator[Optional[_QueryDeadline]]:
+        """Bound the statements run on a connection by server-side and client-side limits
+
+        The backend's server-side limit stops the statement on the server where
+        supported; the client timer cancels it (e.g. ``KILL QUERY``, ``interrupt``)
+        when it is still running at the deadline, covering result transfer too.
+        """
+        if timeout is None:
+            yield None
+            return
+        dbapi_conn = conn.connection.dbapi_connection
+        # The client deadline starts first, so it has passed whenever the server-side limit fires
+        with _QueryDeadline(timeout, self._cancel_query, dbapi_conn) as deadline:
+            with self.backend.server_timeout(dbapi_conn, timeout):
+                yield deadline
+
+    def _check_timeout(self, exc: Exception, deadline: Optional[_QueryDeadline], timeout: Optional[float]) -> None:
+        """Raise QueryTimeout when an error was caused by the query's deadline"""
+        if deadline is not None and (deadline.expired or self.backend.is_timeout(exc)):
+            raise QueryTimeout(f"Query exceeded its {timeout:.3f}s deadline") from exc
+
+    def _run(self, conn, sql, params, timeout: Optional[float] = None):
+        """Execute a statement on a pooled connection through a server-side cursor"""
+        if timeout is not None:
+            sql = self.backend.limit_sql(sql, timeout)
+        conn = conn.execution_options(stream_results=True)
+        if isinstance(sql, str) and not isinstance(params, dict):
+            # Sent to the driver as is, so ':word' inside a string literal is not a bind parameter
+            if params:
+                return conn.exec_driver_sql(sql, tuple(params))
+            return conn.execution_options(no_parameters=True).exec_driver_sql(sql)
+        query = text(sql) if isinstance(sql, str) else sql
+        return conn.execute(query, params or {})
+
+    def add_hook(self, hook: Callable[[ExecutionResult], None]) -> None:
+        """Subscribe a callable to the ExecutionResult of every executed query
+
+        Hooks run on the executing thread, after the query finished or failed,
+        and receive results with ``timings`` filled in; exceptions they raise
+        are logged and ignored.
+        """
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[ExecutionResult], None]) -> None:
+        """Unsubscribe a hook added with :meth:`add_hook`"""
+        self._hooks.remove(hook)
+
+    def _notify(self, result: ExecutionResult) -> ExecutionResult:
+        """Pass a result to every hook and return it"""
+        for hook in list(self._hooks):
+            try:
+                hook(result)
+            except Exception as e:
+                logger.warning(f"Execution hook failed: {e}")
+        return result
+
+    def _cancel_query(self, dbapi_conn) -> None:
+        """Cancel the query running on a DB-API connection"""
+        self.backend.cancel(self, dbapi_conn)
+
+    def pool_stats(self) -> PoolStats:
+        """Return wait time and utilization metrics of the shared pool"""
+        if not self.is_connected():
+            self.connect()
+        return registry.stats(self._pool_key)
+
+    def _result_cache_key(self, sql, params) -> Optional[str]:
+        """Return the result cache key of a query, or None if it cannot be cached"""
+        if self.result_cache is None or getattr(self._local, 'fingerprinting', False):
+            return None
+        tables = referenced_tables(str(sql))
+        if not tables:
+            return None
+
+        # Fingerprint queries go through execute() and must not recurse into the cache
+        self._local.fingerprinting = True
+        try:
+            fingerprints = self.backend.table_fingerprints(self, tables)
+        except Exception as e:
+            logger.warning(f"Failed to fingerprint {', '.join(tables)}: {e}")
+            return None
+        finally:
+            self._local.fingerprinting = False
+        if any(table not in fingerprints for table in tables):
+            return None
 
+        return ResultCache.key(str(sql), params, self._cache_identity(), fingerprints)
+
+    def _cache_identity(self) -> str:
+        """Database identity part of result cache keys"""
+        return json.dumps(
+            [self.config.db_type, self.config.host, self.config.port, self.config.database, self.config.files],
+            default=str
+        )
+
+    def _store_result(self, cache_key: str, df: pd.DataFrame) -> None:
+        """Write a result to the result cache, logging instead of failing the query"""
+        try:
+            self.result_cache.put(cache_key, pa.Table.from_pandas(df, preserve_index=False))
+        except Exception as e:
+            logger.warning(f"Failed to cache result: {e}")
+
+    def _cached_result(self, cache_key: Optional[str], sql, start_ns: int) -> Optional[ExecutionResult]:
+        """Return the result cache entry of a key as an ExecutionResult, or None"""
+        if cache_key is None:
+            return None
+        table = self.result_cache.get(cache_key)
+        if table is None:
+            return None
+
+        decode_start = time.perf_counter_ns()
+        df = table.to_pandas()
+        end_ns = time.perf_counter_ns()
+        timings = QueryTimings(decode_ns=end_ns - decode_start, total_ns=end_ns - start_ns)
+        logger.info(f"Result cache hit. Rows: {table.num_rows}, Time: {timings.total_ns / 1e9:.3f}s")
+        return ExecutionResult(
+            success=True,
+            data=df,
+            row_count=table.num_rows,
+            execution_time=timings.total_ns / 1e9,
+            sql=str(sql),
+            arrow_table=table,
+            cache_hit=True,
+            memory_bytes=approx_memory_bytes(df),
+            timings=timings
+        )
+
+    def _fetch_rows(self, sql, params, timeout: Optional[float], timings: QueryTimings) -> tuple:
+        """Run a query once and read all rows, recording pool wait, first-row and fetch time
+
+        Returns:
+            (column names, rows)
+        """
+        with self._connection() as conn:
+            timings.pool_wait_ns = self._local.pool_wait_ns
+            with self._deadline(conn, timeout) as deadline:
+                try:
+                    query_start = time.perf_counter_ns()
+                    result = self._run(conn, sql, params, timeout)
+                    columns, rows = [], []
+                    if result.returns_rows:
+                        columns = list(result.keys())
+                        rows = result.fetchmany(FETCH_BLOCK_ROWS)
+                    fetch_start = time.perf_counter_ns()
+                    timings.first_row_ns = fetch_start - query_start
+                    while rows:
+                        block = result.fetchmany(FETCH_BLOCK_ROWS)
+                        if not block:
+                            break
+                        rows.extend(block)
+                    timings.fetch_ns = time.perf_counter_ns() - fetch_start
+                except Exception as e:
+                    self._check_timeout(e, deadline, timeout)
+                    raise
+        return columns, rows
+
+    def _retry_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff before retry number ``attempt``"""
+        return random.uniform(0, self.config.retry_backoff * 2 ** (attempt - 1))
+
+    def _memory_cached(self, key_data: dict, compute: Callable[[], ExecutionResult]) -> ExecutionResult:
+        """Serve a query from the in-process cache, coalescing concurrent identical calls
+
+        Every caller, including the one that ran the query, gets its own copy
+        of the DataFrame, so modifying it leaves the cached entry intact.
+        Callers that did not run the query get results flagged ``cache_hit``.
+        """
+        key = json.dumps(key_data, sort_keys=True, default=str)
+        result, shared = self.memory_cache.get_or_compute(
+            key, compute, lambda result: result.memory_bytes if result.success else None
+        )
+        if result.data is not None:
+            result = dataclasses.replace(result, data=_private_copy(result.data))
+        if not shared:
+            return result
+        return self._notify(dataclasses.replace(result, cache_hit=True))
+
+    def execute(self, sql, params: Optional[Union[tuple, dict]] = None,
+                use_cache: bool = True, timeout: Optional[float] = None) -> ExecutionResult:
+        """Execute a single SQL query and return DataFrame
+
+        With ``DatabaseConfig.memory_cache_bytes`` set, recent results are kept
+        in a cache shared by the executors of this database, and concurrent
+        identical queries share one execution.
+
+        When ``DatabaseConfig.result_cache_dir`` is set, results are served from
+        and stored in the on-disk result cache, keyed by the normalized SQL,
+        parameters, connection and the current fingerprint of every table read.
+
+        The deadline covers the whole call including retries. Transient
+        connection errors are retried up to ``DatabaseConfig.max_retries`` times
+        with jittered exponential backoff; a query past its deadline is not
+        retried and is reported with ``timed_out``.
+
+        Args:
+            sql: SQL string or SQLAlchemy text clause
+            params: Positional parameters, or a dict bound to ``:name`` placeholders
+            use_cache: Set False to bypass the result cache for this query
+            timeout: Deadline in seconds, defaults to ``DatabaseConfig.query_timeout``
+        """
+        if self.memory_cache is not None and use_cache and not getattr(self._local, 'fingerprinting', False):
+            key_data = {'sql': normalize_sql(str(sql)), 'params': params}
+            return self._memory_cached(key_data, lambda: self._execute(sql, params, use_cache, timeout))
+        return self._execute(sql, params, use_cache, timeout)
+
+    def _execute(self, sql, params, use_cache: bool, timeout: Optional[float]) -> ExecutionResult:
+        """Execute a query past the in-process cache, see :meth:`execute`"""
         # Ensure connection
         if not self.is_connected():
             self.connect()
 
-        start_time = time.time()
+        timeout = self.config.query_timeout if timeout is None else timeout
+        start_ns = time.perf_counter_ns()
+        timings = QueryTimings()
+        attempts = 0
 
         try:
-            logger.info(f"Executing SQL: {sql[:100]}...")
+            logger.info(f"Executing SQL: {str(sql)[:100]}...")
             if self.engine is None:
                 raise RuntimeError("Database engine is not initialized. Please call connect() first.")
 
-            df = pd.read_sql(sql, self.engine, params=params)
+            cache_key = self._result_cache_key(sql, params) if use_cache else None
+            cached = self._cached_result(cache_key, sql, start_ns)
+            if cached is not None:
+                return self._notify(cached)
+
+            while True:
+                attempts += 1
+                remaining = None
+                if timeout is not None:
+                    remaining = timeout - (time.perf_counter_ns() - start_ns) / 1e9
+                    if remaining <= 0:
+                        raise QueryTimeout(f"Query exceeded its {timeout:.3f}s deadline")
+                try:
+                    columns, rows = self._fetch_rows(sql, params, remaining, timings)
+                    break
+                except QueryTimeout:
+                    raise
+                except Exception as e:
+                    if attempts > self.config.max_retries or not self.backend.is_transient(e):
+                        raise
+                    delay = self._retry_delay(attempts)
+                    logger.warning(f"Transient error on attempt {attempts}, retrying in {delay:.2f}s: {e}")
+                    time.sleep(delay)
 
-            execution_time = time.time() - start_time
+            decode_start = time.perf_counter_ns()
+            df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+            end_ns = time.perf_counter_ns()
+            timings.decode_ns = end_ns - decode_start
+            timings.total_ns = end_ns - start_ns
+
+            execution_time = timings.total_ns / 1e9
             row_count = len(df)
 
             logger.info(f"Query executed successfully. Rows: {row_count}, Time: {execution_time:.3f}s")
 
-            return ExecutionResult(
+            if cache_key is not None:
+                self._store_result(cache_key, df)
+
+            return self._notify(ExecutionResult(
                 success=True,
                 data=df,
                 row_count=row_count,
                 execution_time=execution_time,
-                sql=sql
-            )
+                sql=str(sql),
+                memory_bytes=approx_memory_bytes(df),
+                timings=timings,
+                attempts=attempts
+            ))
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            timings.total_ns = time.perf_counter_ns() - start_ns
             error_msg = str(e)
 
             logger.error(f"Query failed: {error_msg}")
 
-            return ExecutionResult(
+            return self._notify(ExecutionResult(
                 success=False,
                 error=error_msg,
+                execution_time=timings.total_ns / 1e9,
+                sql=str(sql),
+                timings=timings,
+                timed_out=isinstance(e, QueryTimeout),
+                attempts=max(attempts, 1)
+            ))
+
+    def execute_stream(self, sql, params: Optional[dict] = None, chunk_rows: Optional[int] = None,
+                       target_bytes: int = 64 * 1024 * 1024, as_arrow: bool = False,
+                       timeout: Optional[float] = None) -> Iterator:
+        """Execute a query and yield the result in chunks from a server-side cursor
+
+        Rows are read from an unbuffered cursor (``stream_results``, which uses
+        ``SSCursor`` for pymysql), so peak memory is one chunk rather than the
+        whole result. Without ``chunk_rows`` the chunk size is tuned so that each
+        chunk holds about ``target_bytes`` of DataFrame memory: the first chunk
+        is sized from the column count, later ones from measured row widths.
+
+        Args:
+            sql: SQL string or SQLAlchemy text clause
+            params: Dict bound to ``:name`` placeholders
+            chunk_rows: Fixed rows per chunk, disables auto-tuning
+            target_bytes: Memory budget per chunk for auto-tuning
+            as_arrow: Yield pyarrow RecordBatches instead of DataFrames
+            timeout: Deadline in seconds for the whole stream, including time
+                spent by the consumer; defaults to ``DatabaseConfig.query_timeout``
+
+        Yields:
+            DataFrame or RecordBatch chunks; an empty result yields one empty
+            chunk carrying the column names
+
+        Raises:
+            QueryTimeout: The stream ran past its deadline
+        """
+        if as_arrow and not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is not installed.")
+
+        rows_per_chunk = chunk_rows
+        logger.info(f"Streaming SQL: {str(sql)[:100]}...")
+
+        timeout = self.config.query_timeout if timeout is None else timeout
+        with self._connection() as conn, self._deadline(conn, timeout) as deadline:
+            try:
+                result = self._run(conn, sql, params, timeout)
+                columns = list(result.keys())
+                if rows_per_chunk is None:
+                    rows_per_chunk = max(1, int(target_bytes // (max(len(columns), 1) * STREAM_VALUE_BYTES)))
+                chunk_count = 0
+                while True:
+                    rows = result.fetchmany(rows_per_chunk)
+                    if not rows and chunk_count:
+                        break
+
+                    df = pd.DataFrame.from_records(rows, columns=columns)
+                    if rows and chunk_rows is None and chunk_count % STREAM_RETUNE_INTERVAL == 0:
+                        row_bytes = max(df.memory_usage(deep=True, index=False).sum() / len(df), 1)
+                        rows_per_chunk = max(1, int(target_bytes // row_bytes))
+                    chunk_count += 1
+
+                    yield pa.RecordBatch.from_pandas(df, preserve_index=False) if as_arrow else df
+                    if not rows:
+                        break
+            except Exception as e:
+                self._check_timeout(e, deadline, timeout)
+                raise
+
+        logger.info(f"Streamed {chunk_count} chunks")
+
+    def execute_arrow(self, sql, params: Optional[dict] = None, batch_rows: int = 65536,
+                      timeout: Optional[float] = None,
+                      memory_budget: Optional[int] = None) -> ExecutionResult:
+        """Execute a query through the columnar fetch path
+
+        Rows are fetched in blocks and transposed directly into Arrow record
+        batches, typed from the cursor description where the driver reports
+        types. ``data`` holds an Arrow-backed DataFrame over the same buffers;
+        use ``arrow_fetch.column_to_numpy``/``column_to_tensor`` on
+        ``arrow_table`` for zero-copy NumPy/torch access.
+
+        Once the fetched batches exceed the memory budget, they and every later
+        batch are written to an uncompressed Arrow IPC file instead of being
+        kept on the heap; the result is then a memory-mapped table (``spilled``)
+        whose pages the OS loads and evicts on demand.
+
+        Args:
+            sql: SQL string or SQLAlchemy text clause
+            params: Dict bound to ``:name`` placeholders
+            batch_rows: Rows per fetched block
+            timeout: Deadline in seconds, defaults to ``DatabaseConfig.query_timeout``
+            memory_budget: Bytes to hold in RAM, defaults to ``DatabaseConfig.memory_budget``
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is not installed.")
+
+        timeout = self.config.query_timeout if timeout is None else timeout
+        memory_budget = self.config.memory_budget if memory_budget is None else memory_budget
+        start_ns = time.perf_counter_ns()
+        timings = QueryTimings()
+        spill = None
+        try:
+            with self._connection() as conn, self._deadline(conn, timeout) as deadline:
+                timings.pool_wait_ns = self._local.pool_wait_ns
+                try:
+                    block_start = time.perf_counter_ns()
+                    result = self._run(conn, sql, params, timeout)
+                    columns = list(result.keys())
+                    types = arrow_types_from_description(result.cursor.description)
+                    batches = []
+                    held_bytes = 0
+                    while True:
+                        rows = result.fetchmany(batch_rows)
+                        fetched = time.perf_counter_ns()
+                        if timings.first_row_ns:
+                            timings.fetch_ns += fetched - block_start
+                        else:
+                            timings.first_row_ns = fetched - block_start
+                        if not rows:
+                            break
+                        batch = rows_to_record_batch(rows, columns, types)
+                        if spill is not None:
+                            spill.write(batch)
+                        else:
+                            batches.append(batch)
+                            held_bytes += batch.nbytes
+                            if memory_budget is not None and held_bytes > memory_budget:
+                                logger.info(f"Result exceeds {memory_budget} bytes, spilling to disk")
+                                spill = SpillFile(unify_schema(batches), self.config.spill_dir)
+                                for held in batches:
+                                    spill.write(held)
+                                batches = []
+                        block_start = time.perf_counter_ns()
+                        timings.decode_ns += block_start - fetched
+                except Exception as e:
+                    self._check_timeout(e, deadline, timeout)
+                    raise
+
+            decode_start = time.perf_counter_ns()
+            table = spill.open() if spill is not None else concat_batches(batches, columns)
+            df = arrow_to_pandas(table)
+            end_ns = time.perf_counter_ns()
+            timings.decode_ns += end_ns - decode_start
+            timings.total_ns = end_ns - start_ns
+            execution_time = timings.total_ns / 1e9
+            logger.info(f"Columnar query executed. Rows: {table.num_rows}, Time: {execution_time:.3f}s")
+
+            return self._notify(ExecutionResult(
+                success=True,
+                data=df,
+                row_count=table.num_rows,
                 execution_time=execution_time,
-                sql=sql
+                sql=str(sql),
+                arrow_table=table,
+                memory_bytes=table.nbytes,
+                timings=timings,
+                spilled=spill is not None
+            ))
+
+        except Exception as e:
+            if spill is not None:
+                spill.discard()
+            timings.total_ns = time.perf_counter_ns() - start_ns
+            logger.error(f"Query failed: {e}")
+            return self._notify(ExecutionResult(
+                success=False,
+                error=str(e),
+                execution_time=timings.total_ns / 1e9,
+                sql=str(sql),
+                timings=timings,
+                timed_out=isinstance(e, QueryTimeout)
+            ))
+
+    def _dtypes_for(self, table: str, compact: bool = True) -> Dict[str, str]:
+        """Target dtypes of a table from its cached schema and the configured overrides"""
+        overrides = {}
+        for key, dtype in (self.config.dtypes or {}).items():
+            table_name, _, column = key.rpartition('.')
+            if not table_name or table_name == table:
+                overrides[column] = dtype
+        types = self.get_table_schema([table])[table]['types']
+        return dtypes_from_schema(types, overrides, compact)
+
+    def execute_typed(self, sql, table: str, params: Optional[dict] = None,
+                      dtypes: Optional[Dict[str, str]] = None,
+                      chunk_rows: Optional[int] = None,
+                      timeout: Optional[float] = None) -> ExecutionResult:
+        """Execute a query on one table, decoding each chunk into compact dtypes
+
+        Column types come from the cached schema (see :meth:`get_table_schema`)
+        and ``DatabaseConfig.dtypes``: small integers become int32, floats and
+        decimals float32 and strings category. Chunks are converted as they are
+        streamed, so the inferred object columns never exist for the whole
+        result. ``memory_saved`` reports the difference to inferred dtypes.
+
+        Args:
+            sql: SQL string or SQLAlchemy text clause
+            table: Table the query reads, used to look up column types
+            params: Dict bound to ``:name`` placeholders
+            dtypes: Column name -> dtype, replacing the schema-derived dtypes
+            chunk_rows: Fixed rows per chunk, see :meth:`execute_stream`
+            timeout: Deadline in seconds, defaults to ``DatabaseConfig.query_timeout``
+        """
+        if self.memory_cache is not None:
+            key_data = {'sql': normalize_sql(str(sql)), 'params': params, 'table': table, 'dtypes': dtypes}
+            return self._memory_cached(
+                key_data, lambda: self._execute_typed(sql, table, params, dtypes, chunk_rows, timeout)
+            )
+        return self._execute_typed(sql, table, params, dtypes, chunk_rows, timeout)
+
+    def _execute_typed(self, sql, table: str, params: Optional[dict], dtypes: Optional[Dict[str, str]],
+                       chunk_rows: Optional[int], timeout: Optional[float]) -> ExecutionResult:
+        """Run a typed fetch past the in-process cache, see :meth:`execute_typed`"""
+        start_ns = time.perf_counter_ns()
+        timings = QueryTimings()
+        try:
+            dtypes = dtypes if dtypes is not None else self._dtypes_for(table)
+            cache_key = self._result_cache_key(sql, {'params': params, 'dtypes': dtypes})
+            cached = self._cached_result(cache_key, sql, start_ns)
+            if cached is not None:
+                return self._notify(cached)
+
+            chunks = []
+            inferred_bytes = 0
+            block_start = time.perf_counter_ns()
+            for chunk in self.execute_stream(sql, params=params, chunk_rows=chunk_rows, timeout=timeout):
+                received = time.perf_counter_ns()
+                if chunks:
+                    timings.fetch_ns += received - block_start
+                else:
+                    timings.pool_wait_ns = self._local.pool_wait_ns
+                    timings.first_row_ns = received - block_start - timings.pool_wait_ns
+                inferred_bytes += memory_bytes(chunk)
+                chunks.append(apply_dtypes(chunk, dtypes))
+                block_start = time.perf_counter_ns()
+                timings.decode_ns += block_start - received
+
+            decode_start = time.perf_counter_ns()
+            df = concat_chunks(chunks)
+            typed_bytes = memory_bytes(df)
+            end_ns = time.perf_counter_ns()
+            timings.fetch_ns += decode_start - block_start
+            timings.decode_ns += end_ns - decode_start
+            timings.total_ns = end_ns - start_ns
+
+            execution_time = timings.total_ns / 1e9
+            logger.info(
+                f"Typed fetch of {table}: {len(df)} rows, {typed_bytes / 2 ** 20:.1f} MB, "
+                f"saved {(inferred_bytes - typed_bytes) / 2 ** 20:.1f} MB "
+                f"of {inferred_bytes / 2 ** 20:.1f} MB, Time: {execution_time:.3f}s"
             )
+            if cache_key is not None:
+                self._store_result(cache_key, df)
+
+            return self._notify(ExecutionResult(
+                success=True,
+                data=df,
+                row_count=len(df),
+                execution_time=execution_time,
+                sql=str(sql),
+                memory_bytes=typed_bytes,
+                memory_saved=inferred_bytes - typed_bytes,
+                timings=timings
+            ))
+
+        except Exception as e:
+            timings.total_ns = time.perf_counter_ns() - start_ns
+            logger.error(f"Query failed: {e}")
+            return self._notify(ExecutionResult(
+                success=False,
+                error=str(e),
+                execution_time=timings.total_ns / 1e9,
+                sql=str(sql),
+                timings=timings,
+                timed_out=isinstance(e, QueryTimeout)
+            ))
+
+    def execute_paged(self, generated_sql) -> Iterator[ExecutionResult]:
+        """Execute a GeneratedSQL page by page using its keyset pagination plan
+
+        Each page resumes after the primary key of the previous page's last row,
+        so memory stays bounded by the page size. Falls back to a single query
+        when the statement was generated without ``page_size``.
 
-    def execute_batch(self, sql_list: List[str]) -> List[ExecutionResult]:
-        """Execute multiple SQL statements sequentially"""
+        Args:
+            generated_sql: GeneratedSQL object from ``tlsql.convert``
+
+        Yields:
+            ExecutionResult per page; iteration stops after a short or failed page
+        """
+        pagination = generated_sql.pagination
+        if pagination is None:
+            yield self.execute(generated_sql.sql)
+            return
+
+        last_row = None
+        page = 0
+        while True:
+            page += 1
+            logger.info(f"Fetching page {page} of {generated_sql.table}")
+            result = self.execute(pagination.sql_for(last_row), params=pagination.params(last_row))
+            yield result
+
+            if not result.success or result.row_count < pagination.page_size:
+                break
+            last_row = result.data.iloc[-1]
+
+    def _partition_bounds(self, table: str, key: str, partitions: int, split: str) -> List:
+        """Return sorted inner boundaries splitting a table's key range into partitions
+
+        'range' divides the integer min/max interval evenly; 'quantile' uses
+        NTILE over the key index so partitions hold equal row counts even for
+        skewed or non-numeric keys.
+        """
+        if split == 'range':
+            result = self.execute(f"SELECT MIN({key}) AS lo, MAX({key}) AS hi FROM {table}", use_cache=False)
+            if not result.success:
+                raise RuntimeError(f"Failed to read key range of {table}: {result.error}")
+            lo, hi = result.data.iloc[0]
+            if pd.isna(lo) or pd.isna(hi):
+                return []
+            if not pd.api.types.is_integer(lo) or not pd.api.types.is_integer(hi):
+                return self._partition_bounds(table, key, partitions, 'quantile')
+            lo, hi = int(lo), int(hi)
+            bounds = [lo + (hi - lo + 1) * i // partitions for i in range(1, partitions)]
+        elif split == 'quantile':
+            result = self.execute(
+                f"SELECT MIN({key}) AS lo FROM ("
+                f"SELECT {key}, NTILE({int(partitions)}) OVER (ORDER BY {key}) AS tile FROM {table}"
+                f") AS tiles GROUP BY tile ORDER BY lo",
+                use_cache=False
+            )
+            if not result.success:
+                raise RuntimeError(f"Failed to read key quantiles of {table}: {result.error}")
+            bounds = result.data['lo'].tolist()[1:]
+        else:
+            raise ValueError(f"Unknown split: {split}")
+        return sorted(set(bounds))
+
+    def execute_partitioned(self, generated_sql, partitions: Optional[int] = None, split: str = 'range',
+                            timeout: Optional[float] = None) -> ExecutionResult:
+        """Fetch one table query as concurrent primary-key range partitions
+
+        The query is wrapped once per partition with a range predicate on the
+        leading primary key column, the partitions run in parallel on pooled
+        connections through :meth:`execute_arrow`, and their Arrow tables are
+        concatenated chunk-wise without copying. The outer partitions are open
+        ended, so the result holds exactly the rows of the single query, in
+        key-range order. Queries with LIMIT or TABLESAMPLE, and queries that
+        do not project the key, run as one query.
+
+        Args:
+            generated_sql: GeneratedSQL of a single table
+            partitions: Number of partitions, defaults to ``max_concurrency``
+            split: 'range' (even min/max split) or 'quantile' (equal row counts)
+            timeout: Deadline per partition in seconds
+
+        Returns:
+            ExecutionResult with ``arrow_table`` set; ``timings`` phases are
+            summed over partitions while ``execution_time`` is wall time
+        """
+        partitions = partitions or self.config.max_concurrency
+        table = generated_sql.table
+        start_ns = time.perf_counter_ns()
+
+        primary_keys = self.get_table_schema([table])[table]['primary_keys']
+        key = primary_keys[0] if primary_keys else None
+        columns = generated_sql.columns or ['*']
+        sql_upper = generated_sql.sql.upper()
+        if (partitions < 2 or key is None or ('*' not in columns and key not in columns)
+                or ' LIMIT ' in sql_upper or 'TABLESAMPLE' in sql_upper):
+            logger.info(f"Fetching {table} as a single query")
+            return self.execute_arrow(generated_sql.sql, timeout=timeout)
+
+        try:
+            bounds = self._partition_bounds(table, key, partitions, split)
+        except Exception as e:
+            logger.error(f"Query failed: {e}")
+            return ExecutionResult(success=False, error=str(e), sql=generated_sql.sql)
+
+        base = f"SELECT * FROM ({generated_sql.sql}) AS tlsql_part"
+        queries = []
+        for i in range(len(bounds) + 1):
+            predicates, params = [], {}
+            if i > 0:
+                predicates.append(f"tlsql_part.{key} >= :lo")
+                params['lo'] = bounds[i - 1]
+            if i < len(bounds):
+                predicates.append(f"tlsql_part.{key} < :hi")
+                params['hi'] = bounds[i]
+            sql = f"{base} WHERE {' AND '.join(predicates)}" if predicates else base
+            queries.append((sql, params))
+        logger.info(f"Fetching {table} as {len(queries)} partitions on {key}")
+
+        limiter = registry.semaphore(self._pool_key, self.config.max_concurrency)
+
+        budget = self.config.memory_budget
+        partition_budget = budget // len(queries) if budget is not None else None
+
+        def fetch(sql, params):
+            with limiter:
+                return self.execute_arrow(sql, params=params, timeout=timeout, memory_budget=partition_budget)
+
+        with ThreadPoolExecutor(max_workers=min(len(queries), self.config.max_concurrency)) as pool:
+            results = list(pool.map(lambda query: fetch(*query), queries))
+
+        failed = [result for result in results if not result.success]
+        if failed:
+            return ExecutionResult(
+                success=False,
+                error=failed[0].error,
+                execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                sql=generated_sql.sql,
+                timed_out=any(result.timed_out for result in failed)
+            )
+
+        arrow_table = concat_tables([result.arrow_table for result in results])
+        timings = QueryTimings(
+            pool_wait_ns=sum(result.timings.pool_wait_ns for result in results),
+            first_row_ns=sum(result.timings.first_row_ns for result in results),
+            fetch_ns=sum(result.timings.fetch_ns for result in results),
+            decode_ns=sum(result.timings.decode_ns for result in results),
+            total_ns=time.perf_counter_ns() - start_ns
+        )
+        return ExecutionResult(
+            success=True,
+            data=arrow_to_pandas(arrow_table),
+            row_count=arrow_table.num_rows,
+            execution_time=timings.total_ns / 1e9,
+            sql=generated_sql.sql,
+            arrow_table=arrow_table,
+            memory_bytes=arrow_table.nbytes,
+            timings=timings,
+            spilled=any(result.spilled for result in results)
+        )
+
+    def _store_snapshot(self, cache_key: str, table, column: str) -> None:
+        """Write an incremental snapshot with its watermark, the maximum of ``column``"""
+        value = pc.max(table.column(column)).as_py() if table.num_rows else None
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            watermark = {'type': 'datetime', 'value': value.isoformat()}
+        else:
+            watermark = {'type': 'value', 'value': value}
+        watermark['column'] = column
+        metadata = dict(table.schema.metadata or {})
+        metadata[WATERMARK_METADATA_KEY] = json.dumps(watermark).encode('utf-8')
+        try:
+            self.result_cache.put(cache_key, table.replace_schema_metadata(metadata))
+        except Exception as e:
+            logger.warning(f"Failed to cache snapshot: {e}")
+
+    def _refresh_snapshot(self, snapshot, sql: str, column: str, primary_keys: List[str],
+                          timeout: Optional[float]) -> Optional[ExecutionResult]:
+        """Merge the rows past a snapshot's watermark into it
+
+        Returns:
+            ExecutionResult of the merged table, the failed delta query, or
+            None when the snapshot cannot be refreshed and a full load is needed
+        """
+        watermark = json.loads((snapshot.schema.metadata or {}).get(WATERMARK_METADATA_KEY, b'null'))
+        if not watermark or watermark['column'] != column or watermark['value'] is None:
+            return None
+        value = watermark['value']
+        if watermark['type'] == 'datetime':
+            value = datetime.datetime.fromisoformat(value)
+
+        delta = self.execute_arrow(
+            f"SELECT * FROM ({sql}) AS tlsql_delta WHERE tlsql_delta.{column} > :watermark",
+            params={'watermark': value},
+            timeout=timeout
+        )
+        if not delta.success:
+            return delta
+
+        # Rows changed since the snapshot replace their old version
+        kept = snapshot.replace_schema_metadata(None)
+        if delta.row_count and primary_keys:
+            kept = kept.join(delta.arrow_table.select(primary_keys), keys=primary_keys, join_type='left anti')
+        merged = concat_tables([kept, delta.arrow_table])
+
+        # Deletes leave no rows to fetch; compare the merged table with the source
+        key = primary_keys[0] if len(primary_keys) == 1 else None
+        check_sql = f"SELECT COUNT(*) AS row_count FROM ({sql}) AS tlsql_check"
+        if key is not None and pa.types.is_integer(merged.schema.field(key).type):
+            check_sql = f"SELECT COUNT(*) AS row_count, SUM({key}) AS key_sum FROM ({sql}) AS tlsql_check"
+        check = self.execute(check_sql, use_cache=False, timeout=timeout)
+        if not check.success:
+            logger.warning(f"Failed to verify incremental refresh: {check.error}")
+            return None
+        expected = check.data.iloc[0]
+        if int(expected['row_count']) != merged.num_rows:
+            logger.info(f"Source has {int(expected['row_count'])} rows, snapshot {merged.num_rows}; reloading")
+            return None
+        if 'key_sum' in expected and not pd.isna(expected['key_sum']):
+            if int(expected['key_sum']) != (pc.sum(merged.column(key)).as_py() or 0):
+                logger.info("Snapshot keys differ from the source; reloading")
+                return None
+
+        return dataclasses.replace(delta, data=arrow_to_pandas(merged), row_count=merged.num_rows,
+                                   sql=sql, arrow_table=merged, memory_bytes=merged.nbytes,
+                                   cache_hit=True, delta_rows=delta.row_count)
+
+    def execute_incremental(self, generated_sql, watermark: Optional[str] = None,
+                            timeout: Optional[float] = None) -> ExecutionResult:
+        """Fetch a table query by refreshing its cached snapshot with the rows that changed
+
+        The first call loads the whole result into the result cache together
+        with its watermark, the maximum of the watermark column. Later calls
+        fetch only the rows past the watermark, replace rows of the snapshot
+        with the same primary key, and append the rest. An auto-increment key
+        as watermark picks up inserts; an ``updated_at`` column picks up
+        updates too. Deletes are detected by comparing the merged row count,
+        and the sum of an integer primary key, with the source; on a mismatch
+        the result is fully reloaded. Queries with LIMIT or TABLESAMPLE, or
+        that do not project the watermark, are always fully loaded.
+
+        Args:
+            generated_sql: GeneratedSQL of a single table
+            watermark: Monotonic column, defaults to a single-column primary key
+            timeout: Deadline per query in seconds
+
+        Returns:
+            ExecutionResult with ``arrow_table`` set; ``delta_rows`` counts the
+            fetched rows when the snapshot was refreshed
+
+        Raises:
+            ValueError: No result cache configured, or no watermark column
+        """
+        if self.result_cache is None:
+            raise ValueError("Incremental refresh needs DatabaseConfig.result_cache_dir")
+        table = generated_sql.table
+        primary_keys = self.get_table_schema([table])[table]['primary_keys']
+        watermark = watermark or (primary_keys[0] if len(primary_keys) == 1 else None)
+        if watermark is None:
+            raise ValueError(f"Table {table} has no single-column primary key, pass a watermark column")
+
+        sql = generated_sql.sql
+        columns = generated_sql.columns or ['*']
+        sql_upper = sql.upper()
+        if ('*' not in columns and watermark not in columns) or ' LIMIT ' in sql_upper or 'TABLESAMPLE' in sql_upper:
+            logger.info(f"Loading {table} in full, the query cannot be refreshed incrementally")
+            return self.execute_arrow(sql, timeout=timeout)
+        if '*' not in columns and not set(primary_keys) <= set(columns):
+            primary_keys = []
+
+        start_ns = time.perf_counter_ns()
+        cache_key = ResultCache.key(sql, {'watermark': watermark}, self._cache_identity(), {})
+        snapshot = self.result_cache.get(cache_key)
+        if snapshot is not None:
+            try:
+                result = self._refresh_snapshot(snapshot, sql, watermark, primary_keys, timeout)
+            except Exception as e:
+                logger.warning(f"Failed to refresh snapshot of {table}: {e}")
+                result = None
+            if result is not None:
+                if result.success:
+                    self._store_snapshot(cache_key, result.arrow_table, watermark)
+                    result.execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+                    logger.info(f"Refreshed {table} with {result.delta_rows} rows, total {result.row_count}")
+                return result
+
+        result = self.execute_arrow(sql, timeout=timeout)
+        if result.success:
+            self._store_snapshot(cache_key, result.arrow_table, watermark)
+        return result
+
+    def _semi_join_in(self, sql: str, column: str, keys: list, timeout: Optional[float]) -> pd.DataFrame:
+        """Fetch the rows matching a key set with concurrent chunked IN lists"""
+        query = text(
+            f"SELECT * FROM ({sql}) AS tlsql_keys WHERE tlsql_keys.{column} IN :keys"
+        ).bindparams(bindparam('keys', expanding=True))
+        chunks = [keys[i:i + IN_CHUNK_KEYS] for i in range(0, len(keys), IN_CHUNK_KEYS)]
+        limiter = registry.semaphore(self._pool_key, self.config.max_concurrency)
+
+        def fetch(chunk):
+            with limiter:
+                return self.execute(query, params={'keys': chunk}, timeout=timeout)
+
+        with ThreadPoolExecutor(max_workers=min(len(chunks), self.config.max_concurrency)) as pool:
+            results = list(pool.map(fetch, chunks))
+        failed = [result for result in results if not result.success]
+        if failed:
+            raise RuntimeError(failed[0].error)
+        return concat_chunks([result.data for result in results])
+
+    def _semi_join_temp_table(self, sql: str, column: str, keys: list, timeout: Optional[float]) -> pd.DataFrame:
+        """Fetch the rows matching a key set by joining a bulk-loaded temporary table"""
+        name = f"tlsql_keys_{uuid.uuid4().hex[:12]}"
+        if all(isinstance(key, int) for key in keys):
+            key_type = 'BIGINT'
+        elif all(isinstance(key, (int, float)) for key in keys):
+            key_type = 'DOUBLE'
+        else:
+            key_type = 'VARCHAR(255)'
+        with self._connection() as conn:
+            conn.exec_driver_sql(f"CREATE TEMPORARY TABLE {name} (k {key_type} PRIMARY KEY)")
+            try:
+                insert = text(f"INSERT INTO {name} (k) VALUES (:k)")
+                for i in range(0, len(keys), FETCH_BLOCK_ROWS):
+                    conn.execute(insert, [{'k': key} for key in keys[i:i + FETCH_BLOCK_ROWS]])
+                with self._deadline(conn, timeout) as deadline:
+                    try:
+                        result = self._run(
+                            conn, f"SELECT tlsql_rows.* FROM ({sql}) AS tlsql_rows "
+                                  f"JOIN {name} ON tlsql_rows.{column} = {name}.k",
+                            None, timeout
+                        )
+                        columns = list(result.keys())
+                        rows = result.fetchall()
+                    except Exception as e:
+                        self._check_timeout(e, deadline, timeout)
+                        raise
+            finally:
+                conn.exec_driver_sql(f"DROP TABLE {name}")
+        return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+    def _semi_join_filter(self, sql: str, column: str, keys: list, timeout: Optional[float]) -> pd.DataFrame:
+        """Stream the whole result and keep the rows matching a key set"""
+        key_index = pd.Index(keys)
+        chunks = []
+        for chunk in self.execute_stream(sql, timeout=timeout):
+            # get_indexer reuses the hash table built for key_index on the first chunk
+            chunks.append(chunk[key_index.get_indexer(chunk[column]) >= 0])
+        return concat_chunks(chunks).reset_index(drop=True)
+
+    def execute_semi_join(self, generated_sql, column: str, keys, strategy: str = 'auto',
+                          timeout: Optional[float] = None) -> ExecutionResult:
+        """Fetch only the rows of a query whose ``column`` is in a key set
+
+        For joins across sources that one SQL statement cannot express, such
+        as users in MySQL and ratings in Parquet on DuckDB, the key set of the
+        first result is pushed into the query on the second source:
+
+            users = mysql_executor.execute(users_sql.sql)
+            ratings = duckdb_executor.execute_semi_join(ratings_sql, 'userID', users.data['userID'])
+
+        Strategies are 'in' (concurrent IN lists of ``IN_CHUNK_KEYS`` keys),
+        'temp_table' (keys bulk loaded into a temporary table and joined on
+        the server) and 'filter' (the result is streamed and filtered on the
+        client against a hash index of the keys). 'auto' picks them in that
+        order as the key set grows, see ``IN_LIST_MAX_KEYS`` and
+        ``TEMP_TABLE_MAX_KEYS``.
+
+        Args:
+            generated_sql: GeneratedSQL or SQL string without parameters
+            column: Column of the query matched against the keys
+            keys: Key values; nulls and duplicates are dropped
+            strategy: 'auto', 'in', 'temp_table' or 'filter'
+            timeout: Deadline per query in seconds
+
+        Returns:
+            ExecutionResult with the matching rows
+        """
+        if strategy not in ('auto', 'in', 'temp_table', 'filter'):
+            raise ValueError(f"Unknown semi-join strategy: {strategy}")
+        sql = str(getattr(generated_sql, 'sql', generated_sql))
+        timeout = self.config.query_timeout if timeout is None else timeout
+        key_values = pd.unique(pd.Series(keys).dropna()).tolist()
+        if strategy == 'auto':
+            if len(key_values) <= IN_LIST_MAX_KEYS:
+                strategy = 'in'
+            elif len(key_values) <= TEMP_TABLE_MAX_KEYS:
+                strategy = 'temp_table'
+            else:
+                strategy = 'filter'
+        logger.info(f"Pushing {len(key_values)} keys on {column} into the query as '{strategy}'")
+
+        start_ns = time.perf_counter_ns()
+        try:
+            if not key_values:
+                result = self.execute(f"SELECT * FROM ({sql}) AS tlsql_keys WHERE 1 = 0", timeout=timeout)
+                if not result.success:
+                    raise RuntimeError(result.error)
+                df = result.data
+            elif strategy == 'in':
+                df = self._semi_join_in(sql, column, key_values, timeout)
+            elif strategy == 'temp_table':
+                df = self._semi_join_temp_table(sql, column, key_values, timeout)
+            else:
+                df = self._semi_join_filter(sql, column, key_values, timeout)
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            return self._notify(ExecutionResult(
+                success=True,
+                data=df,
+                row_count=len(df),
+                execution_time=execution_time,
+                sql=sql,
+                memory_bytes=approx_memory_bytes(df)
+            ))
+
+        except Exception as e:
+            logger.error(f"Query failed: {e}")
+            return self._notify(ExecutionResult(
+                success=False,
+                error=str(e),
+                execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                sql=sql,
+                timed_out=isinstance(e, QueryTimeout)
+            ))
+
+    def estimate(self, sql_list: List) -> List:
+        """Attach EXPLAIN-based cost estimates to generated queries
+
+        Sets ``estimated_rows``, ``estimated_bytes`` and ``full_scan`` on each
+        GeneratedSQL and logs a warning for full scans on filtered queries.
+        Estimates are approximate and only meant for ranking queries: MySQL's
+        come from the optimizer, SQLite's from table sizes and the query plan.
+
+        Args:
+            sql_list: GeneratedSQL objects, e.g. ``ConversionResult.sql_list``
+
+        Returns:
+            The same list, estimated in place
+        """
+        estimates = self.backend.estimate(self, sql_list)
+        for gen_sql, (rows, size, full_scan, hint) in zip(sql_list, estimates):
+            gen_sql.estimated_rows = rows
+            gen_sql.estimated_bytes = size
+            gen_sql.full_scan = full_scan
+
+            if full_scan and gen_sql.condition:
+                logger.warning(
+                    f"Full scan of {gen_sql.table} (~{rows} rows) "
+                    f"for predicate '{gen_sql.condition}': {hint}"
+                )
+
+        return sql_list
+
+    def _schedule(self, sql_list: List) -> List[int]:
+        """Return execution order for a batch, largest estimated scan first"""
+        def cost(i):
+            item = sql_list[i]
+            return getattr(item, 'estimated_bytes', None) or getattr(item, 'estimated_rows', None) or 0
+
+        return sorted(range(len(sql_list)), key=cost, reverse=True)
+
+    def _execute_in_scope(self, item, scope: _CancelScope, limiter,
+                          timeout: Optional[float] = None) -> ExecutionResult:
+        """Run one batch query on a worker thread under the database limit"""
+        sql = getattr(item, 'sql', item)
+        with limiter:
+            if scope.cancelled:
+                return ExecutionResult(success=False, error="Cancelled", sql=str(sql), cancelled=True)
+            self._local.scope = scope
+            try:
+                if self.config.memory_budget is not None and getattr(item, 'table', None):
+                    result = self.execute_arrow(sql, timeout=timeout)
+                elif self.config.typed_fetch and getattr(item, 'table', None):
+                    result = self.execute_typed(sql, item.table, timeout=timeout)
+                else:
+                    result = self.execute(sql, timeout=timeout)
+            finally:
+                self._local.scope = None
+        if not result.success and scope.cancelled:
+            result.cancelled = True
+        return result
+
+    def execute_batch(self, sql_list: List, max_workers: Optional[int] = None,
+                      error_policy: str = 'collect',
+                      timeout: Optional[float] = None) -> List[ExecutionResult]:
+        """Execute multiple SQL statements concurrently
+
+        Each query runs on its own pooled connection. Concurrency is bounded by
+        ``max_workers`` and by ``DatabaseConfig.max_concurrency``, which is shared
+        by all executors of the same database. GeneratedSQL objects are fetched
+        through :meth:`execute_arrow` when a memory budget is configured, else
+        through :meth:`execute_typed` when typed fetch is enabled.
+
+        Args:
+            sql_list: SQL strings or GeneratedSQL objects. Estimated GeneratedSQL
+                objects (see :meth:`estimate`) start largest scan first.
+            max_workers: Worker threads, defaults to ``max_concurrency``
+            error_policy: 'collect' runs every query and returns all errors;
+                'fail_fast' cancels queued and running queries after the first failure
+            timeout: Deadline per query in seconds, defaults to ``DatabaseConfig.query_timeout``
+
+        Returns:
+            ExecutionResult list in input order
+        """
+        if error_policy not in ('collect', 'fail_fast'):
+            raise ValueError(f"Unknown error policy: {error_policy}")
         logger.info(f"Executing batch of {len(sql_list)} SQL statements")
 
-        results = []
-        for i, sql in enumerate(sql_list, 1):
-            logger.info(f"Executing SQL {i}/{len(sql_list)}")
-            result = self.execute(sql)
-            results.append(result)
+        results = [None] * len(sql_list)
+        if not sql_list:
+            return results
+
+        if not self.is_connected():
+            self.connect()
+        scope = _CancelScope()
+        limiter = registry.semaphore(self._pool_key, self.config.max_concurrency)
+        workers = min(max_workers or self.config.max_concurrency, len(sql_list))
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for index in self._schedule(sql_list):
+                item = sql_list[index]
+                futures[pool.submit(self._execute_in_scope, item, scope, limiter, timeout)] = index
+
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                done = [future for future in done if not future.cancelled()]
+                for future in done:
+                    results[futures[future]] = future.result()
+                failed = any(not results[futures[future]].success for future in done)
+                if failed and error_policy == 'fail_fast' and not scope.cancelled:
+                    logger.warning("Batch query failed, cancelling outstanding queries")
+                    for future in pending:
+                        future.cancel()
+                    scope.cancel(self._cancel_query)
+
+            for future, index in futures.items():
+                if future.cancelled():
+                    item = sql_list[index]
+                    results[index] = ExecutionResult(
+                        success=False, error="Cancelled", sql=str(getattr(item, 'sql', item)), cancelled=True
+                    )
 
         success_count = sum(1 for r in results if r.success)
         fail_count = len(results) - success_count
@@ -185,27 +1458,285 @@ class DatabaseExecutor:
 
         return results
 
-    def execute_with_dict(self, sql_dict: Dict[str, str]) -> Dict[str, ExecutionResult]:
-        """Execute labeled SQL dictionary"""
-        logger.info(f"Executing {len(sql_dict)} labeled SQL statements")
+    def _statement_result(self, cursor, sql: str, start_ns: int, timings: QueryTimings) -> ExecutionResult:
+        """Read the current result set of a DB-API cursor into an ExecutionResult"""
+        fetch_start = time.perf_counter_ns()
+        timings.first_row_ns = fetch_start - start_ns
+        rows = cursor.fetchall() if cursor.description else []
+        columns = [column[0] for column in cursor.description or []]
+        decode_start = time.perf_counter_ns()
+        timings.fetch_ns = decode_start - fetch_start
+        df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+        end_ns = time.perf_counter_ns()
+        timings.decode_ns = end_ns - decode_start
+        timings.total_ns = end_ns - start_ns
+        return ExecutionResult(
+            success=True,
+            data=df,
+            row_count=len(df),
+            execution_time=timings.total_ns / 1e9,
+            sql=sql,
+            memory_bytes=approx_memory_bytes(df),
+            timings=timings
+        )
+
+    def _multi_request(self, sqls: List[str], timeout: Optional[float], connect_args: dict) -> List[ExecutionResult]:
+        """Send statements as one multi-statement request
 
-        results = {}
-        for label, sql in sql_dict.items():
-            logger.info(f"Executing SQL for: {label}")
-            result = self.execute(sql)
-            results[label] = result
+        The server stops at the first failing statement, so the returned list
+        ends with that statement's failure and may be shorter than ``sqls``.
+        """
+        multi_key = f"{self._pool_key}|multi"
+        registry.get_engine(
+            multi_key,
+            self.backend.url(),
+            connect_args=connect_args,
+            on_connect=self.backend.on_connect,
+            **self.backend.engine_kwargs()
+        )
+        script = ';\n'.join(self.backend.limit_sql(sql, timeout) if timeout is not None else sql for sql in sqls)
 
+        results = []
+        wait_start = time.perf_counter_ns()
+        with registry.connect(multi_key) as conn, self._deadline(conn, timeout) as deadline:
+            start_ns = time.perf_counter_ns()
+            pool_wait_ns = start_ns - wait_start
+            cursor = conn.connection.dbapi_connection.cursor()
+            try:
+                cursor.execute(script)
+                while True:
+                    timings = QueryTimings(pool_wait_ns=pool_wait_ns if not results else 0)
+                    results.append(self._statement_result(cursor, sqls[len(results)], start_ns, timings))
+                    start_ns = time.perf_counter_ns()
+                    if len(results) == len(sqls) or not cursor.nextset():
+                        break
+            except Exception as e:
+                # The rest of the request was discarded by the server; close the cursor
+                # while its connection is still open, then don't reuse the connection
+                try:
+                    cursor.close()
+                except Exception as close_error:
+                    logger.debug(f"Failed to close cursor of a failed request: {close_error}")
+                conn.invalidate()
+                try:
+                    self._check_timeout(e, deadline, timeout)
+                except QueryTimeout as timeout_error:
+                    e = timeout_error
+                results.append(ExecutionResult(
+                    success=False,
+                    error=str(e),
+                    execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                    sql=sqls[len(results)],
+                    timed_out=isinstance(e, QueryTimeout)
+                ))
+            else:
+                cursor.close()
         return results
 
-    def get_table_info(self, table_name: str) -> pd.DataFrame:
-        """Get column info for a table"""
+    def _sequential_request(self, sqls: List[str], timeout: Optional[float]) -> List[ExecutionResult]:
+        """Run statements one after another on a single pooled connection"""
+        results = []
+        wait_start = time.perf_counter_ns()
+        with self._connection() as conn:
+            pool_wait_ns = time.perf_counter_ns() - wait_start
+            for sql in sqls:
+                start_ns = time.perf_counter_ns()
+                timings = QueryTimings(pool_wait_ns=pool_wait_ns if not results else 0)
+                try:
+                    with self._deadline(conn, timeout) as deadline:
+                        try:
+                            result = self._run(conn, sql, None, timeout)
+                            columns, rows = [], []
+                            fetch_start = time.perf_counter_ns()
+                            timings.first_row_ns = fetch_start - start_ns
+                            if result.returns_rows:
+                                columns = list(result.keys())
+                                rows = result.fetchall()
+                            decode_start = time.perf_counter_ns()
+                            timings.fetch_ns = decode_start - fetch_start
+                        except Exception as e:
+                            self._check_timeout(e, deadline, timeout)
+                            raise
+                    df = pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+                    end_ns = time.perf_counter_ns()
+                    timings.decode_ns = end_ns - decode_start
+                    timings.total_ns = end_ns - start_ns
+                    results.append(ExecutionResult(
+                        success=True,
+                        data=df,
+                        row_count=len(df),
+                        execution_time=timings.total_ns / 1e9,
+                        sql=sql,
+                        memory_bytes=approx_memory_bytes(df),
+                        timings=timings
+                    ))
+                except Exception as e:
+                    results.append(ExecutionResult(
+                        success=False,
+                        error=str(e),
+                        execution_time=(time.perf_counter_ns() - start_ns) / 1e9,
+                        sql=sql,
+                        timed_out=isinstance(e, QueryTimeout)
+                    ))
+        return results
+
+    def execute_multi(self, sql_list: List, timeout: Optional[float] = None) -> List[ExecutionResult]:
+        """Execute several SELECTs in one client/server round trip
 
-        if self.config.db_type == 'mysql':
-            sql = f"DESCRIBE {table_name}"
+        On MySQL the statements are sent as one request over a connection with
+        ``CLIENT.MULTI_STATEMENTS`` (kept in a separate pool, so ordinary
+        queries never run with multi-statements enabled) and the result sets
+        are read back with ``nextset``. When a statement fails, the server
+        skips the rest of the request; the failure is reported for that
+        statement and the remaining statements are sent as a new request.
+        Embedded databases run the statements in order on one connection.
+
+        Args:
+            sql_list: SQL strings or GeneratedSQL objects, without parameters
+            timeout: Deadline in seconds for each request, defaults to
+                ``DatabaseConfig.query_timeout``
+
+        Returns:
+            ExecutionResult list in input order
+        """
+        if not self.is_connected():
+            self.connect()
+        timeout = self.config.query_timeout if timeout is None else timeout
+        sqls = [str(getattr(item, 'sql', item)).strip().rstrip(';') for item in sql_list]
+        logger.info(f"Executing {len(sqls)} statements in one request")
+
+        connect_args = self.backend.multi_statement_connect_args()
+        if connect_args is None:
+            results = self._sequential_request(sqls, timeout)
         else:
-            raise ValueError(f"Unsupported database type: {self.config.db_type}")
+            results = []
+            while len(results) < len(sqls):
+                results.extend(self._multi_request(sqls[len(results):], timeout, connect_args))
+
+        return [self._notify(result) for result in results]
+
+    def choose_plan(self, conversion) -> str:
+        """Compare the estimated transfer of the join plan and the per-table queries
+
+        Advisory only: the join plan returns different data (see
+        :meth:`execute_conversion`), so it is never chosen automatically.
+
+        Args:
+            conversion: ConversionResult, generated with ``join_plan=True`` for
+                the join plan to be considered
+
+        Returns:
+            'join' when the join is estimated to ship fewer bytes, else 'per_table'
+        """
+        if conversion.join_sql is None:
+            return 'per_table'
+
+        self.estimate(conversion.sql_list + [conversion.join_sql])
+        join_bytes = conversion.join_sql.estimated_bytes
+        per_table_bytes = sum(gen_sql.estimated_bytes or 0 for gen_sql in conversion.sql_list)
+        plan = 'join' if join_bytes and join_bytes < per_table_bytes else 'per_table'
+        logger.info(
+            f"Plan '{plan}': join ~{join_bytes} bytes vs per-table ~{per_table_bytes} bytes"
+        )
+        return plan
+
+    def execute_conversion(self, conversion, plan: str = 'per_table') -> Dict[str, ExecutionResult]:
+        """Execute a ConversionResult and return one result per table
+
+        The join plan is an explicit opt-in with different results: one
+        server-side join is run and split back into per-table frames
+        (deduplicated on primary keys). The driving table's filter is pushed
+        into the joined tables, so they only contain rows related to the
+        filtered driving rows; e.g. ratings of other users and unrated movies
+        are missing, unlike with per-table queries. For conversions with a
+        join plan both plans return the schema-derived dtypes (see
+        :meth:`_split_join_result`).
+
+        Args:
+            conversion: ConversionResult from ``tlsql.convert``
+            plan: 'per_table' or 'join'
+
+        Returns:
+            Dict mapping table name to ExecutionResult
+        """
+        if plan not in ('per_table', 'join'):
+            raise ValueError(f"Unknown plan: {plan}")
+        if plan == 'join' and conversion.join_sql is None:
+            raise ValueError("Conversion has no join plan; convert with join_plan=True and a schema")
+
+        if plan == 'per_table':
+            if self.config.multi_statement:
+                results = self.execute_multi(conversion.sql_list)
+            else:
+                results = self.execute_batch(conversion.sql_list)
+            if conversion.join_sql is not None:
+                # Same dtypes as the join plan, so either plan's frames can be used
+                for gen_sql, result in zip(conversion.sql_list, results):
+                    if result.success and gen_sql.table:
+                        apply_dtypes(result.data, self._dtypes_for(gen_sql.table, compact=self.config.typed_fetch))
+            return {gen_sql.table: result for gen_sql, result in zip(conversion.sql_list, results)}
+
+        join_result = self.execute(conversion.join_sql.sql)
+        if not join_result.success:
+            return {table: join_result for table in conversion.tables}
+
+        primary_keys = self.get_table_schema(conversion.tables) if conversion.tables else {}
+        requested = {gen_sql.table: gen_sql.columns for gen_sql in conversion.sql_list}
+        return {
+            table: self._split_join_result(
+                join_result, table, primary_keys[table]['primary_keys'], requested.get(table)
+            )
+            for table in conversion.tables
+        }
+
+    def _split_join_result(self, join_result: ExecutionResult, table: str, primary_keys: List[str],
+                           columns: Optional[List[str]] = None) -> ExecutionResult:
+        """Project one table's columns out of a join result
+
+        Rows are identified by the primary key the join plan always selects:
+        rows without a key are NULL padding of unmatched joins and repeated
+        keys are join fan-out. Columns get the schema-derived dtypes, compact
+        with ``DatabaseConfig.typed_fetch`` and else wide (Int64, float64).
+
+        Args:
+            join_result: Result of the join plan
+            table: Table to project
+            primary_keys: Primary key columns of the table
+            columns: Columns of the table's per-table query, None or '*' for all
+        """
+        prefix = f"{table}__"
+        aliases = [col for col in join_result.data.columns if col.startswith(prefix)]
+        df = join_result.data[aliases]
+        df.columns = [col[len(prefix):] for col in aliases]
+
+        if not primary_keys or any(key not in df.columns for key in primary_keys):
+            raise ValueError(f"Join result does not carry the primary key of {table}")
+        df = df.dropna(subset=primary_keys).drop_duplicates(subset=primary_keys).reset_index(drop=True)
+        if columns and '*' not in columns:
+            df = df[columns]
+        # NULL padding turned integer columns into floats; restore the schema types
+        df = apply_dtypes(df, self._dtypes_for(table, compact=self.config.typed_fetch))
+
+        return ExecutionResult(
+            success=True,
+            data=df,
+            row_count=len(df),
+            execution_time=join_result.execution_time,
+            sql=join_result.sql
+        )
+
+    def execute_with_dict(self, sql_dict: Dict[str, str], max_workers: Optional[int] = None,
+                          error_policy: str = 'collect') -> Dict[str, ExecutionResult]:
+        """Execute labeled SQL dictionary concurrently, see :meth:`execute_batch`"""
+        logger.info(f"Executing {len(sql_dict)} labeled SQL statements")
 
-        result = self.execute(sql)
+        labels = list(sql_dict)
+        results = self.execute_batch([sql_dict[label] for label in labels], max_workers, error_policy)
+        return dict(zip(labels, results))
+
+    def get_table_info(self, table_name: str) -> pd.DataFrame:
+        """Get column info for a table"""
+        result = self.execute(self.backend.table_info_sql(table_name))
         if result.success:
             return result.data
         else:
@@ -213,12 +1744,7 @@ class DatabaseExecutor:
 
     def list_tables(self) -> List[str]:
         """List all tables in database"""
-        if self.config.db_type == 'mysql':
-            sql = "SHOW TABLES"
-        else:
-            raise ValueError(f"Unsupported database type: {self.config.db_type}")
-
-        result = self.execute(sql)
+        result = self.execute(self.backend.list_tables_sql())
         if result.success:
             return result.data.iloc[:, 0].tolist()
         else:
@@ -226,81 +1752,48 @@ class DatabaseExecutor:
 
     def get_primary_keys(self, table_name: str) -> List[str]:
         """Retrieve primary keys for table"""
-        if self.config.db_type == 'mysql':
-            sql = f"""
-                SELECT column_name
-                FROM information_schema.key_column_usage
-                WHERE table_schema = '{self.config.database}'
-                AND table_name = '{table_name}'
-                AND constraint_name = 'PRIMARY'
-            """
-        else:
-            raise ValueError(f"Unsupported database type: {self.config.db_type}")
-
-        result = self.execute(sql)
-        if not result.success:
-            logger.warning(f"Failed to get primary keys for {table_name}: {result.error}")
-            return []
-
-        return result.data.iloc[:, 0].tolist()
+        return self.get_table_schema([table_name])[table_name]['primary_keys']
 
     def get_foreign_keys(self, table_name: str) -> Dict[str, tuple]:
         """Retrieve foreign keys"""
-        if self.config.db_type == 'mysql':
-            sql = f"""
-                SELECT column_name, referenced_table_name, referenced_column_name
-                FROM information_schema.key_column_usage
-                WHERE table_schema = '{self.config.database}'
-                AND table_name = '{table_name}'
-                AND referenced_table_name IS NOT NULL
-            """
-        else:
-            raise ValueError(f"Unsupported database type: {self.config.db_type}")
+        return self.get_table_schema([table_name])[table_name]['foreign_keys']
 
-        result = self.execute(sql)
-        if not result.success:
-            logger.warning(f"Failed to get foreign keys for {table_name}: {result.error}")
-            return {}
+    def get_table_schema(self, table_names: List[str], refresh: bool = False) -> Dict[str, Dict]:
+        """Get schema info for multiple tables
 
-        fk_dict = {}
+        Tables not cached within ``DatabaseConfig.schema_ttl`` are read together,
+        one bulk query per metadata kind, so the whole catalog costs a fixed
+        number of round trips regardless of the table count.
 
-        for _, row in result.data.iterrows():
-            if 'column_name' in result.data.columns:
-                fk_col = row['column_name']
-                ref_table = row.get('referenced_table_name', None)
-                ref_col = row.get('referenced_column_name', None)
-            else:
-                fk_col = row.iloc[0]
-                ref_table = row.iloc[1] if len(row) > 1 else None
-                ref_col = row.iloc[2] if len(row) > 2 else None
-
-            if fk_col and ref_table and ref_col:
-                fk_dict[fk_col] = (ref_table, ref_col)
-
-        return fk_dict
-
-    def get_table_schema(self, table_names: List[str]) -> Dict[str, Dict]:
-        """Get schema info for multiple tables"""
-        schema = {}
-        for table_name in table_names:
-            table_info = self.get_table_info(table_name)
-            if table_info is not None and not table_info.empty:
-                if self.config.db_type == 'mysql':
-                    columns = table_info['Field'].tolist()
-            else:
-                columns = []
+        Args:
+            table_names: Tables to describe
+            refresh: Re-read every requested table, ignoring the cache
+
+        Returns:
+            Table name -> {'columns', 'types', 'primary_keys', 'foreign_keys'}
+        """
+        now = time.monotonic()
+        with self._schema_lock:
+            stale = [
+                table for table in dict.fromkeys(table_names)
+                if refresh or table not in self._schema_cache
+                or now - self._schema_cache[table][0] > self.config.schema_ttl
+            ]
 
-            primary_keys = self.get_primary_keys(table_name)
-            foreign_keys = self.get_foreign_keys(table_name)
+        if stale:
+            fetched = self.backend.schema(self, stale)
+            with self._schema_lock:
+                for table in stale:
+                    self._schema_cache[table] = (now, fetched.get(table, empty_schema()))
 
-            schema[table_name] = {
-                'columns': columns,
-                'primary_keys': primary_keys,
-                'foreign_keys': foreign_keys
-            }
+        with self._schema_lock:
+            return {table: dict(self._schema_cache[table][1]) for table in table_names}
 
-        return schema
+    def refresh_schema(self) -> None:
+        """Drop the cached catalog so the next lookup reads it again"""
+        with self._schema_lock:
+            self._schema_cache.clear()
 
     def __del__(self):
-        """Ensure connection closed on destruction"""
+        """Release the pooled engine on destruction"""
         self.disconnect()
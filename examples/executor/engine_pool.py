@@ -0,0 +1,176 @@
+"""Process-wide SQLAlchemy engine registry shared by database executors"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, Optional
+
+try:
+    from sqlalchemy import create_engine, event
+    SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    SQLALCHEMY_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolStats:
+    """Connection pool metrics for one engine"""
+
+    pool_size: int = 0  # Configured persistent connections
+    max_overflow: int = 0  # Configured extra connections
+    checked_out: int = 0  # Connections currently in use
+    overflow: int = 0  # Overflow connections currently open
+    checkouts: int = 0  # Total connection acquisitions
+    total_wait_time: float = 0.0  # Seconds spent waiting for connections
+    max_wait_time: float = 0.0  # Longest single wait in seconds
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the pool capacity currently checked out"""
+        capacity = self.pool_size + max(self.max_overflow, 0)
+        return self.checked_out / capacity if capacity else 0.0
+
+    @property
+    def avg_wait_time(self) -> float:
+        """Average seconds spent waiting per acquisition"""
+        return self.total_wait_time / self.checkouts if self.checkouts else 0.0
+
+
+class EngineRegistry:
+    """Registry of pooled engines keyed by connection identity
+
+    Engines are created once per key and reused by every executor in the
+    process, so repeated executor construction does not pay a new TCP/auth
+    handshake.
+    """
+
+    def __init__(self):
+        self._engines = {}
+        self._stats: Dict[str, PoolStats] = {}
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def get_engine(self, key: str, url: str, pool_size: int = 5, max_overflow: int = 10,
+                   pool_pre_ping: bool = True, pool_recycle: int = 3600, pool_timeout: float = 30.0,
+                   warmup: int = 0, connect_args: Optional[dict] = None,
+                   on_connect: Optional[Callable] = None, **engine_kwargs):
+        """Return the engine for a key, creating and warming it up on first use
+
+        Args:
+            key: Connection identity, e.g. derived from a DatabaseConfig
+            url: SQLAlchemy connection URL
+            pool_size: Persistent connections kept in the pool
+            max_overflow: Extra connections allowed under load
+            pool_pre_ping: Test connections before handing them out
+            pool_recycle: Seconds after which connections are replaced
+            pool_timeout: Seconds to wait for a free connection
+            warmup: Connections to open eagerly when the engine is created
+            connect_args: Extra DB-API connect arguments
+            on_connect: Called with each new DB-API connection and its pool record
+            **engine_kwargs: Further ``create_engine`` keyword arguments
+
+        Returns:
+            SQLAlchemy engine
+        """
+        if not SQLALCHEMY_AVAILABLE:
+            raise ImportError("SQLAlchemy is not installed.")
+
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                return engine
+
+            engine = create_engine(
+                url,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_pre_ping=pool_pre_ping,
+                pool_recycle=pool_recycle,
+                pool_timeout=pool_timeout,
+                connect_args=connect_args or {},
+                **engine_kwargs
+            )
+            if on_connect is not None:
+                event.listen(engine, 'connect', on_connect)
+            self._engines[key] = engine
+            self._stats[key] = PoolStats(pool_size=pool_size, max_overflow=max_overflow)
+            logger.info(f"Created pooled engine (size={pool_size}, overflow={max_overflow})")
+
+        if warmup:
+            self.warm_up(key, warmup)
+        return engine
+
+    def warm_up(self, key: str, n: int) -> None:
+        """Open and return ``n`` connections so they are ready in the pool"""
+        engine = self._engines[key]
+        connections = []
+        try:
+            for _ in range(n):
+                connections.append(engine.connect())
+        finally:
+            for conn in connections:
+                conn.close()
+        logger.info(f"Warmed up {len(connections)} connections")
+
+    @contextmanager
+    def connect(self, key: str) -> Iterator:
+        """Borrow a connection, recording the time spent waiting for it
+
+        Yields:
+            SQLAlchemy connection, returned to the pool on exit
+        """
+        engine = self._engines[key]
+        start_time = time.perf_counter()
+        conn = engine.connect()
+        wait_time = time.perf_counter() - start_time
+
+        stats = self._stats[key]
+        with self._lock:
+            stats.checkouts += 1
+            stats.total_wait_time += wait_time
+            stats.max_wait_time = max(stats.max_wait_time, wait_time)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def semaphore(self, key: str, limit: int) -> threading.BoundedSemaphore:
+        """Return the per-database concurrency limiter shared by all executors
+
+        Args:
+            key: Connection identity
+            limit: Maximum concurrent queries, used when the limiter is created
+        """
+        with self._lock:
+            if key not in self._semaphores:
+                self._semaphores[key] = threading.BoundedSemaphore(limit)
+            return self._semaphores[key]
+
+    def stats(self, key: str) -> PoolStats:
+        """Return current metrics for the engine of a key"""
+        stats = self._stats[key]
+        pool = self._engines[key].pool
+        if hasattr(pool, 'checkedout'):
+            stats.checked_out = pool.checkedout()
+        if hasattr(pool, 'overflow'):
+            stats.overflow = max(pool.overflow(), 0)
+        return stats
+
+    def dispose(self, key: Optional[str] = None) -> None:
+        """Dispose one engine, or every engine when no key is given"""
+        with self._lock:
+            keys = [key] if key is not None else list(self._engines)
+            for k in keys:
+                engine = self._engines.pop(k, None)
+                self._stats.pop(k, None)
+                if engine is not None:
+                    engine.dispose()
+
+
+# Shared by every DatabaseExecutor in the process
+registry = EngineRegistry()
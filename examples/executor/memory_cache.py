@@ -0,0 +1,133 @@
+"""In-process result cache bounded by result bytes, with single-flight execution"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+
+class MemoryResultCache:
+    """Byte-bounded LRU cache of ExecutionResults with TTL and single-flight
+
+    Entries are charged their ``memory_bytes``; the least recently used are
+    evicted when the total exceeds ``max_bytes`` and any entry older than
+    ``ttl`` seconds is treated as a miss. While a key is being computed,
+    further callers for the same key wait for that computation and share its
+    result instead of issuing their own query. Shared results must be treated
+    as read-only.
+
+    Attributes:
+        max_bytes: Upper bound on the total size of cached results
+        ttl: Seconds an entry stays valid
+    """
+
+    def __init__(self, max_bytes: int, ttl: float = 60.0):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()  # Key -> (expires at, size, result)
+        self._inflight: Dict[str, Future] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Return the cached result of a key, or None on a miss or expired entry"""
+        with self._lock:
+            return self._get_locked(key)
+
+    def _get_locked(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, size, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self._bytes -= size
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: str, result, size: int) -> None:
+        """Store a result charged ``size`` bytes, evicting least recently used entries"""
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (time.monotonic() + self.ttl, size, result)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def get_or_compute(self, key: str, compute: Callable[[], object],
+                       size_of: Callable[[object], Optional[int]]) -> Tuple[object, bool]:
+        """Return the result of a key, computing it at most once across threads
+
+        Args:
+            key: Cache key
+            compute: Produces the result on a miss
+            size_of: Bytes to charge for a result, None to leave it uncached
+
+        Returns:
+            (result, shared): shared is True when the result came from the cache
+            or from another caller's in-flight computation
+        """
+        with self._lock:
+            result = self._get_locked(key)
+            if result is not None:
+                return result, True
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result(), True
+
+        try:
+            result = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            size = size_of(result)
+            if size is not None:
+                self.put(key, result, size)
+            return result, False
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently charged to cached results"""
+        return self._bytes
+
+    def __len__(self) -> int:
+        """Return number of cached results"""
+        return len(self._entries)
+
+
+_shared_caches: Dict[str, MemoryResultCache] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_cache(key: str, max_bytes: int, ttl: float) -> MemoryResultCache:
+    """Return the process-wide cache for a connection identity, creating it on first use
+
+    Executors of the same database share one cache, so identical queries from
+    different workers are deduplicated too.
+    """
+    with _shared_lock:
+        if key not in _shared_caches:
+            _shared_caches[key] = MemoryResultCache(max_bytes, ttl=ttl)
+        return _shared_caches[key]
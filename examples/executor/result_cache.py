@@ -0,0 +1,165 @@
+"""Content-addressed on-disk cache of query results stored as Arrow IPC files"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from typing import Dict, List
+
+try:
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+# Tables read by a statement, used to look up their fingerprints
+_TABLE_PATTERN = re.compile(r'\b(?:FROM|JOIN)\s+[`"]?(\w+)[`"]?', re.IGNORECASE)
+
+
+def referenced_tables(sql: str) -> List[str]:
+    """Return the sorted names of tables following FROM/JOIN in a statement"""
+    return sorted(set(_TABLE_PATTERN.findall(sql)))
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace so formatting changes do not change the cache key"""
+    return ' '.join(sql.split())
+
+
+class ResultCache:
+    """On-disk cache of result tables keyed by query and table state
+
+    The key hashes the normalized SQL, its parameters, the connection identity
+    and a fingerprint of every table the query reads (see
+    ``Backend.table_fingerprints``). Any write to a table changes its
+    fingerprint and therefore the key, so stale entries are never served;
+    they age out through the size bound. Files are Feather (Arrow IPC) and
+    hits are read through a memory map, so cached data is paged in by the OS
+    instead of being copied through Python.
+
+    Attributes:
+        directory: Cache directory
+        max_bytes: Upper bound on the total size of cached files
+        compression: Feather compression, 'uncompressed', 'lz4' or 'zstd'.
+            Uncompressed files are mapped zero-copy; compressed files are
+            smaller but decompressed on read.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 10 * 1024 ** 3, compression: str = 'uncompressed'):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is not installed.")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.compression = compression
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(sql: str, params, identity: str, fingerprints: Dict[str, str]) -> str:
+        """Compute the content address of a query result
+
+        Args:
+            sql: SQL string
+            params: Bound parameters
+            identity: Connection identity, e.g. host, port and database
+            fingerprints: Table name -> fingerprint of the current table state
+
+        Returns:
+            Hex digest
+        """
+        key_data = json.dumps(
+            {'sql': normalize_sql(sql), 'params': params, 'identity': identity, 'tables': fingerprints},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}.arrow")
+
+    def get(self, key: str):
+        """Return the cached pyarrow Table for a key, or None on a miss"""
+        path = self._path(key)
+        try:
+            table = feather.read_table(path, memory_map=True)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Dropping unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            # Recency is best effort, the entry may have just been pruned
+            pass
+        return table
+
+    def put(self, key: str, table) -> None:
+        """Store a result table and prune least recently used files over the size bound"""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write next to the target and rename, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        os.close(fd)
+        try:
+            feather.write_feather(table, tmp_path, compression=self.compression)
+            os.replace(tmp_path, path)
+        except Exception:
+            self._remove(tmp_path)
+            raise
+
+        self.prune()
+
+    def _entries(self) -> List[tuple]:
+        """Return (mtime, size, path) of cached files"""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith('.arrow'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def prune(self) -> None:
+        """Delete least recently used files until the cache fits ``max_bytes``"""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all cached files"""
+        for _, _, path in self._entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def __len__(self) -> int:
+        """Return number of cached results"""
+        return len(self._entries())
+
+
+def file_fingerprint(path: str) -> str:
+    """Fingerprint a file by modification time and size"""
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
@@ -0,0 +1,293 @@
+"""Read routing across a primary database and its replicas"""
+
+import dataclasses
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from tlsql.examples.executor.db_executor import DatabaseConfig, DatabaseExecutor, ExecutionResult
+
+
+logger = logging.getLogger(__name__)
+
+# Statements that only read and may run on a replica
+_READ_PATTERN = re.compile(r'^\s*(SELECT|WITH)\b', re.IGNORECASE)
+
+# Weight of the newest query in the per-database latency average
+LATENCY_SMOOTHING = 0.2
+
+ROUTING_POLICIES = ('least_outstanding', 'latency')
+
+
+@dataclass
+class NodeStats:
+    """Routing state of one database"""
+
+    name: str  # 'primary' or 'replica<i>'
+    outstanding: int = 0  # Queries currently running
+    latency: Optional[float] = None  # Exponentially weighted mean query time in seconds
+    healthy: bool = True  # Passed its last health check
+    lag: Optional[float] = None  # Replication lag in seconds at the last health check
+    lag_unknown: bool = False  # Replication lag could not be read, e.g. without REPLICATION CLIENT
+    checked_at: Optional[float] = None  # Monotonic time of the last health check
+    queries: int = 0  # Queries routed here
+    failovers: int = 0  # Queries moved to another database after this one failed
+
+
+class _Node:
+    """Executor of one database with its routing state"""
+
+    def __init__(self, name: str, config: DatabaseConfig):
+        self.executor = DatabaseExecutor(config)
+        self.stats = NodeStats(name)
+        self.check_lock = threading.Lock()
+
+
+class RoutingExecutor:
+    """Spreads read-only queries over replicas, falling back to the primary
+
+    SELECT statements go to the healthy replica with the least outstanding
+    work ('least_outstanding') or the lowest expected completion time
+    ('latency', outstanding queries times the moving average query time);
+    everything else runs on the primary. Replicas are health checked at most
+    every ``health_interval`` seconds with ``SELECT 1`` and their replication
+    lag; a replica that is unreachable or lags more than ``max_lag`` seconds
+    gets no reads until a later check passes. A replica whose lag cannot be
+    read keeps getting reads unless ``require_lag`` is set. When a query fails on a replica
+    and the replica then fails its health check, the query is retried on the
+    next candidate and finally on the primary; errors of the query itself are
+    returned as they are.
+
+    Example:
+        executor = RoutingExecutor(primary_config, [replica1_config, replica2_config])
+        results = executor.execute_conversion(tlsql.convert(query, dialect=executor.dialect))
+    """
+
+    def __init__(self, primary: DatabaseConfig, replicas: List[DatabaseConfig],
+                 policy: str = 'least_outstanding', max_lag: float = 30.0,
+                 health_interval: float = 5.0, read_from_primary: bool = False,
+                 require_lag: bool = False):
+        """Initialize executor
+
+        Args:
+            primary: Configuration of the writable primary
+            replicas: Configurations of the read replicas
+            policy: 'least_outstanding' or 'latency'
+            max_lag: Replication lag in seconds above which a replica gets no reads
+            health_interval: Seconds between health checks of a replica
+            read_from_primary: Balance reads over the primary too, not only fail over to it
+            require_lag: Treat a replica whose replication lag cannot be read as unhealthy
+
+        Raises:
+            ValueError: Unknown policy
+        """
+        if policy not in ROUTING_POLICIES:
+            raise ValueError(f"Unknown routing policy: {policy}. Supported policies: {', '.join(ROUTING_POLICIES)}")
+        self.policy = policy
+        self.max_lag = max_lag
+        self.health_interval = health_interval
+        self.read_from_primary = read_from_primary
+        self.require_lag = require_lag
+        self.primary = _Node('primary', primary)
+        self.replicas = [_Node(f"replica{i}", config) for i, config in enumerate(replicas)]
+        self._lock = threading.Lock()
+        logger.info(f"RoutingExecutor initialized with {len(self.replicas)} replicas")
+
+    def __enter__(self):
+        """Context manager entry"""
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context manager exit"""
+        self.disconnect()
+        return False
+
+    @property
+    def dialect(self) -> str:
+        """SQL dialect to pass to ``tlsql.convert``, that of the primary"""
+        return self.primary.executor.dialect
+
+    def _nodes(self) -> List[_Node]:
+        return [self.primary] + self.replicas
+
+    def connect(self) -> None:
+        """Connect to the primary and every replica
+
+        A replica that cannot be reached is marked unhealthy instead of failing.
+        """
+        self.primary.executor.connect()
+        for node in self.replicas:
+            try:
+                node.executor.connect()
+            except Exception as e:
+                logger.warning(f"Failed to connect to {node.stats.name}: {e}")
+                node.stats.healthy = False
+                node.stats.checked_at = time.monotonic()
+
+    def disconnect(self) -> None:
+        """Release the pooled engines"""
+        for node in self._nodes():
+            node.executor.disconnect()
+
+    def _check(self, node: _Node, force: bool = False) -> bool:
+        """Refresh a replica's health when its last check is stale, returning whether it is healthy
+
+        Concurrent callers do not wait for a running check and use the
+        previous state instead.
+        """
+        stats = node.stats
+        fresh = stats.checked_at is not None and time.monotonic() - stats.checked_at < self.health_interval
+        if fresh and not force:
+            return stats.healthy
+        if not node.check_lock.acquire(blocking=force):
+            return stats.healthy
+        try:
+            lag = None
+            lag_unknown = False
+            healthy = node.executor.execute('SELECT 1', use_cache=False).success
+            if healthy:
+                try:
+                    lag = node.executor.backend.replica_lag(node.executor)
+                except Exception as e:
+                    lag_unknown = True
+                    if not stats.lag_unknown:
+                        logger.warning(f"Failed to read replication lag of {stats.name}: {e}")
+                    healthy = not self.require_lag
+            if lag is not None and lag > self.max_lag:
+                healthy = False
+
+            if healthy != stats.healthy:
+                logger.warning(f"{stats.name} is now {'healthy' if healthy else 'unhealthy'} (lag {lag})")
+            stats.healthy = healthy
+            stats.lag = lag
+            stats.lag_unknown = lag_unknown
+            stats.checked_at = time.monotonic()
+            return healthy
+        finally:
+            node.check_lock.release()
+
+    def check_health(self) -> Dict[str, NodeStats]:
+        """Health check every replica now and return the routing state of all databases"""
+        for node in self.replicas:
+            self._check(node, force=True)
+        return self.stats()
+
+    def stats(self) -> Dict[str, NodeStats]:
+        """Return a snapshot of the routing state of every database"""
+        with self._lock:
+            return {node.stats.name: dataclasses.replace(node.stats) for node in self._nodes()}
+
+    def _score(self, node: _Node) -> tuple:
+        """Sort key of a candidate under the routing policy, lower is better"""
+        stats = node.stats
+        latency = stats.latency or 0.0
+        if self.policy == 'latency':
+            return ((stats.outstanding + 1) * latency, stats.outstanding)
+        return (stats.outstanding, latency)
+
+    def _candidates(self, sql) -> List[_Node]:
+        """Databases to try for a statement, in order; the primary is always last for reads"""
+        if not _READ_PATTERN.match(str(sql)):
+            return [self.primary]
+        pool = [node for node in self.replicas if self._check(node)]
+        if self.read_from_primary:
+            pool.append(self.primary)
+        with self._lock:
+            ranked = sorted(pool, key=self._score)
+        if self.primary not in ranked:
+            ranked.append(self.primary)
+        return ranked
+
+    def _run_on(self, node: _Node, method: str, sql, *args, **kwargs) -> ExecutionResult:
+        """Run an executor method on one database, tracking outstanding work and latency"""
+        stats = node.stats
+        with self._lock:
+            stats.outstanding += 1
+            stats.queries += 1
+        try:
+            result = getattr(node.executor, method)(sql, *args, **kwargs)
+        finally:
+            with self._lock:
+                stats.outstanding -= 1
+        if result.success and not result.cache_hit:
+            with self._lock:
+                if stats.latency is None:
+                    stats.latency = result.execution_time
+                else:
+                    stats.latency += LATENCY_SMOOTHING * (result.execution_time - stats.latency)
+        return result
+
+    def _route(self, method: str, sql, *args, **kwargs) -> ExecutionResult:
+        """Run a statement on the best candidate, failing over while candidates are unhealthy"""
+        for node in self._candidates(sql):
+            result = self._run_on(node, method, sql, *args, **kwargs)
+            if result.success or result.timed_out or node is self.primary:
+                return result
+            if self._check(node, force=True):
+                # The database is fine, so the error belongs to the query
+                return result
+            with self._lock:
+                node.stats.failovers += 1
+            logger.warning(f"{node.stats.name} failed, retrying query elsewhere: {result.error}")
+        return result
+
+    def execute(self, sql, params=None, **kwargs) -> ExecutionResult:
+        """Execute a query on the chosen database, see :meth:`DatabaseExecutor.execute`"""
+        return self._route('execute', sql, params, **kwargs)
+
+    def execute_typed(self, sql, table: str, **kwargs) -> ExecutionResult:
+        """Execute a typed table query on the chosen database, see :meth:`DatabaseExecutor.execute_typed`"""
+        return self._route('execute_typed', sql, table, **kwargs)
+
+    def execute_arrow(self, sql, **kwargs) -> ExecutionResult:
+        """Execute a columnar query on the chosen database, see :meth:`DatabaseExecutor.execute_arrow`"""
+        return self._route('execute_arrow', sql, **kwargs)
+
+    def _execute_item(self, item, timeout: Optional[float]) -> ExecutionResult:
+        """Route one batch query through the fetch path its executor configuration selects"""
+        sql = getattr(item, 'sql', item)
+        table = getattr(item, 'table', None)
+        config = self.primary.executor.config
+        if config.memory_budget is not None and table:
+            return self.execute_arrow(sql, timeout=timeout)
+        if config.typed_fetch and table:
+            return self.execute_typed(sql, table, timeout=timeout)
+        return self.execute(sql, timeout=timeout)
+
+    def execute_batch(self, sql_list: List, max_workers: Optional[int] = None,
+                      timeout: Optional[float] = None) -> List[ExecutionResult]:
+        """Execute multiple SQL statements concurrently, each routed on its own
+
+        Args:
+            sql_list: SQL strings or GeneratedSQL objects
+            max_workers: Worker threads, defaults to the summed ``max_concurrency``
+                of the databases reads can go to
+            timeout: Deadline per query in seconds
+
+        Returns:
+            ExecutionResult list in input order
+        """
+        if not sql_list:
+            return []
+        readers = self.replicas + [self.primary] if self.read_from_primary else self.replicas or [self.primary]
+        workers = max_workers or sum(node.executor.config.max_concurrency for node in readers)
+        logger.info(f"Routing batch of {len(sql_list)} SQL statements")
+        with ThreadPoolExecutor(max_workers=min(workers, len(sql_list))) as pool:
+            return list(pool.map(lambda item: self._execute_item(item, timeout), sql_list))
+
+    def execute_conversion(self, conversion) -> Dict[str, ExecutionResult]:
+        """Execute the per-table queries of a ConversionResult across the replicas
+
+        Args:
+            conversion: ConversionResult from ``tlsql.convert``
+
+        Returns:
+            Dict mapping table name to ExecutionResult
+        """
+        results = self.execute_batch(conversion.sql_list)
+        return {gen_sql.table: result for gen_sql, result in zip(conversion.sql_list, results)}
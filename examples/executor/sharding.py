@@ -0,0 +1,342 @@
+"""Scatter-gather execution over tables sharded across several databases"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+
+from tlsql.examples.executor.db_executor import DatabaseConfig, DatabaseExecutor, ExecutionResult, QueryTimings
+from tlsql.examples.executor.typed_fetch import apply_dtypes, approx_memory_bytes, concat_chunks
+from tlsql.tlsql.ast_nodes import BetweenExpr, BinaryExpr, ColumnExpr, Expr, InExpr, LiteralExpr
+from tlsql.tlsql.exceptions import TLSQLError
+from tlsql.tlsql.parser import Parser
+
+
+logger = logging.getLogger(__name__)
+
+# Chunks buffered per shard before its producer waits for the consumer
+QUEUE_CHUNKS_PER_SHARD = 2
+
+# Comparison with the literal on the left, rewritten with the column on the left
+_FLIPPED = {'<': '>', '>': '<', '<=': '>=', '>=': '<=', '=': '=', '==': '=', '!=': '!='}
+
+
+@dataclass
+class Shard:
+    """One database holding the rows whose shard key lies in [lower, upper)"""
+
+    name: str  # Shard name used in logs and errors
+    config: DatabaseConfig  # Connection of the shard database
+    lower: Optional[Any] = None  # Inclusive lower bound of the shard key, None for unbounded
+    upper: Optional[Any] = None  # Exclusive upper bound of the shard key, None for unbounded
+
+    def contains(self, value) -> bool:
+        """Whether a shard key value belongs to this shard"""
+        return (self.lower is None or self.lower <= value) and (self.upper is None or value < self.upper)
+
+
+class ShardMap:
+    """Range sharding of tables by a shard key
+
+    Example:
+        shard_map = ShardMap(
+            shards=[Shard('s0', config0, upper=5000), Shard('s1', config1, lower=5000)],
+            keys={'ratings': 'userID', 'users': 'userID'}
+        )
+    """
+
+    def __init__(self, shards: List[Shard], keys: Dict[str, str]):
+        """Initialize shard map
+
+        Args:
+            shards: Shards with disjoint key ranges
+            keys: Sharded table name -> shard key column; other tables are not sharded
+        """
+        self.shards = shards
+        self.keys = keys
+
+    def is_sharded(self, table: str) -> bool:
+        """Whether a table is split across the shards"""
+        return table in self.keys
+
+    def shards_for(self, table: str, condition: Optional[str]) -> List[Shard]:
+        """Return the shards that may hold rows of a table matching a WHERE condition
+
+        The condition is parsed with the TLSQL parser and shards are pruned by
+        comparisons, BETWEEN and IN on the shard key, combined through AND and
+        OR. Anything else, including a condition that does not parse, keeps
+        every shard.
+
+        Only the table's own condition is used. Per-table queries are not
+        restricted by the filters of other tables, so ``users.userID BETWEEN
+        1 AND 3000`` does not prune the ratings query: it still returns every
+        rating. To read fewer ratings shards, filter ratings on its own shard
+        key, e.g. ``ratings.userID BETWEEN 1 AND 3000``.
+        """
+        if not self.is_sharded(table) or not condition:
+            return list(self.shards)
+        try:
+            expr = Parser(condition).parse_where_expression()
+        except TLSQLError as e:
+            logger.debug(f"Not pruning shards, condition did not parse: {e}")
+            return list(self.shards)
+        key = self.keys[table]
+        return [shard for shard in self.shards if _may_match(expr, key, shard)]
+
+
+def _is_key(expr: Expr, key: str) -> bool:
+    return isinstance(expr, ColumnExpr) and expr.column.column == key
+
+
+def _compare_may_match(operator: str, value, shard: Shard) -> bool:
+    """Whether some key in the shard's range may satisfy ``key <operator> value``"""
+    if operator in ('=', '=='):
+        return shard.contains(value)
+    if operator in ('>', '>='):
+        return shard.upper is None or value < shard.upper
+    if operator == '<':
+        return shard.lower is None or shard.lower < value
+    if operator == '<=':
+        return shard.lower is None or shard.lower <= value
+    return True
+
+
+def _may_match(expr: Expr, key: str, shard: Shard) -> bool:
+    """Conservatively decide whether a shard may hold rows matching an expression
+
+    Returns False only when the expression provably excludes the shard's key range.
+    """
+    try:
+        if isinstance(expr, BinaryExpr):
+            operator = expr.operator.upper()
+            if operator == 'AND':
+                return _may_match(expr.left, key, shard) and _may_match(expr.right, key, shard)
+            if operator == 'OR':
+                return _may_match(expr.left, key, shard) or _may_match(expr.right, key, shard)
+            if _is_key(expr.left, key) and isinstance(expr.right, LiteralExpr):
+                return _compare_may_match(operator, expr.right.value, shard)
+            if _is_key(expr.right, key) and isinstance(expr.left, LiteralExpr) and operator in _FLIPPED:
+                return _compare_may_match(_FLIPPED[operator], expr.left.value, shard)
+        elif isinstance(expr, BetweenExpr):
+            if _is_key(expr.column, key) and isinstance(expr.lower, LiteralExpr) and isinstance(expr.upper, LiteralExpr):
+                return ((shard.upper is None or expr.lower.value < shard.upper)
+                        and (shard.lower is None or expr.upper.value >= shard.lower))
+        elif isinstance(expr, InExpr):
+            if _is_key(expr.column, key) and all(isinstance(value, LiteralExpr) for value in expr.values):
+                return any(shard.contains(value.value) for value in expr.values)
+    except TypeError:
+        # Literal not comparable with the shard bounds
+        pass
+    return True
+
+
+class ShardedExecutor:
+    """Runs generated queries on the shards holding their rows and merges the results
+
+    A query on a sharded table is sent to every shard its own condition does
+    not rule out (see :meth:`ShardMap.shards_for`), all in parallel. Shard results
+    are streamed and merged as chunks arrive, each chunk converted to dtypes
+    derived from the table schema: the compact typed-fetch dtypes when
+    ``DatabaseConfig.typed_fetch`` is set, else the wide ones (Int64, float64),
+    so a shard whose column happens to hold NULLs or no rows does not change
+    the merged column type. Unsharded tables are read from ``default``.
+
+    Example:
+        executor = ShardedExecutor(shard_map, default=users_config)
+        results = executor.execute_conversion(tlsql.convert(query, dialect=executor.dialect))
+    """
+
+    def __init__(self, shard_map: ShardMap, default: DatabaseConfig):
+        """Initialize executor
+
+        Args:
+            shard_map: Shards and the shard key of each sharded table
+            default: Configuration of the database holding the unsharded tables
+        """
+        self.shard_map = shard_map
+        self.default = DatabaseExecutor(default)
+        self._executors = {shard.name: DatabaseExecutor(shard.config) for shard in shard_map.shards}
+        logger.info(f"ShardedExecutor initialized with {len(self._executors)} shards")
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context manager exit"""
+        self.disconnect()
+        return False
+
+    @property
+    def dialect(self) -> str:
+        """SQL dialect to pass to ``tlsql.convert``, that of the default database"""
+        return self.default.dialect
+
+    def disconnect(self) -> None:
+        """Release the pooled engines"""
+        self.default.disconnect()
+        for executor in self._executors.values():
+            executor.disconnect()
+
+    def add_hook(self, hook: Callable[[ExecutionResult], None]) -> None:
+        """Subscribe a callable to the ExecutionResult of every executed query
+
+        A sharded query is reported once, with its merged result; queries on
+        unsharded tables are reported by the default executor.
+        """
+        self.default.add_hook(hook)
+
+    def remove_hook(self, hook: Callable[[ExecutionResult], None]) -> None:
+        """Unsubscribe a hook added with :meth:`add_hook`"""
+        self.default.remove_hook(hook)
+
+    def _dtypes(self, table: str, shard: Shard) -> Dict[str, str]:
+        """Target dtypes of every chunk of a sharded table"""
+        executor = self._executors[shard.name]
+        return executor._dtypes_for(table, compact=executor.config.typed_fetch)
+
+    def execute_stream(self, generated_sql, timeout: Optional[float] = None) -> Iterator[pd.DataFrame]:
+        """Execute a GeneratedSQL on its shards and yield the merged result in chunks
+
+        Chunks are yielded in arrival order across shards, with consistent
+        dtypes. Stopping the iteration stops every shard's stream.
+
+        Args:
+            generated_sql: GeneratedSQL of a sharded table
+            timeout: Deadline per shard in seconds
+
+        Yields:
+            DataFrame chunks; an empty result yields one empty chunk
+
+        Raises:
+            RuntimeError: A shard query failed
+        """
+        table = generated_sql.table
+        shards = self.shard_map.shards_for(table, generated_sql.condition)
+        logger.info(f"Scattering {table} query to {len(shards)}/{len(self.shard_map.shards)} shards")
+        if not shards:
+            yield pd.DataFrame(columns=[col for col in generated_sql.columns if col != '*'])
+            return
+
+        dtypes = self._dtypes(table, shards[0])
+        chunks: queue.Queue = queue.Queue(maxsize=QUEUE_CHUNKS_PER_SHARD * len(shards))
+        stop = threading.Event()
+
+        def put(item) -> None:
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def produce(shard: Shard) -> None:
+            stream = self._executors[shard.name].execute_stream(generated_sql.sql, timeout=timeout)
+            try:
+                for chunk in stream:
+                    if stop.is_set():
+                        break
+                    put((shard, apply_dtypes(chunk, dtypes), None))
+            except Exception as e:
+                put((shard, None, e))
+                return
+            finally:
+                stream.close()
+            put((shard, None, None))
+
+        empty = None
+        yielded = False
+        with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+            for shard in shards:
+                pool.submit(produce, shard)
+            try:
+                remaining = len(shards)
+                while remaining:
+                    shard, chunk, error = chunks.get()
+                    if error is not None:
+                        raise RuntimeError(f"Shard {shard.name} failed: {error}") from error
+                    if chunk is None:
+                        remaining -= 1
+                    elif len(chunk):
+                        yielded = True
+                        yield chunk
+                    elif empty is None:
+                        empty = chunk
+            finally:
+                stop.set()
+
+        if not yielded and empty is not None:
+            yield empty
+
+    def execute(self, generated_sql, timeout: Optional[float] = None) -> ExecutionResult:
+        """Execute a GeneratedSQL on the shards holding its rows, or on the default database
+
+        Args:
+            generated_sql: GeneratedSQL from ``tlsql.convert``
+            timeout: Deadline per shard in seconds
+
+        Returns:
+            ExecutionResult with the merged rows of all queried shards
+        """
+        if not self.shard_map.is_sharded(generated_sql.table):
+            if self.default.config.typed_fetch:
+                return self.default.execute_typed(generated_sql.sql, generated_sql.table, timeout=timeout)
+            return self.default.execute(generated_sql.sql, timeout=timeout)
+
+        start_ns = time.perf_counter_ns()
+        timings = QueryTimings()
+        try:
+            stream = self.execute_stream(generated_sql, timeout)
+            first = next(stream)
+            timings.first_row_ns = time.perf_counter_ns() - start_ns
+            collected = [first] + list(stream)
+            decode_start = time.perf_counter_ns()
+            timings.fetch_ns = decode_start - start_ns - timings.first_row_ns
+            df = concat_chunks(collected)
+            end_ns = time.perf_counter_ns()
+            timings.decode_ns = end_ns - decode_start
+            timings.total_ns = end_ns - start_ns
+            logger.info(f"Merged {len(collected)} shard chunks. Rows: {len(df)}, Time: {timings.total_ns / 1e9:.3f}s")
+
+            return self.default._notify(ExecutionResult(
+                success=True,
+                data=df,
+                row_count=len(df),
+                execution_time=timings.total_ns / 1e9,
+                sql=generated_sql.sql,
+                memory_bytes=approx_memory_bytes(df),
+                timings=timings
+            ))
+
+        except Exception as e:
+            timings.total_ns = time.perf_counter_ns() - start_ns
+            logger.error(f"Sharded query failed: {e}")
+            return self.default._notify(ExecutionResult(
+                success=False,
+                error=str(e),
+                execution_time=timings.total_ns / 1e9,
+                sql=generated_sql.sql,
+                timings=timings
+            ))
+
+    def execute_conversion(self, conversion, timeout: Optional[float] = None) -> Dict[str, ExecutionResult]:
+        """Execute the per-table queries of a ConversionResult, each table in parallel
+
+        Args:
+            conversion: ConversionResult from ``tlsql.convert``
+            timeout: Deadline per shard query in seconds
+
+        Returns:
+            Dict mapping table name to ExecutionResult
+        """
+        sql_list = conversion.sql_list
+        if not sql_list:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(sql_list)) as pool:
+            results = list(pool.map(lambda gen_sql: self.execute(gen_sql, timeout), sql_list))
+        return {gen_sql.table: result for gen_sql, result in zip(sql_list, results)}
@@ -0,0 +1,101 @@
+"""Spilling of large results to memory-mapped Arrow IPC files"""
+
+import os
+import tempfile
+from typing import List, Optional
+
+from tlsql.examples.executor.arrow_fetch import concat_tables
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def unify_schema(batches: List):
+    """Common schema of record batches, promoting all-null columns to the typed ones"""
+    return _unify([batch.schema for batch in batches])
+
+
+def _unify(schemas: List):
+    try:
+        return pa.unify_schemas(schemas, promote_options='default')
+    except TypeError:
+        # pyarrow < 14
+        return pa.unify_schemas(schemas)
+
+
+class SpillFile:
+    """Arrow IPC files that record batches are written to and read back memory-mapped
+
+    The files are uncompressed, so the table returned by :meth:`open`
+    references the mapped pages directly and data is paged in from the OS
+    cache on access instead of living on the heap. A batch whose schema
+    widens the current one, e.g. text in a column that was all NULL so far,
+    starts a new segment file with the unified schema; the segments are
+    concatenated when opened. On POSIX systems the files are unlinked once
+    mapped; their space is released when the table is garbage collected.
+    """
+
+    def __init__(self, schema, directory: Optional[str] = None):
+        """Create the spill file
+
+        Args:
+            schema: pyarrow Schema of the first batches
+            directory: Directory for the files, defaults to the system temp dir
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is not installed.")
+        self.directory = directory
+        self.paths = []
+        self.bytes_written = 0
+        self._sink = None
+        self._writer = None
+        self._start_segment(schema)
+
+    def _start_segment(self, schema) -> None:
+        """Finish the current segment and open a new one with ``schema``"""
+        self._close_segment()
+        fd, path = tempfile.mkstemp(prefix='tlsql-spill-', suffix='.arrow', dir=self.directory)
+        os.close(fd)
+        self.paths.append(path)
+        self.schema = schema
+        self._sink = pa.OSFile(path, 'wb')
+        self._writer = pa.ipc.new_file(self._sink, schema)
+
+    def _close_segment(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+            self._writer = self._sink = None
+
+    def write(self, batch) -> None:
+        """Append a record batch, casting it to the file schema if its types differ"""
+        if not batch.schema.equals(self.schema):
+            schema = _unify([self.schema, batch.schema])
+            if not schema.equals(self.schema):
+                self._start_segment(schema)
+            if not batch.schema.equals(self.schema):
+                batch = pa.Table.from_batches([batch]).cast(self.schema).combine_chunks().to_batches()[0]
+        self._writer.write_batch(batch)
+        self.bytes_written += batch.nbytes
+
+    def open(self):
+        """Finish the files and return their contents as one memory-mapped pyarrow Table"""
+        self._close_segment()
+        tables = []
+        for path in self.paths:
+            tables.append(pa.ipc.open_file(pa.memory_map(path, 'r')).read_all())
+            if os.name != 'nt':
+                os.remove(path)
+        return tables[0] if len(tables) == 1 else concat_tables(tables)
+
+    def discard(self) -> None:
+        """Abandon partially written files"""
+        try:
+            self._close_segment()
+        finally:
+            for path in self.paths:
+                if os.path.exists(path):
+                    os.remove(path)
@@ -0,0 +1,127 @@
+"""Schema-driven dtype selection for compact DataFrames at fetch time"""
+
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Lower-cased SQL base types (MySQL, SQLite, DuckDB spellings) by target dtype
+INT32_TYPES = {'tinyint', 'smallint', 'mediumint', 'int', 'integer', 'int2', 'int4', 'year'}
+INT64_TYPES = {'bigint', 'int8'}
+FLOAT32_TYPES = {'float', 'double', 'real', 'decimal', 'numeric', 'float4', 'float8', 'double precision'}
+CATEGORY_TYPES = {
+    'char', 'varchar', 'character varying', 'text', 'tinytext', 'mediumtext', 'longtext',
+    'enum', 'set', 'string'
+}
+
+_INT32_INFO = np.iinfo(np.int32)
+
+# Values sampled per object column when approximating memory usage
+APPROX_SAMPLE_ROWS = 1000
+
+
+def dtypes_from_schema(types: Dict[str, str], overrides: Optional[Dict[str, str]] = None,
+                       compact: bool = True) -> Dict[str, str]:
+    """Choose compact pandas dtypes from SQL column types
+
+    Integer types up to INT become int32, floating and decimal types float32
+    and string types category. BIGINT, dates and unknown types keep pandas
+    inference.
+
+    With ``compact=False`` the wide dtypes are chosen instead: every integer
+    type becomes nullable Int64 and floating and decimal types float64, so
+    frames fetched separately agree on dtypes without narrowing any value.
+
+    Args:
+        types: Column name -> SQL data type, as in ``get_table_schema`` entries
+        overrides: Column name -> dtype, taking precedence over the schema
+        compact: Choose the smallest dtypes rather than the widest
+
+    Returns:
+        Column name -> pandas dtype name
+    """
+    dtypes = {}
+    for column, sql_type in types.items():
+        base_type = re.sub(r'\(.*\)', '', str(sql_type)).replace('unsigned', '').strip().lower()
+        if not compact:
+            if base_type in INT32_TYPES or base_type in INT64_TYPES:
+                dtypes[column] = 'Int64'
+            elif base_type in FLOAT32_TYPES:
+                dtypes[column] = 'float64'
+        elif base_type in INT32_TYPES:
+            dtypes[column] = 'int32'
+        elif base_type in FLOAT32_TYPES:
+            dtypes[column] = 'float32'
+        elif base_type in CATEGORY_TYPES:
+            dtypes[column] = 'category'
+    dtypes.update(overrides or {})
+    return dtypes
+
+
+def apply_dtypes(df: pd.DataFrame, dtypes: Dict[str, str]) -> pd.DataFrame:
+    """Convert the columns of one chunk to their target dtypes in place
+
+    int32 columns holding NULLs become nullable ``Int32``; values outside the
+    int32 range keep their inferred type.
+    """
+    for column, dtype in dtypes.items():
+        if column not in df.columns:
+            continue
+        values = df[column]
+        if dtype == 'int32':
+            if values.isna().any():
+                dtype = 'Int32'
+            if len(values) and (values.min() < _INT32_INFO.min or values.max() > _INT32_INFO.max):
+                continue
+        df[column] = values.astype(dtype)
+    return df
+
+
+def concat_chunks(chunks: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate typed chunks, unioning per-chunk categories first
+
+    ``pd.concat`` falls back to object for categoricals whose categories
+    differ, which would undo the per-chunk encoding.
+    """
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+
+    updates = [{} for _ in chunks]
+    for column in chunks[0].columns:
+        if not all(column in chunk and isinstance(chunk[column].dtype, pd.CategoricalDtype) for chunk in chunks):
+            continue
+        categories = pd.Index(np.concatenate([chunk[column].cat.categories for chunk in chunks])).unique()
+        for chunk, update in zip(chunks, updates):
+            update[column] = chunk[column].cat.set_categories(categories)
+
+    chunks = [chunk.assign(**update) if update else chunk for chunk, update in zip(chunks, updates)]
+    return pd.concat(chunks, ignore_index=True)
+
+
+def memory_bytes(df: pd.DataFrame) -> int:
+    """Deep memory usage of a DataFrame in bytes"""
+    return int(df.memory_usage(deep=True, index=False).sum())
+
+
+def approx_memory_bytes(df: pd.DataFrame) -> int:
+    """Approximate deep memory usage, sizing object columns from a sample
+
+    Cheap enough to run on every result, unlike a full deep scan of
+    large string columns.
+    """
+    total = int(df.memory_usage(index=False).sum())
+    n = len(df)
+    if n == 0:
+        return total
+    step = max(1, n // APPROX_SAMPLE_ROWS)
+    for position, dtype in enumerate(df.dtypes):
+        if dtype != object:
+            continue
+        sample = df.iloc[::step, position]
+        object_bytes = sample.memory_usage(index=False, deep=True) - sample.memory_usage(index=False)
+        total += int(object_bytes * n / len(sample))
+    return total
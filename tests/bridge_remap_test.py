@@ -0,0 +1,78 @@
+"""Tests for the relation ID remapping of the BRIDGE example
+"""
+
+import numpy as np
+import pandas as pd
+
+# Imported through the installed package (pip install -e .), see executor_test.py
+from tlsql.examples.bridge.remap import map_positions, remap_relation, stack_splits
+from tlsql.examples.bridge_remap_benchmark import make_data, remap_with_dicts
+
+
+def dict_positions(keys, values):
+    """Reference mapping through a dict of 1-based key positions"""
+    positions = {key: i + 1 for i, key in enumerate(keys)}
+    return np.array([positions.get(value, 0) for value in values], dtype=np.int64)
+
+
+def test_map_positions():
+    """Test that map_positions matches the dict mapping"""
+    print("\nTest: map_positions")
+
+    cases = [
+        ([30, 10, 20], [10, 20, 30, 40, 10]),
+        ([5, 7, 5, 9], [5, 7, 9, 6]),  # The last duplicate key wins
+        (['b', 'a', 'c'], ['c', 'x', 'a']),
+        ([], [1, 2]),
+        ([1, 2, 3], []),
+    ]
+    for keys, values in cases:
+        result = map_positions(keys, values)
+        assert result.tolist() == dict_positions(keys, values).tolist(), (keys, values)
+
+    # Nulls never match, and integer keys match float values holding nulls
+    keys = pd.Series([3, 1, 2], dtype='Int64')
+    values = pd.Series([1.0, None, 2.0, 4.0])
+    assert map_positions(keys, values).tolist() == [2, 0, 3, 0]
+    assert map_positions(pd.Categorical([2, 1]), pd.Series([1, 2, 3])).tolist() == [2, 1, 0]
+    print("  [SUCCESS] positions match the dict mapping")
+
+
+def test_remap_relation():
+    """Test that remap_relation produces the edges of the dict-based remapping"""
+    print("\nTest: remap_relation")
+
+    ratings, user_ids = make_data(100000, 5000, 300)
+    edges, n_movies = remap_relation(ratings, user_ids, 'userID', 'movieID')
+    dict_edges, dict_movies = remap_with_dicts(ratings, user_ids, 'userID', 'movieID')
+
+    assert n_movies == dict_movies
+    assert len(edges) < len(ratings)
+    assert edges['UserID'].tolist() == dict_edges['UserID'].tolist()
+    assert edges['MovieID'].tolist() == dict_edges['MovieID'].tolist()
+    assert edges.dtypes.tolist() == [np.int64, np.int64]
+    print(f"  edges: {len(edges)} of {len(ratings)} ratings")
+
+
+def test_stack_splits():
+    """Test that splits stack on their common columns and keep categoricals"""
+    print("\nTest: stack_splits")
+
+    train = pd.DataFrame({'UserID': [1, 2], 'Gender': pd.Categorical(['M', 'F']), 'Age': [18, 25]})
+    validate = pd.DataFrame({'Age': [35], 'UserID': [3], 'Gender': pd.Categorical(['F'])})
+    test = pd.DataFrame({'UserID': [4], 'Gender': pd.Categorical(['X']), 'Age': [1], 'Extra': [0]})
+
+    stacked = stack_splits([train, validate, test])
+    assert list(stacked.columns) == ['UserID', 'Gender', 'Age']
+    assert stacked['UserID'].tolist() == [1, 2, 3, 4]
+    assert stacked['Age'].tolist() == [18, 25, 35, 1]
+    assert isinstance(stacked['Gender'].dtype, pd.CategoricalDtype)
+    assert stacked['Gender'].tolist() == ['M', 'F', 'F', 'X']
+    assert stack_splits([train]) is train
+    print(f"  categories: {list(stacked['Gender'].cat.categories)}")
+
+
+if __name__ == "__main__":
+    test_map_positions()
+    test_remap_relation()
+    test_stack_splits()
@@ -0,0 +1,52 @@
+"""Tests for the persistent conversion cache
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.append("./")
+sys.path.append("../")
+sys.path.append("../../")
+
+from tlsql import ConversionCache
+
+
+def test_conversion_cache():
+    """Test cache hits, key normalization and LRU eviction"""
+    print("\nTest: conversion cache")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "conversions.db")
+        cache = ConversionCache(path)
+
+        query = "PREDICT VALUE(users.Age, CLF) FROM users WHERE users.Gender='F'"
+        same_query = """
+        predict value(users.Age, clf)  -- comment
+        from users
+        where users.Gender = 'F'
+        """
+        assert ConversionCache.fingerprint(query) == ConversionCache.fingerprint(same_query)
+        assert ConversionCache.fingerprint(query) != ConversionCache.fingerprint(query.replace("'F'", "'M'"))
+        assert ConversionCache.fingerprint(query) != ConversionCache.fingerprint(query, dialect='sqlite')
+
+        result = cache.get_or_convert(query)
+        assert len(cache) == 1
+
+        # A second process opening the same file sees the entry
+        cached = ConversionCache(path).get(ConversionCache.fingerprint(same_query))
+        assert cached == result
+        print(f"  Cached SQL: {cached.sql_list[0].sql}")
+
+        small_cache = ConversionCache(os.path.join(tmp_dir, "small.db"), max_bytes=4096)
+        for i in range(20):
+            small_cache.get_or_convert(f"PREDICT VALUE(users.Age, CLF) FROM users WHERE users.userID > {i}")
+        print(f"  Entries after eviction: {len(small_cache)}")
+        assert 0 < len(small_cache) < 20
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+if __name__ == "__main__":
+    test_conversion_cache()
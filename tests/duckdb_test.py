@@ -0,0 +1,110 @@
+"""Tests for the database executor against a local DuckDB database
+"""
+
+import os
+import tempfile
+import time
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Imported through the installed package (pip install -e .), see executor_test.py
+from tlsql import convert
+from tlsql.examples.executor.db_executor import DatabaseConfig, DatabaseExecutor
+
+
+def make_database(tmp_dir):
+    """Create a DuckDB database with users and ratings, and movies as a Parquet file"""
+    path = os.path.join(tmp_dir, "tml.duckdb")
+    conn = duckdb.connect(path)
+    conn.execute("CREATE TABLE users (UserID INTEGER PRIMARY KEY, Gender VARCHAR, Age INTEGER)")
+    conn.execute("""
+        CREATE TABLE ratings (
+            RatingID INTEGER PRIMARY KEY,
+            userID INTEGER REFERENCES users (UserID),
+            movieID INTEGER,
+            rating INTEGER
+        )
+    """)
+    conn.execute("INSERT INTO users SELECT range, CASE WHEN range % 2 = 0 THEN 'M' ELSE 'F' END, 18 + range % 40 "
+                 "FROM range(1, 101)")
+    conn.execute("INSERT INTO ratings SELECT range, 1 + range % 100, 1 + range % 50, 1 + range % 5 "
+                 "FROM range(1, 501)")
+    conn.close()
+
+    movies_path = os.path.join(tmp_dir, "movies.parquet")
+    write_movies(movies_path, 50)
+    return DatabaseConfig(db_type='duckdb', database=path, files={'movies': movies_path})
+
+
+def write_movies(path, n_movies):
+    """Write a movies Parquet file"""
+    pq.write_table(pa.table({
+        'MovieID': list(range(1, n_movies + 1)),
+        'Title': [f"movie {i}" for i in range(1, n_movies + 1)],
+    }), path)
+
+
+def test_parquet_view():
+    """Test a Parquet-backed view next to stored tables: schema, conversion and fingerprints"""
+    print("\nTest: DuckDB Parquet view")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = make_database(tmp_dir)
+        with DatabaseExecutor(config) as executor:
+            schema = executor.get_table_schema(['users', 'ratings', 'movies'])
+            assert schema['users']['primary_keys'] == ['UserID']
+            assert schema['ratings']['primary_keys'] == ['RatingID']
+            assert schema['ratings']['foreign_keys'] == {'userID': ('users', 'UserID')}
+            assert schema['movies']['columns'] == ['MovieID', 'Title']
+            assert schema['movies']['primary_keys'] == []
+
+            conversion = convert(
+                "TRAIN WITH (users.*, movies.Title, ratings.*) FROM users, movies, ratings WHERE users.Gender='M'",
+                schema=schema, dialect=executor.dialect
+            )
+            results = executor.execute_conversion(conversion)
+            assert all(result.success for result in results.values())
+            assert results['users'].row_count == 50
+            assert results['movies'].row_count == 50
+            assert list(results['movies'].data.columns) == ['Title']
+            assert results['ratings'].row_count == 500
+
+            fingerprints = executor.backend.table_fingerprints(executor, ['users', 'ratings', 'movies'])
+            assert fingerprints['users'] == fingerprints['ratings'] != fingerprints['movies']
+            time.sleep(0.01)
+            write_movies(config.files['movies'], 60)
+            changed = executor.backend.table_fingerprints(executor, ['users', 'ratings', 'movies'])
+            assert changed['movies'] != fingerprints['movies']
+            assert changed['users'] == fingerprints['users']
+            assert executor.execute("SELECT * FROM movies").row_count == 60
+            print(f"  users: {results['users'].row_count}, movies: {results['movies'].row_count}, "
+                  f"ratings: {results['ratings'].row_count}")
+
+
+def test_sample():
+    """Test that random sampling draws about the requested share of rows"""
+    print("\nTest: DuckDB sample")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "sample.duckdb")
+        conn = duckdb.connect(path)
+        conn.execute("CREATE TABLE small AS SELECT range AS id FROM range(300)")
+        conn.execute("CREATE TABLE large AS SELECT range AS id FROM range(100000)")
+        conn.close()
+
+        executor = DatabaseExecutor(DatabaseConfig(db_type='duckdb', database=path))
+        for table, low, high in (('small', 1, 300), ('large', 9000, 11000)):
+            conversion = convert(f"TRAIN WITH ({table}.*) FROM {table} SAMPLE 10 PERCENT", dialect=executor.dialect)
+            assert "(bernoulli)" in conversion.sql_list[0].sql
+            result = executor.execute_conversion(conversion)[table]
+            assert result.success, result.error
+            assert low <= result.row_count <= high, (table, result.row_count)
+            print(f"  {table}: {result.row_count} rows")
+        executor.disconnect()
+
+
+if __name__ == "__main__":
+    test_parquet_view()
+    test_sample()
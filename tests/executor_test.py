@@ -0,0 +1,701 @@
+"""Tests for the database executor against a local SQLite database
+"""
+
+import asyncio
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+import pandas as pd
+
+# The executor examples are imported through the installed package (pip install -e .),
+# so the source tree is not put on sys.path here
+from tlsql import convert
+from tlsql.examples.executor.async_executor import AsyncDatabaseExecutor
+from tlsql.examples.executor.db_executor import DatabaseConfig, DatabaseExecutor
+from tlsql.examples.executor.engine_pool import registry
+from tlsql.examples.executor.routing import RoutingExecutor
+from tlsql.examples.executor.sharding import Shard, ShardedExecutor, ShardMap
+
+
+# Counts to 10^8 in SQLite, far longer than any deadline used below
+SLOW_SQL = ("WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 100000000) "
+            "SELECT COUNT(*) FROM n")
+
+
+def make_database(path, n_users=100, n_movies=50, n_ratings=500):
+    """Create a small users/movies/ratings database at path"""
+    rng = random.Random(0)
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE users (UserID INTEGER PRIMARY KEY, Gender TEXT, Age INTEGER);
+        CREATE TABLE movies (MovieID INTEGER PRIMARY KEY, Title TEXT, Genre TEXT);
+        CREATE TABLE ratings (
+            RatingID INTEGER PRIMARY KEY AUTOINCREMENT,
+            userID INTEGER REFERENCES users (UserID),
+            movieID INTEGER REFERENCES movies (MovieID),
+            rating INTEGER
+        );
+    """)
+    conn.executemany("INSERT INTO users VALUES (?, ?, ?)",
+                     [(i, rng.choice('MF'), rng.choice([1, 18, 25, 35])) for i in range(1, n_users + 1)])
+    conn.executemany("INSERT INTO movies VALUES (?, ?, ?)",
+                     [(i, f"movie {i}", rng.choice(['Drama', 'Comedy'])) for i in range(1, n_movies + 1)])
+    # The last movies stay unrated
+    conn.executemany("INSERT INTO ratings (userID, movieID, rating) VALUES (?, ?, ?)",
+                     [(rng.randint(1, n_users), rng.randint(1, n_movies - 5), rng.randint(1, 5))
+                      for _ in range(n_ratings)])
+    conn.commit()
+    conn.close()
+
+
+def make_executor(tmp_dir, **options):
+    """Create a database in tmp_dir and an executor for it"""
+    path = os.path.join(tmp_dir, "tml.db")
+    if not os.path.exists(path):
+        make_database(path)
+    return DatabaseExecutor(DatabaseConfig(db_type='sqlite', database=path, **options))
+
+
+def test_batch_fail_fast():
+    """Test that fail_fast cancels outstanding queries after the first failure"""
+    print("\nTest: batch fail_fast")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        sql_list = ["SELECT * FROM nosuch"] + ["SELECT * FROM ratings"] * 6
+        results = executor.execute_batch(sql_list, max_workers=1, error_policy='fail_fast')
+
+        assert len(results) == len(sql_list)
+        assert not results[0].success and not results[0].cancelled
+        assert any(result.cancelled for result in results[1:])
+        assert all(result.success or result.cancelled for result in results[1:])
+        print(f"  Cancelled: {sum(result.cancelled for result in results)}")
+
+        results = executor.execute_batch(sql_list, max_workers=2, error_policy='collect')
+        assert not results[0].success
+        assert all(result.success and result.row_count == 500 for result in results[1:])
+        executor.disconnect()
+
+
+def test_join_plan():
+    """Test that the join plan is opt-in and splits into keyed per-table rows"""
+    print("\nTest: join plan")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        schema = executor.get_table_schema(['users', 'movies', 'ratings'])
+        conversion = convert(
+            "TRAIN WITH (users.*, movies.Title, ratings.*) FROM users, movies, ratings WHERE users.Gender='M'",
+            schema=schema, dialect=executor.dialect, join_plan=True
+        )
+
+        per_table = executor.execute_conversion(conversion)
+        assert per_table['ratings'].row_count == 500
+        assert per_table['movies'].row_count == 50
+
+        joined = executor.execute_conversion(conversion, plan='join')
+        users = joined['users'].data.sort_values('UserID').reset_index(drop=True)
+        assert users.equals(per_table['users'].data.sort_values('UserID').reset_index(drop=True))
+        assert list(joined['movies'].data.columns) == ['Title']
+
+        ratings = joined['ratings'].data
+        assert ratings['RatingID'].is_unique
+        assert set(ratings['RatingID']) <= set(per_table['ratings'].data['RatingID'])
+        assert set(ratings['userID']) <= set(users['UserID'])
+        print(f"  ratings: per-table {per_table['ratings'].row_count}, join {len(ratings)}")
+        executor.disconnect()
+
+
+def test_join_plan_dtypes():
+    """Test that both plans return equal frames, dtypes included"""
+    print("\nTest: join plan dtypes")
+
+    for typed_fetch in (False, True):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            executor = make_executor(tmp_dir, typed_fetch=typed_fetch)
+            schema = executor.get_table_schema(['users', 'movies', 'ratings'])
+            conversion = convert(
+                "TRAIN WITH (users.*, movies.*, ratings.*) FROM users, movies, ratings WHERE users.Gender='M'",
+                schema=schema, dialect=executor.dialect, join_plan=True
+            )
+            per_table = executor.execute_conversion(conversion)
+            joined = executor.execute_conversion(conversion, plan='join')
+
+            for table, key in (('users', 'UserID'), ('movies', 'MovieID'), ('ratings', 'RatingID')):
+                expected = per_table[table].data
+                actual = joined[table].data.sort_values(key).reset_index(drop=True)
+                # The join plan only keeps rows related to the filtered users
+                expected = expected[expected[key].isin(actual[key])].sort_values(key).reset_index(drop=True)
+                for column in expected.select_dtypes('category'):
+                    expected[column] = expected[column].cat.remove_unused_categories()
+                assert len(actual) > 0, table
+                pd.testing.assert_frame_equal(actual, expected)
+            assert str(joined['ratings'].data['rating'].dtype) == ('int32' if typed_fetch else 'Int64')
+            print(f"  typed_fetch={typed_fetch}: {dict(joined['ratings'].data.dtypes.astype(str))}")
+            executor.disconnect()
+
+
+def test_pool_registry():
+    """Test that executors of one database share a pool regardless of query options"""
+    print("\nTest: pool registry")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        first = make_executor(tmp_dir)
+        second = make_executor(tmp_dir, query_timeout=5.0, typed_fetch=True, memory_cache_bytes=1024 ** 2)
+        other = make_executor(tmp_dir, pool_size=2)
+        first.connect()
+        second.connect()
+        other.connect()
+        assert first.engine is second.engine
+        assert other.engine is not first.engine
+
+        checkouts = first.pool_stats().checkouts
+        assert first.execute("SELECT * FROM users").success
+        assert second.execute("SELECT * FROM users").success
+        stats = second.pool_stats()
+        assert stats is first.pool_stats()
+        assert stats.checkouts == checkouts + 2
+        assert stats.pool_size == 5 and stats.checked_out == 0
+        assert other.pool_stats().pool_size == 2
+
+        engine = first.engine
+        registry.dispose(first._pool_key)
+        first.disconnect()
+        second.disconnect()
+        assert first.execute("SELECT * FROM users").success
+        assert first.engine is not engine
+        assert first.pool_stats().checkouts == 1
+        assert other.execute("SELECT * FROM users").success
+        print(f"  shared checkouts: {stats.checkouts}, wait {stats.avg_wait_time * 1000:.2f} ms")
+        for executor in (first, second, other):
+            executor.disconnect()
+
+
+def test_estimate():
+    """Test that SQLite estimates come from table sizes instead of running the statements"""
+    print("\nTest: estimate")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        schema = executor.get_table_schema(['users', 'movies', 'ratings'])
+        conversion = convert(
+            "TRAIN WITH (users.*, movies.Title, ratings.*) FROM users, movies, ratings WHERE users.Gender='M'",
+            schema=schema, dialect=executor.dialect, join_plan=True
+        )
+        sql_list = conversion.sql_list + [conversion.join_sql]
+
+        executed = []
+        executor.add_hook(lambda result: executed.append(result.sql))
+        executor.estimate(sql_list)
+        assert not any(sql.startswith('SELECT COUNT(*) FROM (') for sql in executed)
+        estimates = {gen_sql.sql: gen_sql.estimated_rows for gen_sql in sql_list}
+        users, movies, ratings, join = (gen_sql.estimated_rows for gen_sql in sql_list)
+        assert (movies, ratings) == (50, 500)
+        assert users == 100 * executor.backend.FILTER_SELECTIVITY
+        assert 0 < join < 500
+        for gen_sql in sql_list:
+            assert gen_sql.estimated_bytes == gen_sql.estimated_rows * len(gen_sql.columns) * 8 \
+                or '*' in gen_sql.columns
+
+        # Table sizes are cached until the database file changes
+        executed.clear()
+        executor.estimate(sql_list)
+        assert all(sql.startswith('EXPLAIN QUERY PLAN') for sql in executed)
+        assert {gen_sql.sql: gen_sql.estimated_rows for gen_sql in sql_list} == estimates
+
+        # After ANALYZE the sizes are read from sqlite_stat1, even when it is stale
+        conn = sqlite3.connect(os.path.join(tmp_dir, "tml.db"))
+        conn.execute("ANALYZE")
+        conn.execute("INSERT INTO ratings (userID, movieID, rating) VALUES (1, 1, 5)")
+        conn.commit()
+        conn.close()
+        executor.estimate(sql_list)
+        assert sql_list[2].estimated_rows == 500
+        assert executor.execute(sql_list[2].sql).row_count == 501
+        print(f"  join estimate: {join} rows, actual {executor.execute(conversion.join_sql.sql).row_count}")
+        executor.disconnect()
+
+
+def test_async_deadline():
+    """Test that async deadlines and fail_fast stop running SQLite statements"""
+    print("\nTest: async deadline")
+
+    async def run(path):
+        async with AsyncDatabaseExecutor(DatabaseConfig(db_type='sqlite', database=path)) as executor:
+            start = time.monotonic()
+            result = await executor.execute(SLOW_SQL, timeout=0.2)
+            assert result.timed_out
+            assert time.monotonic() - start < 5
+            print(f"  deadline: {time.monotonic() - start:.3f}s")
+
+            start = time.monotonic()
+            results = await executor.execute_batch(["SELECT * FROM nosuch", SLOW_SQL, SLOW_SQL],
+                                                   error_policy='fail_fast')
+            assert not results[0].success
+            assert all(result.cancelled for result in results[1:])
+            assert time.monotonic() - start < 5
+            print(f"  fail_fast: {time.monotonic() - start:.3f}s")
+
+            result = await executor.execute("SELECT COUNT(*) AS n FROM ratings")
+            assert result.success and result.data['n'][0] == 500
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        make_executor(tmp_dir).disconnect()
+        asyncio.run(run(os.path.join(tmp_dir, "tml.db")))
+
+
+def test_result_cache():
+    """Test that the on-disk result cache serves repeats and misses after a write"""
+    print("\nTest: result cache")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir, result_cache_dir=os.path.join(tmp_dir, "cache"))
+        sql = "SELECT * FROM ratings WHERE rating >= 4"
+        first = executor.execute(sql)
+        second = executor.execute(sql)
+        assert not first.cache_hit and second.cache_hit
+        assert second.data.equals(first.data)
+        assert not executor.execute(sql, use_cache=False).cache_hit
+
+        with sqlite3.connect(os.path.join(tmp_dir, "tml.db")) as conn:
+            conn.execute("INSERT INTO ratings (userID, movieID, rating) VALUES (1, 1, 5)")
+        third = executor.execute(sql)
+        assert not third.cache_hit
+        assert third.row_count == first.row_count + 1
+        print(f"  rows: {first.row_count} cached, {third.row_count} after insert")
+        executor.disconnect()
+
+        # Uncompressed files are the default; compression is passed through from the config
+        assert executor.result_cache.compression == 'uncompressed'
+        executor = make_executor(tmp_dir, result_cache_dir=os.path.join(tmp_dir, "zstd"),
+                                 result_cache_compression='zstd')
+        assert executor.result_cache.compression == 'zstd'
+        assert not executor.execute(sql).cache_hit
+        hit = executor.execute(sql)
+        assert hit.cache_hit and hit.data.equals(third.data)
+        executor.disconnect()
+
+
+def test_sample():
+    """Test SAMPLE on SQLite with integer and text keys"""
+    print("\nTest: sample")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        with sqlite3.connect(os.path.join(tmp_dir, "tml.db")) as conn:
+            conn.execute("CREATE TABLE tags (Name TEXT PRIMARY KEY, Score INTEGER)")
+            conn.executemany("INSERT INTO tags VALUES (?, ?)", [(f"tag{i}", i) for i in range(2000)])
+
+        schema = executor.get_table_schema(['users', 'ratings', 'tags'])
+        conversion = convert("TRAIN WITH (users.*, ratings.*) FROM users, ratings SAMPLE 30 PERCENT",
+                             schema=schema, dialect=executor.dialect)
+        results = executor.execute_conversion(conversion)
+        users, ratings = results['users'].data, results['ratings'].data
+        assert 0 < len(users) < 100
+        assert set(ratings['userID']) <= set(users['UserID'])
+
+        conversion = convert("TRAIN WITH (tags.*) FROM tags SAMPLE 10 PERCENT",
+                             schema=schema, dialect=executor.dialect)
+        assert "CRC32(Name)" in conversion.sql_list[0].sql
+        tags = executor.execute_conversion(conversion)['tags']
+        assert tags.success and 100 < tags.row_count < 300
+        print(f"  users: {len(users)}, ratings: {len(ratings)}, tags: {tags.row_count}")
+        executor.disconnect()
+
+
+def test_memory_cache():
+    """Test that in-process cache hits are isolated from callers' modifications"""
+    print("\nTest: memory cache")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir, memory_cache_bytes=10 * 1024 ** 2)
+        sql = "SELECT * FROM ratings"
+        first = executor.execute(sql)
+        original = first.data.copy()
+        first.data.loc[:, 'rating'] = 0
+        first.data.drop(columns=['movieID'], inplace=True)
+
+        second = executor.execute(sql)
+        assert not first.cache_hit and second.cache_hit
+        assert second.data.equals(original)
+        second.data.iloc[0, 0] = -1
+
+        typed = executor.execute_typed(sql, 'ratings')
+        assert executor.execute(sql).data.equals(original)
+        assert executor.execute_typed(sql, 'ratings').data.equals(typed.data)
+        print(f"  cached bytes: {executor.memory_cache.total_bytes}")
+        executor.disconnect()
+
+
+def test_routing_unknown_lag():
+    """Test that a replica whose lag cannot be read keeps serving reads unless lag is required"""
+    print("\nTest: routing with unknown lag")
+
+    def no_privilege(executor):
+        raise Exception("Access denied; you need the REPLICATION CLIENT privilege")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config = make_executor(tmp_dir).config
+        for require_lag in (False, True):
+            with RoutingExecutor(config, [config], require_lag=require_lag) as executor:
+                executor.replicas[0].executor.backend.replica_lag = no_privilege
+                stats = executor.check_health()['replica0']
+                assert stats.lag_unknown and stats.lag is None
+                assert stats.healthy is not require_lag
+
+                assert executor.execute("SELECT * FROM users").row_count == 100
+                stats = executor.stats()
+                assert stats['replica0'].queries == (0 if require_lag else 1)
+                print(f"  require_lag={require_lag}: replica healthy {stats['replica0'].healthy}")
+
+
+def test_sharding():
+    """Test scatter-gather over ratings sharded by user and pruning on its own condition"""
+    print("\nTest: sharding")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        default = make_executor(tmp_dir).config
+        shards = []
+        for name, lower, upper in (('s0', None, 51), ('s1', 51, None)):
+            path = os.path.join(tmp_dir, f"{name}.db")
+            make_database(path)
+            with sqlite3.connect(path) as conn:
+                conn.execute("DELETE FROM ratings WHERE userID < ? OR userID >= ?", (lower or 0, upper or 10 ** 9))
+            shards.append(Shard(name, DatabaseConfig(db_type='sqlite', database=path), lower=lower, upper=upper))
+        shard_map = ShardMap(shards, keys={'ratings': 'userID'})
+
+        with ShardedExecutor(shard_map, default) as executor:
+            conversion = convert("TRAIN WITH (users.*, ratings.*) FROM users, ratings "
+                                 "WHERE users.UserID BETWEEN 1 AND 40", dialect=executor.dialect)
+            ratings = conversion.sql_list[1]
+            assert len(shard_map.shards_for('ratings', ratings.condition)) == 2
+            results = executor.execute_conversion(conversion)
+            assert results['users'].row_count == 40
+            assert results['ratings'].row_count == 500
+
+            conversion = convert("TRAIN WITH (users.*, ratings.*) FROM users, ratings "
+                                 "WHERE users.UserID BETWEEN 1 AND 40 AND ratings.userID BETWEEN 1 AND 40",
+                                 dialect=executor.dialect)
+            ratings = conversion.sql_list[1]
+            assert [shard.name for shard in shard_map.shards_for('ratings', ratings.condition)] == ['s0']
+            result = executor.execute(ratings)
+            assert result.success and result.data['userID'].between(1, 40).all()
+            print(f"  pruned ratings: {result.row_count} rows from 1 shard")
+
+
+def check_timings(result):
+    """Assert that a result's phase timings are set and add up to about its total"""
+    timings = result.timings
+    assert timings is not None and timings.total_ns > 0, result.sql
+    assert timings.first_row_ns > 0 and timings.decode_ns > 0, result.sql
+    phases = timings.pool_wait_ns + timings.first_row_ns + timings.fetch_ns + timings.decode_ns
+    # The total also covers bookkeeping between phases; pool waits may precede it
+    assert 0.5 * timings.total_ns <= phases <= timings.total_ns + timings.pool_wait_ns, (result.sql, timings)
+
+
+def test_hooks():
+    """Test that hooks see every executed query once, with its phase timings"""
+    print("\nTest: hooks")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        notified = []
+        executor.add_hook(notified.append)
+        sql_list = ["SELECT * FROM users", "SELECT * FROM movies", "SELECT * FROM ratings"]
+
+        single = executor.execute(sql_list[0])
+        assert notified == [single]
+        for run in (executor.execute_batch, executor.execute_multi):
+            notified.clear()
+            results = run(sql_list)
+            assert len(notified) == len(sql_list)
+            assert sorted(map(id, notified)) == sorted(map(id, results))
+        for result in [single] + results:
+            check_timings(result)
+        executor.disconnect()
+
+        shards = []
+        for name, lower, upper in (('s0', None, 51), ('s1', 51, None)):
+            path = os.path.join(tmp_dir, f"{name}.db")
+            make_database(path)
+            shards.append(Shard(name, DatabaseConfig(db_type='sqlite', database=path), lower=lower, upper=upper))
+        shard_map = ShardMap(shards, keys={'ratings': 'userID'})
+        with ShardedExecutor(shard_map, make_executor(tmp_dir).config) as sharded:
+            notified.clear()
+            sharded.add_hook(notified.append)
+            conversion = convert("TRAIN WITH (users.*, ratings.*) FROM users, ratings", dialect=sharded.dialect)
+            results = sharded.execute_conversion(conversion)
+            assert len(notified) == 2
+            assert sorted(map(id, notified)) == sorted(map(id, results.values()))
+            for result in results.values():
+                check_timings(result)
+        print(f"  ratings: {results['ratings'].timings}")
+
+
+def test_stream_and_arrow():
+    """Test chunked streaming and the columnar fetch path"""
+    print("\nTest: stream and arrow")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir, spill_dir=tmp_dir)
+        sql = "SELECT * FROM ratings ORDER BY RatingID"
+        expected = executor.execute(sql).data
+
+        # 4 columns at 32 bytes per value: the first chunk holds 100 rows
+        chunks = list(executor.execute_stream(sql, target_bytes=4 * 32 * 100))
+        assert len(chunks[0]) == 100
+        assert pd.concat(chunks, ignore_index=True).equals(expected)
+
+        batches = list(executor.execute_stream(sql, chunk_rows=128, as_arrow=True))
+        assert [batch.num_rows for batch in batches] == [128, 128, 128, 116]
+        assert list(executor.execute_stream("SELECT * FROM ratings WHERE rating > 5"))[0].empty
+
+        result = executor.execute_arrow(sql, batch_rows=64)
+        assert result.success and not result.spilled
+        assert result.arrow_table.num_rows == 500
+        assert (result.data['rating'].to_numpy() == expected['rating'].to_numpy()).all()
+
+        spilled = executor.execute_arrow(sql, batch_rows=64, memory_budget=1024)
+        assert spilled.spilled and spilled.arrow_table.equals(result.arrow_table)
+        print(f"  stream chunks: {len(chunks)}, arrow batches: {len(batches)}")
+        del spilled
+        executor.disconnect()
+
+
+def test_timeout():
+    """Test that deadlines stop running SQLite statements"""
+    print("\nTest: timeout")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir, query_timeout=0.2)
+        start = time.monotonic()
+        result = executor.execute(SLOW_SQL)
+        assert not result.success and result.timed_out
+        assert time.monotonic() - start < 5
+
+        results = executor.execute_batch([SLOW_SQL, "SELECT * FROM users"], timeout=0.2)
+        assert results[0].timed_out and results[1].success
+        assert executor.execute("SELECT * FROM users", timeout=10).row_count == 100
+
+        # Interrupted by fail_fast well before its deadline: cancelled, not timed out
+        results = executor.execute_batch(
+            [SLOW_SQL, "SELECT * FROM nosuch"], max_workers=2, error_policy='fail_fast', timeout=30
+        )
+        assert not results[1].success and not results[1].timed_out
+        assert results[0].cancelled and not results[0].timed_out, results[0]
+        print(f"  timed out after {result.execution_time:.3f}s")
+        executor.disconnect()
+
+
+def test_paged():
+    """Test that keyset pages add up to the table, for single and composite keys"""
+    print("\nTest: paged")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        with sqlite3.connect(os.path.join(tmp_dir, "tml.db")) as conn:
+            conn.execute("CREATE TABLE watched (userID INTEGER, movieID INTEGER, times INTEGER, "
+                         "PRIMARY KEY (userID, movieID))")
+            # Keys of one user span page boundaries
+            conn.executemany("INSERT INTO watched VALUES (?, ?, ?)",
+                             [(user, movie, user * movie) for user in range(1, 21) for movie in range(1, 12)])
+
+        schema = executor.get_table_schema(['ratings', 'watched'])
+        assert schema['watched']['primary_keys'] == ['userID', 'movieID']
+        for table, keys, page_size in (('ratings', ['RatingID'], 64), ('watched', ['userID', 'movieID'], 7)):
+            conversion = convert(f"TRAIN WITH ({table}.*) FROM {table}",
+                                 schema=schema, dialect=executor.dialect, page_size=page_size)
+            pages = list(executor.execute_paged(conversion.sql_list[0]))
+            assert all(page.success for page in pages)
+            assert all(page.row_count == page_size for page in pages[:-1])
+            assert pages[-1].row_count < page_size
+
+            paged = pd.concat([page.data for page in pages], ignore_index=True)
+            full = executor.execute(f"SELECT * FROM {table}").data.sort_values(keys).reset_index(drop=True)
+            assert not paged.duplicated(subset=keys).any()
+            assert paged.equals(full)
+            print(f"  {table}: {len(pages)} pages of {page_size}, {len(paged)} rows")
+        executor.disconnect()
+
+
+def test_partitioned():
+    """Test that partitioned fetches return the rows of the single query"""
+    print("\nTest: partitioned fetch")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        schema = executor.get_table_schema(['ratings'])
+        gen_sql = convert("TRAIN WITH (ratings.*) FROM ratings WHERE ratings.rating >= 2",
+                          schema=schema, dialect=executor.dialect).sql_list[0]
+        expected = executor.execute(gen_sql.sql + " ORDER BY RatingID").data
+
+        for split in ('range', 'quantile'):
+            result = executor.execute_partitioned(gen_sql, partitions=4, split=split)
+            assert result.success and result.row_count == len(expected)
+            assert result.arrow_table.column('RatingID').to_pylist() == expected['RatingID'].tolist()
+
+        limited = convert("TRAIN WITH (ratings.*) FROM ratings LIMIT 10",
+                          schema=schema, dialect=executor.dialect).sql_list[0]
+        assert executor.execute_partitioned(limited, partitions=4).row_count == 10
+        print(f"  rows: {len(expected)}")
+        executor.disconnect()
+
+
+def test_incremental():
+    """Test incremental refresh of a cached snapshot after inserts, updates and deletes"""
+    print("\nTest: incremental refresh")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir, result_cache_dir=os.path.join(tmp_dir, "cache"))
+        path = os.path.join(tmp_dir, "tml.db")
+        schema = executor.get_table_schema(['ratings'])
+        gen_sql = convert("TRAIN WITH (ratings.*) FROM ratings WHERE ratings.rating >= 3",
+                          schema=schema, dialect=executor.dialect).sql_list[0]
+
+        def expected():
+            return executor.execute(gen_sql.sql + " ORDER BY RatingID", use_cache=False).data
+
+        first = executor.execute_incremental(gen_sql)
+        assert first.success and first.row_count == len(expected())
+
+        with sqlite3.connect(path) as conn:
+            conn.executemany("INSERT INTO ratings (userID, movieID, rating) VALUES (?, ?, ?)",
+                             [(1, 1, 5), (2, 2, 1), (3, 3, 4)])
+        refreshed = executor.execute_incremental(gen_sql)
+        assert refreshed.delta_rows == 2
+        data = refreshed.data.sort_values('RatingID').reset_index(drop=True)
+        assert data['RatingID'].tolist() == expected()['RatingID'].tolist()
+
+        with sqlite3.connect(path) as conn:
+            conn.execute("DELETE FROM ratings WHERE RatingID = (SELECT MIN(RatingID) FROM ratings WHERE rating >= 3)")
+        reloaded = executor.execute_incremental(gen_sql)
+        assert reloaded.success and reloaded.row_count == len(expected())
+        assert sorted(reloaded.data['RatingID']) == expected()['RatingID'].tolist()
+        print(f"  rows: {first.row_count}, +{refreshed.delta_rows} refreshed, {reloaded.row_count} after delete")
+        executor.disconnect()
+
+
+def test_semi_join():
+    """Test that every semi-join strategy returns the rows matching the key set"""
+    print("\nTest: semi-join")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        users = executor.execute("SELECT * FROM users WHERE Gender = 'M'").data
+        ratings = executor.execute("SELECT * FROM ratings").data
+        expected = sorted(ratings[ratings['userID'].isin(users['UserID'])]['RatingID'])
+        keys = users['UserID'].tolist() + [None, users['UserID'][0]]
+
+        for strategy in ('auto', 'in', 'temp_table', 'filter'):
+            result = executor.execute_semi_join("SELECT * FROM ratings", 'userID', keys, strategy=strategy)
+            assert result.success, result.error
+            assert sorted(result.data['RatingID']) == expected
+
+        empty = executor.execute_semi_join("SELECT * FROM ratings", 'userID', [])
+        assert empty.success and empty.row_count == 0 and 'rating' in empty.data.columns
+        print(f"  {len(users)} keys, {len(expected)} ratings")
+        executor.disconnect()
+
+
+def test_execute_multi():
+    """Test that a failing statement in a multi-statement batch fails alone"""
+    print("\nTest: execute_multi")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        notified = []
+        executor.add_hook(notified.append)
+        sql_list = ["SELECT * FROM users", "SELECT * FROM nosuch", "SELECT * FROM movies", "SELECT * FROM ratings"]
+        results = executor.execute_multi(sql_list)
+
+        assert len(results) == len(sql_list)
+        assert [result.success for result in results] == [True, False, True, True]
+        assert [result.sql for result in results] == sql_list
+        assert 'nosuch' in results[1].error and results[1].data is None
+        assert all(result.error is None for result in results if result.success)
+        assert [result.row_count for result in results] == [100, 0, 50, 500]
+        assert notified == results
+
+        # The connection stays usable after the failure
+        assert executor.execute("SELECT * FROM users").row_count == 100
+        print(f"  results: {[result.success for result in results]}")
+        executor.disconnect()
+
+
+def test_colon_literal():
+    """Test that ':word' inside a string literal is not taken for a bind parameter"""
+    print("\nTest: colon in string literal")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir)
+        path = os.path.join(tmp_dir, "tml.db")
+        with sqlite3.connect(path) as conn:
+            conn.execute("INSERT INTO movies VALUES (1000, 'Alien: Resurrection', 'a :b')")
+
+        result = executor.execute("SELECT * FROM movies WHERE Genre = 'a :b'")
+        assert result.success and result.data['Title'].tolist() == ['Alien: Resurrection']
+        assert executor.execute("SELECT * FROM movies WHERE Genre = ?", ('a :b',)).row_count == 1
+        assert executor.execute("SELECT * FROM movies WHERE Genre = :genre", {'genre': 'a :b'}).row_count == 1
+        assert len(next(executor.execute_stream("SELECT Title FROM movies WHERE Title LIKE '%: %'"))) == 1
+        executor.disconnect()
+
+        async def run():
+            async with AsyncDatabaseExecutor(DatabaseConfig(db_type='sqlite', database=path)) as async_executor:
+                result = await async_executor.execute("SELECT * FROM movies WHERE Genre = 'a :b'")
+                assert result.success and result.row_count == 1
+                chunks = [chunk async for chunk in async_executor.execute_stream("SELECT * FROM movies WHERE Genre = 'a :b'")]
+                assert sum(len(chunk) for chunk in chunks) == 1
+
+        asyncio.run(run())
+        print("  [SUCCESS] literal colons are kept")
+
+
+def test_spill_null_leading_batches():
+    """Test spilling when a column is NULL in every batch held before the budget is hit"""
+    print("\nTest: spill with leading NULL batches")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        executor = make_executor(tmp_dir, spill_dir=tmp_dir)
+        with sqlite3.connect(os.path.join(tmp_dir, "tml.db")) as conn:
+            conn.execute("CREATE TABLE notes (id INTEGER PRIMARY KEY, note TEXT, score REAL)")
+            conn.executemany("INSERT INTO notes VALUES (?, ?, ?)",
+                             [(i, None if i < 200 else f"note {i}", None if i < 300 else i / 2)
+                              for i in range(400)])
+
+        sql = "SELECT * FROM notes ORDER BY id"
+        expected = executor.execute_arrow(sql, batch_rows=64)
+        spilled = executor.execute_arrow(sql, batch_rows=64, memory_budget=512)
+        assert spilled.success, spilled.error
+        assert spilled.spilled and spilled.row_count == 400
+        assert spilled.arrow_table.schema.equals(expected.arrow_table.schema)
+        assert spilled.arrow_table.equals(expected.arrow_table)
+        print(f"  schema: {spilled.arrow_table.schema.types}")
+        del spilled
+        executor.disconnect()
+
+
+if __name__ == "__main__":
+    test_batch_fail_fast()
+    test_join_plan()
+    test_join_plan_dtypes()
+    test_pool_registry()
+    test_estimate()
+    test_async_deadline()
+    test_result_cache()
+    test_sample()
+    test_memory_cache()
+    test_routing_unknown_lag()
+    test_sharding()
+    test_hooks()
+    test_stream_and_arrow()
+    test_timeout()
+    test_paged()
+    test_partitioned()
+    test_incremental()
+    test_semi_join()
+    test_execute_multi()
+    test_colon_literal()
+    test_spill_null_leading_batches()
@@ -0,0 +1,178 @@
+"""Tests for SQL generation options
+"""
+
+import sys
+
+sys.path.append("./")
+sys.path.append("../")
+sys.path.append("../../")
+
+from tlsql import Parser, SQLGenerator, GenerationError, ParseError
+
+
+SCHEMA = {
+    'users': {'primary_keys': ['UserID'], 'foreign_keys': {}},
+    'movies': {'primary_keys': ['MovieID'], 'foreign_keys': {}},
+    'ratings': {
+        'primary_keys': ['UserID', 'MovieID'],
+        'foreign_keys': {'UserID': ('users', 'UserID'), 'MovieID': ('movies', 'MovieID')},
+    },
+}
+
+
+def test_keyset_pagination():
+    """Test keyset pagination plans"""
+    print("\nTest: keyset pagination")
+
+    query = """
+    TRAIN WITH (users.Gender, ratings.*)
+    FROM users, ratings
+    WHERE users.Gender='M' OR users.Age > 30
+    """
+    result = SQLGenerator.convert(query, schema=SCHEMA, page_size=1000)
+    users, ratings = result.sql_list
+
+    print(f"  first: {users.pagination.first_sql}")
+    print(f"  next:  {users.pagination.next_sql}")
+    assert users.sql == "SELECT Gender FROM users WHERE Gender = 'M' OR Age > 30"
+    assert users.pagination.first_sql == (
+        "SELECT Gender, UserID FROM users WHERE Gender = 'M' OR Age > 30 "
+        "ORDER BY UserID LIMIT :n"
+    )
+    assert users.pagination.next_sql == (
+        "SELECT Gender, UserID FROM users WHERE (Gender = 'M' OR Age > 30) AND UserID > :last_0 "
+        "ORDER BY UserID LIMIT :n"
+    )
+    assert ratings.pagination.next_sql == (
+        "SELECT * FROM ratings WHERE (UserID, MovieID) > (:last_0, :last_1) "
+        "ORDER BY UserID, MovieID LIMIT :n"
+    )
+    assert users.pagination.params() == {'n': 1000}
+    assert ratings.pagination.params({'UserID': 7, 'MovieID': 42}) == {'n': 1000, 'last_0': 7, 'last_1': 42}
+
+    assert SQLGenerator.convert(query).sql_list[0].pagination is None
+
+    try:
+        SQLGenerator.convert("PREDICT VALUE(items.x, CLF) FROM items", schema=SCHEMA, page_size=10)
+        raise AssertionError("Expected GenerationError for table without primary key")
+    except GenerationError as e:
+        print(f"  [EXPECTED FAIL] {e}")
+
+
+def test_sample_and_limit():
+    """Test SAMPLE and LIMIT clauses"""
+    print("\nTest: SAMPLE and LIMIT")
+
+    query = """
+    TRAIN WITH (users.*, movies.*, ratings.*)
+    FROM users, movies, ratings
+    WHERE users.Gender='M'
+    SAMPLE 5 PERCENT
+    LIMIT 100000
+    """
+    ast = Parser(query).parse()
+    assert ast.train.sample.percent == 5
+    assert ast.train.limit.count == 100000
+
+    result = SQLGenerator.convert(query, schema=SCHEMA)
+    users, movies, ratings = result.sql_list
+    for gen_sql in result.sql_list:
+        print(f"  {gen_sql.sql}")
+    assert result.sample_percent == 5 and result.limit == 100000
+    assert users.sql == "SELECT * FROM users WHERE (Gender = 'M') AND CRC32(UserID) % 10000 < 500 LIMIT 100000"
+    assert ratings.sql == "SELECT * FROM ratings WHERE CRC32(UserID) % 10000 < 500 LIMIT 100000"
+    assert movies.sql == "SELECT * FROM movies LIMIT 100000"
+
+    random_sqls = SQLGenerator.convert(query, dialect='duckdb').sql_list
+    assert random_sqls[1].sql == "SELECT * FROM movies TABLESAMPLE 5% (bernoulli) LIMIT 100000"
+
+    for bad_query in [
+        "TRAIN WITH (users.*) FROM users SAMPLE 0 PERCENT",
+        "TRAIN WITH (users.*) FROM users SAMPLE 5",
+        "TRAIN WITH (users.*) FROM users LIMIT 2.5",
+    ]:
+        try:
+            Parser(bad_query).parse()
+            raise AssertionError(f"Expected ParseError for: {bad_query}")
+        except ParseError as e:
+            print(f"  [EXPECTED FAIL] {e}")
+
+    try:
+        SQLGenerator.convert(query, schema=SCHEMA, page_size=10)
+        raise AssertionError("Expected GenerationError for LIMIT with pagination")
+    except GenerationError as e:
+        print(f"  [EXPECTED FAIL] {e}")
+
+    # Clause keywords stay usable as column names
+    keyword_columns = SQLGenerator.convert(
+        "TRAIN WITH (users.sample, users.limit) FROM users WHERE users.percent > 3 SAMPLE 5 PERCENT"
+    ).sql_list[0]
+    assert keyword_columns.columns == ['sample', 'limit']
+    assert keyword_columns.condition.startswith("(percent > 3) AND ")
+
+    tiny = SQLGenerator.convert("TRAIN WITH (users.*) FROM users SAMPLE 0.001 PERCENT", schema=SCHEMA)
+    assert tiny.sql_list[0].sql == "SELECT * FROM users WHERE CRC32(UserID) % 10000 < 1"
+
+    typed = dict(SCHEMA, users=dict(SCHEMA['users'], types={'UserID': 'integer'}))
+    sqlite_query = "TRAIN WITH (users.*) FROM users SAMPLE 5 PERCENT"
+    sqlite_int = SQLGenerator.convert(sqlite_query, schema=typed, dialect='sqlite').sql_list[0]
+    assert sqlite_int.condition == "ABS(UserID * 2654435761 % 4294967296) % 10000 < 500"
+    text_keyed = dict(SCHEMA, users=dict(SCHEMA['users'], types={'UserID': 'text'}))
+    sqlite_text = SQLGenerator.convert(sqlite_query, schema=text_keyed, dialect='sqlite').sql_list[0]
+    assert sqlite_text.condition == "CRC32(UserID) % 10000 < 500"
+
+    # No single-column key to hash on in the catalog, so duckdb samples randomly
+    paged = SQLGenerator.convert(
+        "TRAIN WITH (users.*) FROM users SAMPLE 5 PERCENT", dialect='duckdb', page_size=10,
+        schema={'users': {'primary_keys': ['Name', 'Age'], 'foreign_keys': {}}}
+    ).sql_list[0]
+    assert paged.sql == "SELECT * FROM users TABLESAMPLE 5% (bernoulli)"
+    assert paged.pagination.first_sql.startswith("SELECT * FROM users TABLESAMPLE 5% (bernoulli) ORDER BY")
+    assert paged.pagination.next_sql.startswith("SELECT * FROM users TABLESAMPLE 5% (bernoulli) WHERE (Name, Age) >")
+
+
+def test_join_plan():
+    """Test join-plan generation"""
+    print("\nTest: join plan")
+
+    schema = {
+        table: dict(SCHEMA[table], columns=columns)
+        for table, columns in [
+            ('users', ['UserID', 'Gender']),
+            ('movies', ['MovieID', 'Title']),
+            ('ratings', ['UserID', 'MovieID', 'Rating']),
+        ]
+    }
+    query = """
+    TRAIN WITH (users.*, movies.Title, ratings.*)
+    FROM users, movies, ratings
+    WHERE users.Gender='M' AND ratings.Rating > 3
+    """
+    result = SQLGenerator.convert(query, schema=schema, join_plan=True)
+    print(f"  {result.join_sql.sql}")
+
+    assert len(result.sql_list) == 3
+    assert result.join_sql.table == 'users'
+    assert result.join_sql.sql == (
+        "SELECT users.UserID AS users__UserID, users.Gender AS users__Gender, "
+        "movies.Title AS movies__Title, movies.MovieID AS movies__MovieID, ratings.UserID AS ratings__UserID, "
+        "ratings.MovieID AS ratings__MovieID, ratings.Rating AS ratings__Rating "
+        "FROM users LEFT JOIN ratings ON users.UserID = ratings.UserID AND (ratings.Rating > 3) "
+        "LEFT JOIN movies ON ratings.MovieID = movies.MovieID "
+        "WHERE users.Gender = 'M'"
+    )
+
+    assert SQLGenerator.convert(query, schema=schema).join_sql is None
+    sampled = query + " SAMPLE 5 PERCENT"
+    assert "CRC32(users.UserID) % 10000 < 500" in SQLGenerator.convert(sampled, schema=schema, join_plan=True).join_sql.sql
+    no_anchor_key = dict(schema, users=dict(schema['users'], primary_keys=['UserID', 'Gender']))
+    assert SQLGenerator.convert(sampled, schema=no_anchor_key, join_plan=True).join_sql is None
+    no_keys = dict(schema, movies=dict(schema['movies'], primary_keys=[]))
+    assert SQLGenerator.convert(query, schema=no_keys, join_plan=True).join_sql is None
+    assert SQLGenerator.convert(query, schema=SCHEMA, join_plan=True).join_sql is None
+
+
+if __name__ == "__main__":
+    test_keyset_pagination()
+    test_sample_and_limit()
+    test_join_plan()
@@ -1,5 +1,7 @@
 """Core components"""
 
+__version__ = "0.1.0"
+
 from .tokens import Token, TokenType
 from .lexer import Lexer
 from .parser import Parser
@@ -14,6 +16,8 @@ from .ast_nodes import (
     BetweenExpr,
     InExpr,
     WhereClause,
+    SampleClause,
+    LimitClause,
     ColumnSelector,
     WithClause,
     TablesClause,
@@ -26,7 +30,8 @@ from .ast_nodes import (
     Statement,
 )
 from .exceptions import TLSQLError, LexerError, ParseError, GenerationError
-from .sql_generator import SQLGenerator, GeneratedSQL, ConversionResult
+from .sql_generator import SQLGenerator, GeneratedSQL, ConversionResult, KeysetPagination
+from .cache import ConversionCache
 
 __all__ = [
     # Tokens
@@ -47,6 +52,8 @@ __all__ = [
     "BetweenExpr",
     "InExpr",
     "WhereClause",
+    "SampleClause",
+    "LimitClause",
     "ColumnSelector",
     "WithClause",
     "TablesClause",
@@ -65,4 +72,7 @@ __all__ = [
     # SQL generator results
     "GeneratedSQL",
     "ConversionResult",
+    "KeysetPagination",
+    # Conversion cache
+    "ConversionCache",
 ]
@@ -186,6 +186,32 @@ class TablesClause(ASTNode):
     tables: List[str] = field(default_factory=list)
 
 
+@dataclass
+class SampleClause(ASTNode):
+    """SAMPLE clause.
+
+    Syntax: SAMPLE number PERCENT.
+
+    Attributes:
+        percent: Sampling rate in percent, in (0, 100].
+    """
+
+    percent: float
+
+
+@dataclass
+class LimitClause(ASTNode):
+    """LIMIT clause.
+
+    Syntax: LIMIT number.
+
+    Attributes:
+        count: Maximum number of rows per table.
+    """
+
+    count: int
+
+
 @dataclass
 class TrainStatement(ASTNode):
     """TRAIN statement.
@@ -194,16 +220,22 @@ class TrainStatement(ASTNode):
     TRAIN WITH (column_selectors)
     FROM table1, table2, ...
     [WHERE conditions]
+    [SAMPLE number PERCENT]
+    [LIMIT number]
 
     Attributes:
         with_clause: WITH clause.
         tables: Tables clause.
         where: WHERE clause.
+        sample: SAMPLE clause.
+        limit: LIMIT clause.
     """
 
     with_clause: WithClause
     tables: TablesClause
     where: Optional[WhereClause] = None
+    sample: Optional[SampleClause] = None
+    limit: Optional[LimitClause] = None
 
     def __repr__(self) -> str:
         parts = ["TrainStatement("]
@@ -211,6 +243,10 @@ class TrainStatement(ASTNode):
         parts.append(f"  tables={', '.join(self.tables.tables)}")
         if self.where:
             parts.append("  where=<expression>")
+        if self.sample:
+            parts.append(f"  sample={self.sample.percent} percent")
+        if self.limit:
+            parts.append(f"  limit={self.limit.count}")
         parts.append(")")
         return "\n".join(parts)
 
@@ -222,16 +258,22 @@ class ValidateStatement(ASTNode):
     VALIDATE WITH (column_selectors)
     FROM table1, table2, ...
     [WHERE conditions]
+    [SAMPLE number PERCENT]
+    [LIMIT number]
 
     Attributes:
         with_clause: WITH clause.
         tables: Tables clause.
         where: WHERE clause.
+        sample: SAMPLE clause.
+        limit: LIMIT clause.
     """
 
     with_clause: WithClause
     tables: TablesClause
     where: Optional[WhereClause] = None
+    sample: Optional[SampleClause] = None
+    limit: Optional[LimitClause] = None
 
     def __repr__(self) -> str:
         parts = ["ValidateStatement("]
@@ -239,6 +281,10 @@ class ValidateStatement(ASTNode):
         parts.append(f"  tables={', '.join(self.tables.tables)}")
         if self.where:
             parts.append("  where=<expression>")
+        if self.sample:
+            parts.append(f"  sample={self.sample.percent} percent")
+        if self.limit:
+            parts.append(f"  limit={self.limit.count}")
         parts.append(")")
         return "\n".join(parts)
 
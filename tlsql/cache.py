@@ -0,0 +1,187 @@
+"""Persistent conversion cache.
+
+Stores ConversionResult objects in a single SQLite file so that parse and
+generation cost is paid once per machine instead of once per process.
+"""
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from . import __version__
+from .lexer import Lexer
+from .tokens import TokenType
+from .sql_generator import SQLGenerator, ConversionResult
+
+
+class ConversionCache:
+    """Disk-backed LRU cache of ConversionResult objects.
+
+    Entries are keyed by a fingerprint of the normalized token stream, the
+    generator options and the library version. The SQLite database runs in WAL
+    mode, so any number of processes can read while one writes; every write is a
+    single transaction, so readers never observe a partial entry. When the total
+    payload exceeds ``max_bytes`` the least recently used entries are evicted.
+
+    Attributes:
+        path: Path of the cache database file.
+        max_bytes: Upper bound on the total size of stored entries.
+        timeout: Seconds to wait for a lock held by another process.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024, timeout: float = 30.0):
+        """Initialize cache, creating the database file if needed.
+
+        Args:
+            path: Path of the cache database file.
+            max_bytes: Upper bound on the total size of stored entries.
+            timeout: Seconds to wait for a lock held by another process.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS conversions ("
+                " key TEXT PRIMARY KEY,"
+                " payload BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS conversions_last_access ON conversions (last_access)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def fingerprint(tlsql: str, **options) -> str:
+        """Compute cache key for a statement.
+
+        Whitespace, comments and keyword case do not change the fingerprint,
+        identifiers and literals do.
+
+        Args:
+            tlsql: TLSQL statement string.
+            **options: Generator options used for the conversion.
+
+        Returns:
+            Hex digest identifying the statement, options and library version.
+        """
+        tokens = []
+        for token in Lexer(tlsql).tokenize():
+            if token.type in (TokenType.IDENTIFIER, TokenType.STRING, TokenType.NUMBER):
+                tokens.append([token.type.name, token.value])
+            elif token.type != TokenType.EOF:
+                tokens.append([token.type.name])
+
+        key_data = json.dumps(
+            {'version': __version__, 'tokens': tokens, 'options': options},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[ConversionResult]:
+        """Look up a cached result.
+
+        Args:
+            key: Fingerprint from :meth:`fingerprint`.
+
+        Returns:
+            Cached ConversionResult or None on a miss.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM conversions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            try:
+                result = pickle.loads(row[0])
+            except Exception:
+                conn.execute("DELETE FROM conversions WHERE key = ?", (key,))
+                return None
+
+            try:
+                conn.execute(
+                    "UPDATE conversions SET last_access = ? WHERE key = ?", (time.time(), key)
+                )
+            except sqlite3.OperationalError:
+                # Recency is best effort, a busy writer must not fail the read
+                pass
+            return result
+
+    def put(self, key: str, result: ConversionResult) -> None:
+        """Store a result and evict least recently used entries over the size bound.
+
+        Args:
+            key: Fingerprint from :meth:`fingerprint`.
+            result: ConversionResult to store.
+        """
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO conversions (key, payload, size, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time())
+            )
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM conversions").fetchone()[0]
+            if total > self.max_bytes:
+                rows = conn.execute(
+                    "SELECT key, size FROM conversions WHERE key != ? ORDER BY last_access",
+                    (key,)
+                ).fetchall()
+                evicted = []
+                for old_key, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    evicted.append((old_key,))
+                    total -= size
+                conn.executemany("DELETE FROM conversions WHERE key = ?", evicted)
+
+    def get_or_convert(self, tlsql: str, **options) -> ConversionResult:
+        """Return cached conversion of a statement, converting and storing it on a miss.
+
+        Args:
+            tlsql: TLSQL statement string.
+            **options: Keyword arguments passed to :class:`SQLGenerator`.
+
+        Returns:
+            ConversionResult for the statement.
+        """
+        key = self.fingerprint(tlsql, **options)
+        result = self.get(key)
+        if result is None:
+            result = SQLGenerator.convert(tlsql, **options)
+            self.put(key, result)
+        return result
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM conversions")
+
+    def __len__(self) -> int:
+        """Return number of cached entries."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM conversions").fetchone()[0]
@@ -8,7 +8,7 @@ Supports three statement types:
 
 from typing import Optional
 from .lexer import Lexer
-from .tokens import Token, TokenType
+from .tokens import Token, TokenType, CLAUSE_KEYWORDS
 from .ast_nodes import (
     Statement,
     TrainStatement,
@@ -22,6 +22,8 @@ from .ast_nodes import (
     FromClause,
     PredictType,
     WhereClause,
+    SampleClause,
+    LimitClause,
     Expr,
     LiteralExpr,
     ColumnExpr,
@@ -105,6 +107,23 @@ class Parser:
         self.advance()
         return token
 
+    def expect_column_name(self) -> Token:
+        """Expect and consume the column name following ``table.``.
+
+        Clause keywords such as SAMPLE are accepted as names here.
+
+        Returns:
+            Column name token.
+
+        Raises:
+            ParseError: Raised when the current token cannot name a column.
+        """
+        if self.current_token is not None and self.current_token.type in CLAUSE_KEYWORDS:
+            token = self.current_token
+            self.advance()
+            return token
+        return self.expect(TokenType.IDENTIFIER)
+
     def match(self, *token_types: TokenType) -> bool:
         """Check whether current token matches any given types.
 
@@ -172,7 +191,7 @@ class Parser:
             statement_type: 'TRAIN' or 'VALIDATE'.
 
         Returns:
-            Tuple (with_clause, tables, where).
+            Tuple (with_clause, tables, where, sample, limit).
         """
         with_clause = self.parse_with_clause()
 
@@ -182,6 +201,14 @@ class Parser:
         if self.match(TokenType.WHERE):
             where = self.parse_where_clause()
 
+        sample = None
+        if self.match(TokenType.SAMPLE):
+            sample = self.parse_sample_clause()
+
+        limit = None
+        if self.match(TokenType.LIMIT):
+            limit = self.parse_limit_clause()
+
         if self.match(TokenType.SEMICOLON):
             self.advance()
 
@@ -192,7 +219,7 @@ class Parser:
                 self.current_token.col_num
             )
 
-        return with_clause, tables, where
+        return with_clause, tables, where, sample, limit
 
     def parse_train_statement(self) -> TrainStatement:
         """Parse TRAIN statement.
@@ -201,8 +228,9 @@ class Parser:
             TrainStatement node.
         """
         self.expect(TokenType.TRAIN)
-        with_clause, tables, where = self._parse_train_or_validate_statement('TRAIN')
-        return TrainStatement(with_clause=with_clause, tables=tables, where=where)
+        with_clause, tables, where, sample, limit = self._parse_train_or_validate_statement('TRAIN')
+        return TrainStatement(with_clause=with_clause, tables=tables, where=where,
+                              sample=sample, limit=limit)
 
     def parse_validate_statement(self) -> ValidateStatement:
         """Parse VALIDATE statement.
@@ -211,8 +239,9 @@ class Parser:
             ValidateStatement node.
         """
         self.expect(TokenType.VALIDATE)
-        with_clause, tables, where = self._parse_train_or_validate_statement('VALIDATE')
-        return ValidateStatement(with_clause=with_clause, tables=tables, where=where)
+        with_clause, tables, where, sample, limit = self._parse_train_or_validate_statement('VALIDATE')
+        return ValidateStatement(with_clause=with_clause, tables=tables, where=where,
+                                 sample=sample, limit=limit)
 
     def parse_with_clause(self) -> WithClause:
         """Parse WITH clause.
@@ -254,7 +283,7 @@ class Parser:
             column = '*'
             self.advance()
         else:
-            column_token = self.expect(TokenType.IDENTIFIER)
+            column_token = self.expect_column_name()
             column = column_token.value
 
         return ColumnSelector(table=table_token.value, column=column)
@@ -281,6 +310,52 @@ class Parser:
 
         return TablesClause(tables=tables)
 
+    def parse_sample_clause(self) -> SampleClause:
+        """Parse SAMPLE clause.
+
+        Syntax: SAMPLE number PERCENT.
+
+        Returns:
+            SampleClause node.
+
+        Raises:
+            ParseError: Sampling rate outside (0, 100].
+        """
+        self.expect(TokenType.SAMPLE)
+        number_token = self.expect(TokenType.NUMBER)
+        self.expect(TokenType.PERCENT)
+
+        percent = float(number_token.value)
+        if not 0 < percent <= 100:
+            raise ParseError(
+                f"SAMPLE percent must be in (0, 100], got {number_token.value}",
+                number_token.line_num,
+                number_token.col_num
+            )
+        return SampleClause(percent=percent)
+
+    def parse_limit_clause(self) -> LimitClause:
+        """Parse LIMIT clause.
+
+        Syntax: LIMIT number.
+
+        Returns:
+            LimitClause node.
+
+        Raises:
+            ParseError: Row count is not a positive integer.
+        """
+        self.expect(TokenType.LIMIT)
+        number_token = self.expect(TokenType.NUMBER)
+
+        if not number_token.value.isdigit() or int(number_token.value) == 0:
+            raise ParseError(
+                f"LIMIT must be a positive integer, got {number_token.value}",
+                number_token.line_num,
+                number_token.col_num
+            )
+        return LimitClause(count=int(number_token.value))
+
     def parse_predict_statement(self) -> PredictStatement:
         """Parse PREDICT statement.
 
@@ -360,7 +435,7 @@ class Parser:
 
         if self.match(TokenType.DOT):
             self.advance()
-            column_token = self.expect(TokenType.IDENTIFIER)
+            column_token = self.expect_column_name()
             return ColumnReference(table=first_token.value, column=column_token.value)
         else:
             return ColumnReference(column=first_token.value)
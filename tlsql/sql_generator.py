@@ -5,7 +5,7 @@ Converts TLSQL AST into standard SQL statements or filtering conditions.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 from .ast_nodes import (
     Statement,
     TrainStatement,
@@ -13,6 +13,7 @@ from .ast_nodes import (
     PredictStatement,
     ColumnSelector,
     WhereClause,
+    SampleClause,
     Expr,
     BinaryExpr,
     UnaryExpr,
@@ -25,6 +26,55 @@ from .exceptions import GenerationError
 from .parser import Parser
 
 
+# Dialects understood by the sampling code path
+SUPPORTED_DIALECTS = ('mysql', 'sqlite', 'duckdb', 'postgresql')
+
+# Hash buckets used for key-based sampling, giving 0.01 percent resolution
+SAMPLE_BUCKETS = 10000
+
+# Separator between table and column in the column aliases of a join plan
+JOIN_ALIAS_SEPARATOR = '__'
+
+
+@dataclass
+class KeysetPagination:
+    """Keyset pagination plan for one generated SELECT.
+
+    Pages are ordered by the primary key and each page after the first
+    resumes strictly after the last key seen, so no OFFSET scan is needed.
+
+    Attributes:
+        key_columns: Primary key columns used as the page cursor.
+        page_size: Maximum number of rows per page.
+        first_sql: SQL for the first page, bound with ``:n``.
+        next_sql: SQL for following pages, bound with ``:last_<i>`` and ``:n``.
+    """
+    key_columns: List[str]
+    page_size: int
+    first_sql: str
+    next_sql: str
+
+    def sql_for(self, last_row: Optional[Dict[str, Any]] = None) -> str:
+        """Return the page SQL to run after ``last_row`` (None for the first page)."""
+        return self.first_sql if last_row is None else self.next_sql
+
+    def params(self, last_row: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Return bind parameters for the page after ``last_row``.
+
+        Args:
+            last_row: Mapping holding the key columns of the last fetched row.
+
+        Returns:
+            Dict of named parameters for :meth:`sql_for`.
+        """
+        params = {'n': self.page_size}
+        if last_row is not None:
+            for i, column in enumerate(self.key_columns):
+                value = last_row[column]
+                params[f'last_{i}'] = value.item() if hasattr(value, 'item') else value
+        return params
+
+
 @dataclass
 class GeneratedSQL:
     """Generated SQL statement.
@@ -33,10 +83,20 @@ class GeneratedSQL:
         table: Table name.
         sql: SQL string.
         columns: Selected column list.
+        condition: WHERE condition applied to the table.
+        pagination: Keyset pagination plan, set when paging is enabled.
+        estimated_rows: Row estimate from the database's EXPLAIN, if estimated.
+        estimated_bytes: Result size estimate in bytes, if estimated.
+        full_scan: Whether EXPLAIN reported a full table scan, if estimated.
     """
     table: str
     sql: str
     columns: List[str] = field(default_factory=list)
+    condition: Optional[str] = None
+    pagination: Optional[KeysetPagination] = None
+    estimated_rows: Optional[int] = None
+    estimated_bytes: Optional[int] = None
+    full_scan: Optional[bool] = None
 
 
 @dataclass
@@ -51,6 +111,10 @@ class ConversionResult:
         target_table: Target table name.
         tables: List of all tables involved in the statement.
         where_condition: WHERE condition as SQL string.
+        sample_percent: Sampling rate from the SAMPLE clause.
+        limit: Per-table row cap from the LIMIT clause.
+        join_sql: Single LEFT JOIN query over all tables, set in join-plan mode
+            when the schema catalog connects the tables.
     """
     statement_type: str
     sql_list: Optional[List[GeneratedSQL]] = None
@@ -59,6 +123,9 @@ class ConversionResult:
     target_table: Optional[str] = None
     tables: List[str] = field(default_factory=list)
     where_condition: Optional[str] = None
+    sample_percent: Optional[float] = None
+    limit: Optional[int] = None
+    join_sql: Optional[GeneratedSQL] = None
 
     @property
     def is_train(self) -> bool:
@@ -74,17 +141,39 @@ class ConversionResult:
 
 
 class SQLGenerator:
-    """SQL generator for TLSQL statements."""
+    """SQL generator for TLSQL statements.
 
-    def __init__(self):
-        pass
+    Attributes:
+        schema: Schema catalog as returned by ``DatabaseExecutor.get_table_schema``,
+            mapping table name to a dict with ``primary_keys`` and ``foreign_keys``.
+        page_size: When set, every generated SELECT also gets a keyset
+            pagination plan with pages of at most this many rows.
+        dialect: Target SQL dialect for sampling, one of ``SUPPORTED_DIALECTS``.
+        join_plan: When True, TRAIN and VALIDATE results also carry a single
+            server-side join (``ConversionResult.join_sql``) as an alternative plan.
+    """
+
+    def __init__(self, schema: Optional[Dict[str, Dict]] = None, page_size: Optional[int] = None,
+                 dialect: str = 'mysql', join_plan: bool = False):
+        if page_size is not None and page_size <= 0:
+            raise GenerationError(f"page_size must be positive, got {page_size}")
+        if dialect not in SUPPORTED_DIALECTS:
+            raise GenerationError(
+                f"Unsupported dialect: {dialect}. "
+                f"Supported dialects: {', '.join(SUPPORTED_DIALECTS)}"
+            )
+        self.schema = schema or {}
+        self.page_size = page_size
+        self.dialect = dialect
+        self.join_plan = join_plan
 
     @classmethod
-    def convert(cls, tlsql: str) -> ConversionResult:
+    def convert(cls, tlsql: str, **options) -> ConversionResult:
         """Convert TLSQL statement to standard SQL.
 
         Args:
             tlsql: TLSQL statement string.
+            **options: Keyword arguments passed to the generator constructor.
 
         Returns:
             ConversionResult: Contains statement type, generated SQL statements (sql_list),
@@ -93,7 +182,7 @@ class SQLGenerator:
         """
         parser = Parser(tlsql)
         ast = parser.parse()
-        generator = cls()
+        generator = cls(**options)
         return generator.build(ast)
 
     def generate(self, statement: Statement):
@@ -153,7 +242,10 @@ class SQLGenerator:
             statement_type='TRAIN',
             sql_list=sql_list,
             tables=tables,
-            where_condition=where_condition
+            where_condition=where_condition,
+            sample_percent=train.sample.percent if train.sample else None,
+            limit=train.limit.count if train.limit else None,
+            join_sql=self.generate_join_sql(train) if self.join_plan else None
         )
 
     def _generate_validate_result(self, validate: ValidateStatement) -> ConversionResult:
@@ -171,7 +263,10 @@ class SQLGenerator:
             statement_type='VALIDATE',
             sql_list=sql_list,
             tables=tables,
-            where_condition=where_condition
+            where_condition=where_condition,
+            sample_percent=validate.sample.percent if validate.sample else None,
+            limit=validate.limit.count if validate.limit else None,
+            join_sql=self.generate_join_sql(validate) if self.join_plan else None
         )
 
     def _generate_predict_result(self, predict: PredictStatement) -> ConversionResult:
@@ -219,26 +314,150 @@ class SQLGenerator:
         if train.where:
             table_conditions = self._split_where_by_table(train.where)
 
+        limit = train.limit.count if train.limit else None
+        if limit is not None and self.page_size is not None:
+            raise GenerationError("LIMIT cannot be combined with keyset pagination")
+
+        sample_keys = {}
+        integer_key = False
+        if train.sample:
+            sample_keys = self._resolve_sample_keys(train.tables.tables)
+            anchor = train.tables.tables[0]
+            integer_key = self._is_integer_column(anchor, sample_keys.get(anchor))
+
         result = []
         for table in train.tables.tables:
             columns = table_columns.get(table, [])
             condition = table_conditions.get(table, None)
 
-            sql = self._build_select_sql(table, columns, condition)
+            table_sample = None
+            if train.sample and table in sample_keys:
+                sample_condition, table_sample = self._build_sample(
+                    train.sample, sample_keys[table], integer_key=integer_key
+                )
+                if sample_condition:
+                    condition = f"({condition}) AND {sample_condition}" if condition else sample_condition
+
+            sql = self._build_select_sql(table, columns, condition, limit=limit, table_sample=table_sample)
             result.append(GeneratedSQL(
                 table=table,
                 sql=sql,
-                columns=columns
+                columns=columns,
+                condition=condition,
+                pagination=self._build_pagination(table, columns, condition, table_sample=table_sample)
             ))
 
         return result
 
+    def generate_join_sql(self, train) -> Optional[GeneratedSQL]:
+        """Generate one LEFT JOIN query covering all tables of a TRAIN/VALIDATE statement.
+
+        The first table is the driving table and keeps its WHERE filter; other
+        tables are joined through foreign keys from the schema catalog with their
+        own filters in the ON clause, so the result can be split back into the
+        same per-table frames. Columns are aliased as ``table__column``.
+
+        Args:
+            train: TRAIN or VALIDATE statement.
+
+        The primary key of every table is always selected, so the rows of
+        each table can be told apart from NULL padding and join fan-out.
+
+        Returns:
+            GeneratedSQL for the join, or None when the tables cannot be joined
+            (single table, LIMIT, pagination, random sampling, missing wildcard
+            columns, a table without primary key or no foreign key path).
+        """
+        tables = train.tables.tables
+        if len(tables) < 2 or train.limit or self.page_size is not None:
+            return None
+
+        table_columns = self._group_columns_by_table(train.with_clause.selectors)
+        select_items = []
+        columns = []
+        for table in tables:
+            table_cols = table_columns.get(table, [])
+            if not table_cols or '*' in table_cols:
+                table_cols = list((self.schema.get(table) or {}).get('columns') or [])
+                if not table_cols:
+                    return None
+            primary_keys = self._get_primary_keys(table)
+            if not primary_keys:
+                return None
+            table_cols = table_cols + [col for col in primary_keys if col not in table_cols]
+            for col in table_cols:
+                alias = f"{table}{JOIN_ALIAS_SEPARATOR}{col}"
+                select_items.append(f"{table}.{col} AS {alias}")
+                columns.append(alias)
+
+        table_conditions = {}
+        if train.where:
+            table_conditions = self._split_where_by_table(train.where, include_table_prefix=True)
+
+        anchor = tables[0]
+        joined = [anchor]
+        remaining = list(tables[1:])
+        join_clauses = []
+        while remaining:
+            for table in remaining:
+                on_condition = self._find_join_condition(table, joined)
+                if on_condition:
+                    break
+            else:
+                return None
+
+            if table in table_conditions:
+                on_condition = f"{on_condition} AND ({table_conditions[table]})"
+            join_clauses.append(f"LEFT JOIN {table} ON {on_condition}")
+            joined.append(table)
+            remaining.remove(table)
+
+        condition = table_conditions.get(anchor)
+        if train.sample and train.sample.percent < 100:
+            # Independent random samples per table cannot be expressed on one join
+            sample_key = self._resolve_sample_keys(tables).get(anchor)
+            if sample_key is None:
+                return None
+            sample_condition, _ = self._build_sample(
+                train.sample, f"{anchor}.{sample_key}",
+                integer_key=self._is_integer_column(anchor, sample_key)
+            )
+            if sample_condition:
+                condition = f"({condition}) AND {sample_condition}" if condition else sample_condition
+
+        sql = f"SELECT {', '.join(select_items)} FROM {anchor} {' '.join(join_clauses)}"
+        if condition:
+            sql += f" WHERE {condition}"
+
+        return GeneratedSQL(
+            table=anchor,
+            sql=sql,
+            columns=columns,
+            condition=condition
+        )
+
+    def _find_join_condition(self, table: str, joined: List[str]) -> Optional[str]:
+        """Find a foreign key linking ``table`` to an already joined table."""
+        foreign_keys = (self.schema.get(table) or {}).get('foreign_keys') or {}
+        for fk_col, (ref_table, ref_col) in foreign_keys.items():
+            if ref_table in joined:
+                return f"{ref_table}.{ref_col} = {table}.{fk_col}"
+
+        for other in joined:
+            other_fks = (self.schema.get(other) or {}).get('foreign_keys') or {}
+            for fk_col, (ref_table, ref_col) in other_fks.items():
+                if ref_table == table:
+                    return f"{other}.{fk_col} = {table}.{ref_col}"
+        return None
+
     def generate_validate_sql(self, validate: ValidateStatement) -> List[GeneratedSQL]:
         """Generate SQL for VALIDATE."""
         train_stmt = TrainStatement(
             with_clause=validate.with_clause,
             tables=validate.tables,
-            where=validate.where
+            where=validate.where,
+            sample=validate.sample,
+            limit=validate.limit
         )
         return self.generate_train_sql(train_stmt)
 
@@ -251,7 +470,7 @@ class SQLGenerator:
             table_columns[selector.table].append(selector.column)
         return table_columns
 
-    def _split_where_by_table(self, where: WhereClause) -> Dict[str, str]:
+    def _split_where_by_table(self, where: WhereClause, include_table_prefix: bool = False) -> Dict[str, str]:
         """Split WHERE conditions per table."""
         conditions = self._extract_and_conditions(where.condition)
 
@@ -259,7 +478,7 @@ class SQLGenerator:
         for cond in conditions:
             table = self._extract_table_from_expr(cond)
             if table:
-                cond_str = self._expr_to_sql(cond, include_table_prefix=False)
+                cond_str = self._expr_to_sql(cond, include_table_prefix=include_table_prefix)
                 if table not in table_conditions:
                     table_conditions[table] = []
                 table_conditions[table].append(cond_str)
@@ -296,7 +515,8 @@ class SQLGenerator:
             return self._extract_table_from_expr(expr.column)
         return None
 
-    def _build_select_sql(self, table: str, columns: List[str], condition: Optional[str]) -> str:
+    def _build_select_sql(self, table: str, columns: List[str], condition: Optional[str],
+                          limit: Optional[int] = None, table_sample: Optional[str] = None) -> str:
         """Build SELECT statement."""
         if not columns or '*' in columns:
             select_clause = '*'
@@ -304,11 +524,145 @@ class SQLGenerator:
             select_clause = ', '.join(columns)
 
         sql = f"SELECT {select_clause} FROM {table}"
+        if table_sample:
+            sql += f" {table_sample}"
         if condition:
             sql += f" WHERE {condition}"
+        if limit is not None:
+            sql += f" LIMIT {limit}"
 
         return sql
 
+    def _resolve_sample_keys(self, tables: List[str]) -> Dict[str, Optional[str]]:
+        """Choose the column each table is sampled on.
+
+        The first table is the sampling anchor and is hashed on its primary key.
+        Tables with a foreign key to the anchor are hashed on that column with
+        the same bucket rule, so sampled anchor rows keep all their related rows.
+        Other tables are left unsampled to preserve referential integrity.
+        Without a single-column anchor key in the schema catalog, every table
+        falls back to independent random sampling (``None`` key).
+
+        Args:
+            tables: Tables of the statement, anchor first.
+
+        Returns:
+            Dict mapping sampled tables to their hash column, or None for random.
+        """
+        anchor = tables[0]
+        anchor_keys = self._get_primary_keys(anchor)
+        if len(anchor_keys) != 1:
+            return {table: None for table in tables}
+
+        anchor_key = anchor_keys[0]
+        sample_keys = {anchor: anchor_key}
+        for table in tables[1:]:
+            foreign_keys = (self.schema.get(table) or {}).get('foreign_keys') or {}
+            for fk_col, (ref_table, ref_col) in foreign_keys.items():
+                if ref_table == anchor and ref_col == anchor_key:
+                    sample_keys[table] = fk_col
+                    break
+        return sample_keys
+
+    def _is_integer_column(self, table: str, column: Optional[str]) -> bool:
+        """Whether the schema catalog declares a column with integer type."""
+        types = (self.schema.get(table) or {}).get('types') or {}
+        return column is not None and 'INT' in str(types.get(column, '')).upper()
+
+    def _build_sample(self, sample: SampleClause, key: Optional[str], integer_key: bool = False) -> tuple:
+        """Build dialect-specific sampling for one table.
+
+        Percentages below one hash bucket (0.01%) are rounded up to one bucket.
+        SQLite has no hash function: integer keys are hashed arithmetically and
+        other keys with ``CRC32``, which the executor's SQLite backend registers
+        on its connections.
+
+        Args:
+            sample: SAMPLE clause.
+            key: Column to hash on, or None for random sampling.
+            integer_key: Key is declared as an integer in the schema catalog.
+
+        Returns:
+            Tuple (condition, table_sample): a WHERE predicate and/or a
+            TABLESAMPLE clause placed after the table name.
+        """
+        if sample.percent >= 100:
+            return None, None
+
+        buckets = max(1, round(sample.percent * SAMPLE_BUCKETS / 100))
+        if key is not None:
+            if self.dialect == 'mysql':
+                hashed = f"CRC32({key})"
+            elif self.dialect == 'duckdb':
+                hashed = f"hash({key})"
+            elif self.dialect == 'postgresql':
+                hashed = f"abs(hashtext({key}::text))"
+            elif integer_key:
+                hashed = f"ABS({key} * 2654435761 % 4294967296)"
+            else:
+                hashed = f"CRC32({key})"
+            return f"{hashed} % {SAMPLE_BUCKETS} < {buckets}", None
+
+        percent = f"{sample.percent:g}"
+        if self.dialect == 'mysql':
+            return f"RAND() < {sample.percent / 100:g}", None
+        elif self.dialect == 'duckdb':
+            # Bernoulli sampling draws rows; the default system sampling draws whole vectors
+            return None, f"TABLESAMPLE {percent}% (bernoulli)"
+        elif self.dialect == 'postgresql':
+            return None, f"TABLESAMPLE BERNOULLI ({percent})"
+        return f"ABS(RANDOM()) % {SAMPLE_BUCKETS} < {buckets}", None
+
+    def _get_primary_keys(self, table: str) -> List[str]:
+        """Look up primary key columns of a table in the schema catalog."""
+        table_schema = self.schema.get(table) or {}
+        return list(table_schema.get('primary_keys') or [])
+
+    def _build_pagination(self, table: str, columns: List[str], condition: Optional[str],
+                          table_sample: Optional[str] = None) -> Optional[KeysetPagination]:
+        """Build keyset pagination plan when paging is enabled.
+
+        Key columns missing from an explicit column list are added to the page
+        SELECT, because the next page is resumed from their values.
+
+        Raises:
+            GenerationError: Table has no primary key in the schema catalog.
+        """
+        if self.page_size is None:
+            return None
+
+        key_columns = self._get_primary_keys(table)
+        if not key_columns:
+            raise GenerationError(
+                f"Keyset pagination requires a primary key for table '{table}'"
+            )
+
+        page_columns = list(columns)
+        if page_columns and '*' not in page_columns:
+            page_columns += [col for col in key_columns if col not in page_columns]
+
+        if len(key_columns) == 1:
+            key_expr = key_columns[0]
+            last_expr = ':last_0'
+        else:
+            key_expr = f"({', '.join(key_columns)})"
+            last_expr = f"({', '.join(f':last_{i}' for i in range(len(key_columns)))})"
+        order_clause = f" ORDER BY {', '.join(key_columns)} LIMIT :n"
+
+        first_sql = self._build_select_sql(table, page_columns, condition, table_sample=table_sample) + order_clause
+
+        next_condition = f"{key_expr} > {last_expr}"
+        if condition:
+            next_condition = f"({condition}) AND {next_condition}"
+        next_sql = self._build_select_sql(table, page_columns, next_condition, table_sample=table_sample) + order_clause
+
+        return KeysetPagination(
+            key_columns=key_columns,
+            page_size=self.page_size,
+            first_sql=first_sql,
+            next_sql=next_sql
+        )
+
     def generate_predict_sql(self, predict: PredictStatement) -> List[GeneratedSQL]:
         """Generate SQL statements for PREDICT statement.
 
@@ -341,7 +695,9 @@ class SQLGenerator:
         return [GeneratedSQL(
             table=table,
             sql=sql,
-            columns=['*']
+            columns=['*'],
+            condition=where_condition,
+            pagination=self._build_pagination(table, ['*'], where_condition)
         )]
 
     def _expr_to_sql(self, expr: Expr, include_table_prefix: bool = True) -> str:
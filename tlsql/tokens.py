@@ -20,6 +20,9 @@ class TokenType(Enum):
     TABLES = auto()
     FROM = auto()
     WHERE = auto()
+    SAMPLE = auto()
+    PERCENT = auto()
+    LIMIT = auto()
 
     # Task Types
     CLF = auto()
@@ -73,6 +76,9 @@ KEYWORDS = {
     'TABLES': TokenType.TABLES,
     'FROM': TokenType.FROM,
     'WHERE': TokenType.WHERE,
+    'SAMPLE': TokenType.SAMPLE,
+    'PERCENT': TokenType.PERCENT,
+    'LIMIT': TokenType.LIMIT,
 
     # Task Types
     'CLF': TokenType.CLF,
@@ -86,6 +92,10 @@ KEYWORDS = {
     'IN': TokenType.IN,
 }
 
+# Keywords that only open a clause; after ``table.`` they are column names,
+# so existing columns such as users.sample keep parsing
+CLAUSE_KEYWORDS = {TokenType.SAMPLE, TokenType.PERCENT, TokenType.LIMIT}
+
 
 @dataclass
 class Token: